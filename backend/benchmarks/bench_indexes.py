@@ -0,0 +1,164 @@
+"""
+Index usage and speed-up for the query indexes in migrations/006_query_indexes.sql.
+
+Each case runs the real service query against a seeded database, captures the
+SQL it sends, and checks the plan (EXPLAIN QUERY PLAN on SQLite, EXPLAIN on
+PostgreSQL) uses the expected index. The captured statement is then timed on
+the raw DBAPI cursor with the index in place and again after dropping it.
+Exits non-zero when an index is not used.
+
+    python -m benchmarks.bench_indexes --leads 100000 --telemetry 1000000
+    python -m benchmarks.bench_indexes --database-url postgresql://localhost/portfolio_bench --no-seed
+"""
+import argparse
+import os
+import sys
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import Engine, create_engine, event, func
+from sqlalchemy.orm import Session
+
+import benchmarks.common as common
+import models
+from benchmarks.seed import seed_all
+from services.lead_service import (
+    count_unread_leads,
+    filter_leads_by_date,
+    get_filtered_leads,
+    get_lead_by_idempotency_key,
+    get_source_breakdown,
+)
+
+
+def _live_visitors(db: Session) -> int:
+    # Same query as routes/analytics.py get_live_visitors
+    cutoff = datetime.now(timezone.utc) - timedelta(minutes=15)
+    return (
+        db.query(func.count(func.distinct(models.TelemetryEventModel.session_id)))
+        .filter(models.TelemetryEventModel.created_at >= cutoff)
+        .scalar()
+    )
+
+
+def _date_window(db: Session) -> list:
+    end = datetime.now(timezone.utc).replace(tzinfo=None)
+    return filter_leads_by_date(db, (end - timedelta(days=2)).isoformat(" "), end.isoformat(" "))
+
+
+@dataclass
+class IndexCase:
+    query: str
+    index: str
+    run: Callable[[Session], object]
+
+
+CASES: tuple[IndexCase, ...] = (
+    IndexCase("get_filtered_leads(status)", "idx_contact_leads_status_created_at",
+              lambda db: get_filtered_leads(db, status="processing")),
+    IndexCase("get_filtered_leads(priority, min_score)", "idx_contact_leads_priority_quality_score",
+              lambda db: get_filtered_leads(db, priority="urgent", min_score=0.8)),
+    IndexCase("count_unread_leads", "idx_contact_leads_status_created_at", count_unread_leads),
+    IndexCase("get_lead_by_idempotency_key", "idx_contact_leads_idempotency_key_present",
+              lambda db: get_lead_by_idempotency_key(db, "0" * 64)),
+    IndexCase("get_source_breakdown", "idx_contact_leads_source", get_source_breakdown),
+    IndexCase("filter_leads_by_date", "idx_contact_leads_timestamp", _date_window),
+    IndexCase("live visitors", "idx_telemetry_events_created_at_session_id", _live_visitors),
+)
+
+
+def capture_query(engine: Engine, case: IndexCase) -> tuple[str, object]:
+    """Run the case's service call and return the last SELECT it executed."""
+    captured: list[tuple[str, object]] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            captured.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        with Session(engine) as db:
+            case.run(db)
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+    return captured[-1]
+
+
+def _raw_execute(engine: Engine, sql: str, parameters) -> list:
+    raw = engine.raw_connection()
+    try:
+        cursor = raw.cursor()
+        cursor.execute(sql, parameters)
+        rows = cursor.fetchall()
+        cursor.close()
+        return rows
+    finally:
+        raw.close()
+
+
+def explain(engine: Engine, statement: str, parameters) -> str:
+    prefix = "EXPLAIN QUERY PLAN " if engine.dialect.name == "sqlite" else "EXPLAIN "
+    rows = _raw_execute(engine, prefix + statement, parameters)
+    return "\n".join(" | ".join(str(col) for col in row) for row in rows)
+
+
+def uses_index(engine: Engine, case: IndexCase) -> tuple[bool, str]:
+    plan = explain(engine, *capture_query(engine, case))
+    return case.index in plan, plan
+
+
+def _timed(engine: Engine, statement: str, parameters, repeat: int) -> float:
+    return common.best_of(lambda: _raw_execute(engine, statement, parameters), repeat=repeat)
+
+
+def _analyze(engine: Engine) -> None:
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        conn.exec_driver_sql("ANALYZE")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--database-url", default=os.environ["DATABASE_URL"])
+    parser.add_argument("--leads", type=int, default=100_000)
+    parser.add_argument("--telemetry", type=int, default=1_000_000)
+    parser.add_argument("--no-seed", action="store_true", help="reuse the existing dataset")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--verbose", action="store_true", help="print every query plan")
+    args = parser.parse_args()
+
+    engine = create_engine(args.database_url)
+    if not args.no_seed:
+        print(f"Seeding {args.leads:,} leads and {args.telemetry:,} telemetry events ...")
+        seed_all(engine, args.leads, args.telemetry, projects=40)
+    _analyze(engine)
+
+    indexes = {index.name: index for table in models.Base.metadata.tables.values() for index in table.indexes}
+    failures = 0
+    print(f"\n{'query':<40} {'index':<44} {'used':>4} {'with':>10} {'without':>10} {'speed-up':>9}")
+    for case in CASES:
+        statement, parameters = capture_query(engine, case)
+        plan = explain(engine, statement, parameters)
+        used = case.index in plan
+        failures += not used
+        with_index = _timed(engine, statement, parameters, args.repeat)
+
+        index = indexes[case.index]
+        index.drop(bind=engine)
+        try:
+            _analyze(engine)
+            without_index = _timed(engine, statement, parameters, args.repeat)
+        finally:
+            index.create(bind=engine)
+            _analyze(engine)
+
+        print(f"{case.query:<40} {case.index:<44} {'yes' if used else 'NO':>4} {with_index * 1000:8.2f}ms "
+              f"{without_index * 1000:8.2f}ms {without_index / with_index:8.1f}x")
+        if args.verbose or not used:
+            print("    " + plan.replace("\n", "\n    "))
+
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Response encoding over realistic project and lead payloads:
+
+  stdlib      jsonable_encoder + JSONResponse (FastAPI's previous default)
+  default     jsonable_encoder + FastJSONResponse (routes returning dicts)
+  direct      FastJSONResponse only (routes returning a response object)
+
+    python -m benchmarks.bench_json_encoding --projects 40 --leads 5000
+"""
+import argparse
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+import benchmarks.common as common  # sets placeholder env before config is imported
+import models
+from services.project_service import _DB_TO_API
+from utils.responses import FastJSONResponse
+
+_PROJECT_LIST_FIELDS = (
+    "tags", "objectives", "technologies", "methods", "results", "keyImpactMetrics",
+    "coreStack", "tools", "implementation", "discussion", "conclusion", "limitations",
+    "futureWork", "references", "acknowledgements", "challenges", "solutions", "galleryImages",
+)
+
+
+def _project(i: int, now: datetime) -> dict:
+    """A project dict shaped like DatabaseProjectRepository output, with native values."""
+    project = {key: f"{key} text for project {i}. " * 6 for key in _DB_TO_API.values()}
+    for key in _PROJECT_LIST_FIELDS:
+        project[key] = [f"{key} item {n} for project {i}" for n in range(12)]
+    project.update({
+        "id": i,
+        "category": models.ProjectCategoryEnum.DATA_SCIENCE,
+        "similarProjectIds": [i + 1, i + 2, i + 3],
+        "created_at": now - timedelta(days=i),
+        "updated_at": now,
+    })
+    return project
+
+
+def _lead(i: int, now: datetime) -> dict:
+    """A lead dict shaped like serialize_contact_lead output, with native values."""
+    return {
+        "id": i, "name": f"Lead {i}", "email": f"lead{i}@example.com", "subject": "Hiring",
+        "company": "Acme", "role": "recruiter", "message": "We would like to talk about an ML role. " * 4,
+        "lead_type": models.LeadType.CONTACT, "created_at": now - timedelta(minutes=i),
+        "updated_at": now, "timestamp": now - timedelta(minutes=i), "flagged": False,
+        "status": models.LeadStatus.UNREAD, "priority": models.Priority.MEDIUM,
+        "quality_score": Decimal("0.725"), "internal_notes": "", "last_contacted": None,
+        "follow_up_date": None, "contact_history": [], "tags": ["ml", "hiring"],
+        "source": "contact_form", "metadata": {"ip_address": "203.0.113.7", "user_agent": "Mozilla/5.0"},
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--projects", type=int, default=40)
+    parser.add_argument("--leads", type=int, default=5_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    now = datetime(2025, 6, 1, 12, 0, 0)
+    payloads = {
+        f"{args.projects} projects": [_project(i, now) for i in range(args.projects)],
+        f"{args.leads} leads": [_lead(i, now) for i in range(args.leads)],
+    }
+    encoders = {
+        "stdlib": lambda data: JSONResponse(jsonable_encoder(data)).body,
+        "default": lambda data: FastJSONResponse(jsonable_encoder(data)).body,
+        "direct": lambda data: FastJSONResponse(data).body,
+    }
+
+    for label, data in payloads.items():
+        size = len(encoders["direct"](data))
+        print(f"{label} ({size / 1024:,.0f} KiB), best of {args.repeat}")
+        baseline = None
+        for name, encode in encoders.items():
+            seconds = common.best_of(lambda: encode(data), args.repeat)
+            baseline = baseline or seconds
+            print(f"  {name:<8} {seconds * 1000:8.2f} ms  {baseline / seconds:5.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Lead list serialization: ORM entities + serialize_contact_lead + jsonable_encoder
++ json.dumps (the old path) vs. column tuples + serialize_contact_lead_row +
+orjson (the path used by get_all_leads and the export).
+
+    python -m benchmarks.bench_lead_serialization --rows 20000
+"""
+import argparse
+import json
+from datetime import datetime, timedelta, timezone
+
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import Session
+
+import benchmarks.common as common  # sets placeholder env before config is imported
+import models
+from utils.responses import dump_json
+from utils.serializers import (
+    CONTACT_LEAD_COLUMNS,
+    serialize_contact_lead,
+    serialize_contact_lead_row,
+)
+
+
+def _seed(session: Session, rows: int) -> None:
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    session.execute(insert(models.ContactLead), [
+        {
+            "name": f"Lead {i}",
+            "email": f"lead{i}@example.com",
+            "company": "Acme",
+            "subject": "Hiring",
+            "message": "We would like to talk about an ML role. " * 4,
+            "lead_type": models.LeadType.CONTACT,
+            "status": models.LeadStatus.UNREAD,
+            "priority": models.Priority.MEDIUM,
+            "metadata_json": {"ip_address": "203.0.113.7", "user_agent": "Mozilla/5.0"},
+            "role": "recruiter",
+            "quality_score": 0.7,
+            "internal_notes": "",
+            "tags": ["ml", "hiring"],
+            "contact_history": [],
+            "source": "contact_form",
+            "created_at": now - timedelta(minutes=i),
+            "updated_at": now,
+            "timestamp": now - timedelta(minutes=i),
+        }
+        for i in range(rows)
+    ])
+    session.commit()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    engine = create_engine("sqlite://")
+    models.ContactLead.__table__.create(engine)
+    order = models.ContactLead.created_at.desc()
+
+    with Session(engine) as session:
+        _seed(session, args.rows)
+
+        def orm_path() -> bytes:
+            session.expunge_all()
+            leads = session.query(models.ContactLead).order_by(order).all()
+            payload = jsonable_encoder([serialize_contact_lead(lead) for lead in leads])
+            return json.dumps(payload).encode()
+
+        def tuple_path() -> bytes:
+            rows = session.query(*CONTACT_LEAD_COLUMNS).order_by(order).all()
+            return dump_json([serialize_contact_lead_row(row) for row in rows])
+
+        assert json.loads(orm_path()) == json.loads(tuple_path())
+
+        print(f"{args.rows} leads, best of {args.repeat}")
+        for label, fn in (("orm + jsonable_encoder", orm_path), ("column tuples + orjson", tuple_path)):
+            seconds = common.best_of(fn, args.repeat)
+            print(f"  {label:<24} {seconds * 1000:8.1f} ms  {args.rows / seconds:>12,.0f} rows/s")
+
+
+if __name__ == "__main__":
+    main()
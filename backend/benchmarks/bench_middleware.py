@@ -0,0 +1,101 @@
+"""
+Per-request middleware overhead on GET /api/hello, driven as raw ASGI calls
+(no sockets) so only the app stack is measured:
+
+  before  SlowAPIMiddleware + CORS + @app.middleware("http") security headers
+  after   SlowAPIASGIMiddleware + CORS + SecurityHeadersMiddleware
+
+    python -m benchmarks.bench_middleware --requests 5000
+"""
+import argparse
+import asyncio
+import time
+
+from fastapi import FastAPI, Request
+from fastapi.middleware.cors import CORSMiddleware
+from slowapi.middleware import SlowAPIASGIMiddleware, SlowAPIMiddleware
+
+import benchmarks.common  # noqa: F401  (sets placeholder env before config is imported)
+from middleware.security_headers import SecurityHeadersMiddleware
+from routes import health
+from services.rate_limiter import limiter
+from utils.responses import FastJSONResponse
+
+
+def _base_app() -> FastAPI:
+    app = FastAPI(default_response_class=FastJSONResponse)
+    app.state.limiter = limiter
+    app.include_router(health.router)
+    return app
+
+
+def _add_cors(app: FastAPI) -> None:
+    app.add_middleware(CORSMiddleware, allow_origins=["https://arpitkumar.dev"], allow_credentials=True)
+
+
+def before_app() -> FastAPI:
+    app = _base_app()
+    app.add_middleware(SlowAPIMiddleware)
+    _add_cors(app)
+
+    @app.middleware("http")
+    async def add_security_headers(request: Request, call_next):
+        response = await call_next(request)
+        response.headers["Strict-Transport-Security"] = "max-age=31536000; includeSubDomains"
+        response.headers["X-Content-Type-Options"] = "nosniff"
+        response.headers["X-Frame-Options"] = "DENY"
+        response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
+        response.headers["Permissions-Policy"] = "camera=(), microphone=(), geolocation=()"
+        return response
+
+    return app
+
+
+def after_app() -> FastAPI:
+    app = _base_app()
+    app.add_middleware(SlowAPIASGIMiddleware)
+    _add_cors(app)
+    app.add_middleware(SecurityHeadersMiddleware)
+    return app
+
+
+async def _drive(app: FastAPI, requests: int) -> float:
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET",
+        "scheme": "http", "path": "/api/hello", "raw_path": b"/api/hello", "root_path": "",
+        "query_string": b"", "headers": [(b"host", b"localhost")],
+        "client": ("127.0.0.1", 50000), "server": ("localhost", 8000),
+    }
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        pass
+
+    for _ in range(200):  # warm up routing/middleware stack build
+        await app(dict(scope), receive, send)
+    start = time.perf_counter()
+    for _ in range(requests):
+        await app(dict(scope), receive, send)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=5_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"GET /api/hello x {args.requests}, best of {args.repeat}")
+    results = {}
+    for label, factory in (("before", before_app), ("after", after_app)):
+        app = factory()
+        seconds = min(asyncio.run(_drive(app, args.requests)) for _ in range(args.repeat))
+        results[label] = seconds / args.requests * 1e6
+        print(f"  {label:<7} {results[label]:8.1f} us/request  {args.requests / seconds:>10,.0f} req/s")
+    print(f"  saved   {results['before'] - results['after']:8.1f} us/request")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,25 @@
+"""
+Shared setup for the standalone benchmark scripts.
+
+Run from backend/, e.g. `python -m benchmarks.bench_lead_serialization`.
+Scripts only need placeholder secrets; each one builds its own engine.
+"""
+import os
+import time
+from collections.abc import Callable
+
+os.environ.setdefault("DATABASE_URL", "sqlite:///./bench.db")
+os.environ.setdefault("JWT_SECRET_KEY", "bench-secret-key-not-for-production")
+os.environ.setdefault("ADMIN_SECRET_KEY", "bench-admin-key")
+os.environ.setdefault("RESEND_API_KEY", "re_bench_fake_key")
+
+
+def best_of(fn: Callable[[], object], repeat: int = 5) -> float:
+    """Run `fn` `repeat` times and return the fastest wall time in seconds."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
@@ -0,0 +1,282 @@
+"""
+Load test for the hot API endpoints against a seeded database.
+
+Boots the full app in-process (httpx ASGITransport: every middleware and
+dependency runs, no sockets), seeds the database from `benchmarks.seed`, and
+writes latency percentiles and throughput per endpoint to a JSON file that
+can be diffed across commits:
+
+    python -m benchmarks.load_test --label baseline
+    python -m benchmarks.load_test --label my-branch --compare benchmarks/results/baseline.json
+
+The database is DATABASE_URL (default: sqlite:///./bench.db). Seeding drops
+and recreates every table, so it only runs for SQLite unless --seed is given;
+use --no-seed to reuse an existing dataset. --base-url drives a running
+server instead (rate limits and real email delivery then apply there).
+"""
+import argparse
+import asyncio
+import itertools
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import time
+from collections import Counter
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+
+import httpx
+
+import benchmarks.common  # noqa: F401  (sets placeholder env before config is imported)
+
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+
+
+@dataclass
+class Scenario:
+    """One endpoint under load. `build(i)` returns httpx request kwargs for call `i`."""
+    name: str
+    method: str
+    path: str
+    build: Callable[[int], dict]
+    admin: bool = False
+    weight: float = 1.0  # fraction of --requests (exports are expensive)
+
+
+def _scenarios(projects: int, rng: random.Random) -> list[Scenario]:
+    run_id = f"{time.time_ns():x}"
+
+    def contact_form(i: int) -> dict:
+        return {
+            "data": {
+                "name": "Load Test",
+                "email": f"loadtest.{run_id}.{i}@gmail.com",  # allowlisted domain: no DNS lookup
+                "subject": "Benchmark inquiry",
+                "message": f"Load test submission {run_id}-{i} checking the contact pipeline end to end.",
+                "formType": "contacts",
+                "role": "user",
+            },
+            "headers": {"X-Forwarded-For": f"198.51.{i // 256 % 256}.{i % 256}"},
+        }
+
+    return [
+        Scenario("projects_list", "GET", "/api/projects", lambda i: {}),
+        Scenario("project_detail", "GET", "/api/projects/{id}",
+                 lambda i: {"path": f"/api/projects/{rng.randint(1, max(projects, 1))}"}),
+        Scenario("telemetry_event", "POST", "/api/telemetry/event", lambda i: {
+            "json": {"session_id": f"bench-{i % 500}", "event_type": "pageview",
+                     "path": rng.choice(("/", "/projects", "/about")), "meta_data": {"referrer": "bench"}},
+        }),
+        Scenario("submit_contact", "POST", "/api/submit-contact", contact_form),
+        Scenario("admin_leads_page", "GET", "/api/admin/leads",
+                 lambda i: {"params": {"page": rng.randint(1, 20), "per_page": 50}}, admin=True),
+        Scenario("admin_leads_stats", "GET", "/api/admin/leads/stats", lambda i: {}, admin=True),
+        Scenario("admin_leads_export_csv", "GET", "/api/admin/leads/export",
+                 lambda i: {"params": {"format": "csv"}}, admin=True, weight=0.05),
+        Scenario("admin_leads_export_json", "GET", "/api/admin/leads/export",
+                 lambda i: {"params": {"format": "json"}}, admin=True, weight=0.05),
+    ]
+
+
+# ============= Measurement =============
+
+def percentile(samples: list[float], pct: float) -> float:
+    """Linear-interpolated percentile of `samples` (0 < pct < 100)."""
+    ordered = sorted(samples)
+    if len(ordered) == 1:
+        return ordered[0]
+    rank = (len(ordered) - 1) * pct / 100
+    low = int(rank)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+async def _run_scenario(client: httpx.AsyncClient, scenario: Scenario, requests: int,
+                        concurrency: int, headers: dict) -> dict:
+    latencies: list[float] = []
+    statuses: Counter = Counter()
+    counter = itertools.count()
+
+    async def worker():
+        while (i := next(counter)) < requests:
+            kwargs = scenario.build(i)
+            path = kwargs.pop("path", scenario.path)
+            kwargs["headers"] = {**headers, **kwargs.get("headers", {})}
+            start = time.perf_counter()
+            try:
+                response = await client.request(scenario.method, path, **kwargs)
+                await response.aread()
+                statuses[response.status_code] += 1
+            except httpx.HTTPError as exc:
+                statuses[type(exc).__name__] += 1
+                continue
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(min(concurrency, requests))))
+    wall = time.perf_counter() - start
+
+    ok = sum(n for status, n in statuses.items() if isinstance(status, int) and status < 400)
+    ms = [s * 1000 for s in latencies] or [0.0]
+    return {
+        "method": scenario.method,
+        "path": scenario.path,
+        "requests": requests,
+        "errors": requests - ok,
+        "status_codes": {str(status): n for status, n in sorted(statuses.items(), key=str)},
+        "p50_ms": round(percentile(ms, 50), 3),
+        "p95_ms": round(percentile(ms, 95), 3),
+        "p99_ms": round(percentile(ms, 99), 3),
+        "mean_ms": round(statistics.fmean(ms), 3),
+        "max_ms": round(max(ms), 3),
+        "rps": round(ok / wall, 1) if wall else 0.0,
+    }
+
+
+# ============= App / Environment =============
+
+def _boot_app(database_url: str, seed: bool, args) -> tuple[object, dict]:
+    """Import the app against `database_url`, optionally seed it. Returns (app, dataset info)."""
+    os.environ["DATABASE_URL"] = database_url
+    import database
+    from benchmarks.seed import seed_all, table_counts
+
+    if database.engine.dialect.name == "sqlite":
+        from sqlalchemy import event
+
+        # WAL lets readers proceed during the write scenarios, as PostgreSQL MVCC would
+        @event.listens_for(database.engine, "connect")
+        def _sqlite_pragmas(dbapi_connection, _record):
+            dbapi_connection.execute("PRAGMA journal_mode=WAL")
+            dbapi_connection.execute("PRAGMA synchronous=NORMAL")
+
+    seed_seconds = None
+    if seed:
+        print(f"Seeding {args.leads:,} leads, {args.telemetry:,} telemetry events, {args.projects} projects ...")
+        start = time.perf_counter()
+        seed_all(database.engine, args.leads, args.telemetry, args.projects)
+        seed_seconds = round(time.perf_counter() - start, 1)
+
+    import resend
+
+    from main import app
+    from services.rate_limiter import limiter
+
+    # Measure the handlers, not the limiter's 429s or the email provider
+    limiter.enabled = False
+    resend.Emails.send = staticmethod(lambda payload: {"id": "benchmark"})
+
+    dataset = {"dialect": database.engine.dialect.name, "seed_seconds": seed_seconds,
+               **table_counts(database.engine)}
+    return app, dataset
+
+
+def _git_info() -> dict:
+    def git(*cmd: str) -> str:
+        try:
+            return subprocess.run(("git", *cmd), capture_output=True, text=True, check=True).stdout.strip()
+        except (OSError, subprocess.CalledProcessError):
+            return ""
+    return {"commit": git("rev-parse", "HEAD"), "branch": git("rev-parse", "--abbrev-ref", "HEAD"),
+            "dirty": bool(git("status", "--porcelain", "--untracked-files=no"))}
+
+
+async def _admin_token(client: httpx.AsyncClient) -> str:
+    response = await client.post("/api/admin/login", data={"password": os.environ["ADMIN_SECRET_KEY"]})
+    response.raise_for_status()
+    return response.json()["access_token"]
+
+
+async def _run(args, app, projects: int) -> dict:
+    if app is not None:
+        transport = httpx.ASGITransport(app=app, client=("127.0.0.1", 50000))
+        client = httpx.AsyncClient(transport=transport, base_url="http://bench.local", timeout=60)
+    else:
+        client = httpx.AsyncClient(base_url=args.base_url, timeout=60)
+
+    rng = random.Random(args.random_seed)
+    results = {}
+    async with client:
+        admin_headers = {"Authorization": f"Bearer {await _admin_token(client)}"}
+        for scenario in _scenarios(projects, rng):
+            if args.only and scenario.name not in args.only:
+                continue
+            headers = admin_headers if scenario.admin else {}
+            requests = max(1, int(args.requests * scenario.weight))
+            await _run_scenario(client, scenario, max(1, requests // 10), args.concurrency, headers)  # warm-up
+            result = await _run_scenario(client, scenario, requests, args.concurrency, headers)
+            results[scenario.name] = result
+            print(f"  {scenario.name:<24} p50 {result['p50_ms']:8.2f} ms  p95 {result['p95_ms']:8.2f} ms  "
+                  f"p99 {result['p99_ms']:8.2f} ms  {result['rps']:8.1f} req/s  errors {result['errors']}")
+    return results
+
+
+def _compare(current: dict, baseline_path: Path) -> None:
+    baseline = json.loads(baseline_path.read_text(encoding="utf-8"))
+    print(f"\nvs {baseline['label']} ({baseline['git']['commit'][:10] or 'unknown'})")
+    for name, result in current["endpoints"].items():
+        before = baseline["endpoints"].get(name)
+        if before is None:
+            continue
+        deltas = []
+        for key in ("p50_ms", "p95_ms", "p99_ms", "rps"):
+            if before[key]:
+                deltas.append(f"{key} {(result[key] - before[key]) / before[key] * 100:+6.1f}%")
+        print(f"  {name:<24} " + "  ".join(deltas))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--label", default=datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ"))
+    parser.add_argument("--database-url", default=os.environ["DATABASE_URL"])
+    parser.add_argument("--base-url", help="benchmark a running server instead of the in-process app")
+    parser.add_argument("--leads", type=int, default=100_000)
+    parser.add_argument("--telemetry", type=int, default=1_000_000)
+    parser.add_argument("--projects", type=int, default=40)
+    parser.add_argument("--seed", dest="seed", action="store_true", default=None,
+                        help="(re)create and seed the database (default: only for SQLite)")
+    parser.add_argument("--no-seed", dest="seed", action="store_false")
+    parser.add_argument("--requests", type=int, default=500, help="requests per endpoint")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--only", nargs="*", help="scenario names to run")
+    parser.add_argument("--random-seed", type=int, default=7)
+    parser.add_argument("--output", type=Path, help="default: benchmarks/results/<label>.json")
+    parser.add_argument("--compare", type=Path, help="earlier results file to diff against")
+    args = parser.parse_args()
+
+    app, dataset = None, {"dialect": "remote"}
+    if args.base_url is None:
+        seed = args.seed if args.seed is not None else args.database_url.startswith("sqlite")
+        app, dataset = _boot_app(args.database_url, seed, args)
+    projects = dataset.get("projects", args.projects)
+
+    print(f"{args.requests} requests/endpoint, concurrency {args.concurrency}, {dataset}")
+    endpoints = asyncio.run(_run(args, app, projects))
+
+    report = {
+        "label": args.label,
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "git": _git_info(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "target": args.base_url or "in-process",
+        "dataset": dataset,
+        "settings": {"requests": args.requests, "concurrency": args.concurrency,
+                     "rate_limiting": args.base_url is not None},
+        "endpoints": endpoints,
+    }
+    output = args.output or RESULTS_DIR / f"{args.label}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+    print(f"\nWrote {output}")
+    if args.compare:
+        _compare(report, args.compare)
+
+
+if __name__ == "__main__":
+    main()
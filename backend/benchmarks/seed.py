@@ -0,0 +1,414 @@
+"""
+Synthetic dataset generator: contact leads, telemetry sessions and projects.
+
+Generation and loading are separate so each can be profiled on its own:
+
+  - `lead_rows`, `telemetry_rows` and `project_rows` yield column dicts from a
+    seeded RNG, so the same arguments always produce the same dataset.
+    Leads age through the status lifecycle, telemetry is emitted per visitor
+    session following the site's pageview funnel, and projects carry
+    long-form JSONB sections (implementation, discussion, references, ...)
+    that load into project_details.
+  - `bulk_load` streams rows with COPY FROM STDIN on PostgreSQL and with
+    batched executemany on a single pre-compiled INSERT elsewhere. Both skip
+    the ORM and SQLAlchemy's per-row bind processing.
+
+    python -m benchmarks.seed --leads 100000 --telemetry 1000000 --projects 40
+    python -m benchmarks.seed --database-url postgresql://localhost/portfolio_bench --telemetry 5000000
+"""
+import argparse
+import io
+import itertools
+import os
+import random
+import time
+from collections.abc import Callable, Iterable, Iterator
+from datetime import datetime, timedelta, timezone
+
+import orjson
+from sqlalchemy import JSON, DateTime, Engine, Table, create_engine, func, insert, select
+from sqlalchemy import Enum as SAEnum
+
+import benchmarks.common  # noqa: F401  (sets placeholder env before config is imported)
+import models
+
+BATCH_SIZE = 10_000
+
+_FIRST_NAMES = ("Aarav", "Priya", "Liam", "Sofia", "Chen", "Fatima", "Noah", "Ana", "Kenji", "Maya")
+_LAST_NAMES = ("Sharma", "Patel", "Smith", "Garcia", "Wang", "Khan", "Müller", "Silva", "Tanaka", "Cohen")
+_EMAIL_DOMAINS = ("gmail.com", "gmail.com", "outlook.com", "yahoo.com", "iitkgp.ac.in", "acme-analytics.com")
+_COMPANIES = ("", "", "Acme Analytics", "Globex", "Initech", "Umbrella Labs", "Stark Data", "Wayne Research")
+_ROLES = ("user", "user", "student", "recruiter", "developer", "researcher")
+_SUBJECTS = (
+    "Internship opportunity", "Collaboration on an ML project", "Question about your portfolio",
+    "Data science role", "Consulting request", "Feedback on your article",
+)
+_SOURCES = ("contact_form",) * 6 + ("linkedin", "linkedin", "referral", "cv_request")
+_TAGS = ("ml", "hiring", "research", "freelance", "follow-up", "internship", "priority-client")
+_REFERRERS = ("", "", "https://www.google.com/", "https://www.linkedin.com/", "https://github.com/")
+_USER_AGENTS = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 Chrome/126.0 Safari/537.36",
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 14_5) AppleWebKit/605.1.15 Version/17.5 Safari/605.1.15",
+    "Mozilla/5.0 (iPhone; CPU iPhone OS 17_5 like Mac OS X) AppleWebKit/605.1.15 Mobile/15E148",
+    "Mozilla/5.0 (X11; Linux x86_64; rv:127.0) Gecko/20100101 Firefox/127.0",
+)
+_TECHNOLOGIES = (
+    "Python", "FastAPI", "PyTorch", "scikit-learn", "PostgreSQL", "React", "TypeScript", "Docker",
+    "Pandas", "XGBoost", "Kubernetes", "Redis", "Aspen Plus", "TensorFlow",
+)
+_SENTENCE = (
+    "The pipeline ingests raw measurements, validates them against the schema and materialises "
+    "features for downstream models while tracking lineage for every transformation. "
+)
+
+# Pageview funnel: (path, event_type, probability the visitor continues to this step)
+_FUNNEL = (
+    ("/", "pageview", 1.0),
+    ("/projects", "pageview", 0.55),
+    ("/projects/{id}", "pageview", 0.6),
+    ("/projects/{id}", "click", 0.35),
+    ("/about", "pageview", 0.4),
+    ("/contact", "pageview", 0.3),
+    ("/contact", "lead_submit", 0.25),
+)
+_CV_REQUEST_RATE = 0.03
+
+
+def _recent_bias(rng: random.Random, now: datetime, mean_days: float) -> datetime:
+    """Timestamp before `now`, exponentially weighted towards the present."""
+    return now - timedelta(seconds=int(rng.expovariate(1 / (mean_days * 86400))))
+
+
+# ============= Row Generators =============
+
+def lead_rows(count: int, rng: random.Random, now: datetime) -> Iterator[dict]:
+    """ContactLead rows. Older leads have mostly been contacted or archived."""
+    lead_types = (models.LeadType.CONTACT,) * 8 + (models.LeadType.CV_REQUEST, models.LeadType.COLLABORATION)
+    priorities = (models.Priority.LOW, models.Priority.MEDIUM, models.Priority.HIGH, models.Priority.URGENT)
+    for i in range(count):
+        first, last = rng.choice(_FIRST_NAMES), rng.choice(_LAST_NAMES)
+        created = _recent_bias(rng, now, mean_days=120)
+        age_days = (now - created).days
+        if age_days < 2:
+            status = rng.choice((models.LeadStatus.UNREAD,) * 4 + (models.LeadStatus.PROCESSING,))
+        elif age_days < 30:
+            status = rng.choice((models.LeadStatus.UNREAD, models.LeadStatus.PROCESSING,
+                                 models.LeadStatus.CONTACTED, models.LeadStatus.CONTACTED))
+        else:
+            status = rng.choice((models.LeadStatus.CONTACTED, models.LeadStatus.ARCHIVED, models.LeadStatus.ARCHIVED))
+        quality = round(rng.betavariate(2, 3), 3)
+        company = rng.choice(_COMPANIES)
+        contacted = status in (models.LeadStatus.CONTACTED, models.LeadStatus.ARCHIVED)
+        last_contacted = created + timedelta(hours=rng.randint(1, 96)) if contacted else None
+        yield {
+            "lead_type": rng.choice(lead_types),
+            "name": f"{first} {last}",
+            "email": f"{first.lower()}.{last.lower()}{i}@{rng.choice(_EMAIL_DOMAINS)}",
+            "company": company,
+            "subject": rng.choice(_SUBJECTS),
+            "message": f"Hi, I came across your work and wanted to reach out (ref {i}). " * rng.randint(1, 6),
+            "status": status,
+            "priority": priorities[min(int(quality * 4.4), 3)],
+            "metadata": {
+                "ip_address": f"10.{i % 256}.{i // 256 % 256}.{rng.randrange(1, 255)}",
+                "user_agent": rng.choice(_USER_AGENTS),
+                "referer": rng.choice(_REFERRERS),
+                "origin": "https://arpitkumar.dev",
+            },
+            "form_type": "contacts",
+            "role": "recruiter" if company and rng.random() < 0.4 else rng.choice(_ROLES),
+            "flagged": rng.random() < 0.03,
+            "quality_score": quality,
+            "internal_notes": "Replied with availability." if contacted and rng.random() < 0.3 else "",
+            "tags": rng.sample(_TAGS, rng.randint(0, 3)),
+            "created_at": created,
+            "updated_at": last_contacted or created,
+            "timestamp": created,
+            "last_contacted": last_contacted,
+            "follow_up_date": last_contacted + timedelta(days=7) if contacted and rng.random() < 0.2 else None,
+            "contact_history": (
+                [{"type": "email", "at": last_contacted.isoformat(), "note": "Initial reply"}] if contacted else []
+            ),
+            "source": rng.choice(_SOURCES),
+            # Form submissions carry a submission key; legacy and manual leads do not
+            "idempotency_key": f"{rng.getrandbits(256):064x}" if rng.random() < 0.6 else None,
+        }
+
+
+def telemetry_rows(count: int, rng: random.Random, now: datetime, projects: int) -> Iterator[dict]:
+    """
+    TelemetryEvent rows, one visitor session at a time: every session lands on
+    "/" and drops off at each funnel step with the step's probability.
+    """
+    emitted = 0
+    for session in itertools.count():
+        if emitted >= count:
+            return
+        session_id = f"{rng.getrandbits(64):016x}"
+        host = rng.getrandbits(16)
+        ip_address = f"172.{16 + session % 16}.{host >> 8}.{host & 0xFF}"
+        user_agent = rng.choice(_USER_AGENTS)
+        at = _recent_bias(rng, now, mean_days=7)
+        project_id = rng.randint(1, max(projects, 1))
+        steps = []
+        for path, event_type, keep in _FUNNEL:
+            if rng.random() > keep:
+                break
+            steps.append((path, event_type))
+        if rng.random() < _CV_REQUEST_RATE:
+            steps.append(("/about", "cv_request"))
+        for step, (path, event_type) in enumerate(steps):
+            if emitted >= count:
+                return
+            meta = {"referrer": rng.choice(_REFERRERS)} if step == 0 else {"step": step}
+            if "{id}" in path:
+                path = path.format(id=project_id)
+                meta["project_id"] = project_id
+            yield {
+                "session_id": session_id,
+                "event_type": event_type,
+                "path": path,
+                "meta_data": meta,
+                "ip_address": ip_address,
+                "user_agent": user_agent,
+                "created_at": at,
+            }
+            emitted += 1
+            at += timedelta(seconds=3 + int(rng.random() * 117))
+
+
+def _paragraphs(rng: random.Random, count: int, sentences: tuple[int, int] = (3, 8)) -> list[str]:
+    return [_SENTENCE * rng.randint(*sentences) for _ in range(count)]
+
+
+def project_rows(count: int, rng: random.Random, now: datetime) -> Iterator[dict]:
+    """
+    Project rows with detail sections sized like real write-ups (tens of KB
+    each); `split_project_rows` separates the project_details columns.
+    """
+    categories = list(models.ProjectCategoryEnum)
+    for i in range(count):
+        stack = rng.sample(_TECHNOLOGIES, 6)
+        created = now - timedelta(days=rng.randint(0, 3 * 365))
+        yield {
+            "title": f"Project {i + 1}: {stack[0]} and {stack[1]} pipeline",
+            "description": f"An end-to-end {stack[0]} and {stack[1]} project. " * 3,
+            "long_description": _SENTENCE * 30,
+            "image": f"https://images.example.com/projects/{i + 1}.png",
+            "type": rng.choice(("Personal", "Research", "Internship")),
+            "category": rng.choice(categories),
+            "role": "Lead Developer",
+            "duration": f"{rng.randint(1, 12)} months",
+            "tags": stack[:3],
+            "objectives": _paragraphs(rng, 4, (1, 2)),
+            "technologies": stack,
+            "methods": _paragraphs(rng, 5, (1, 3)),
+            "results": [f"Improved metric {n} by {rng.randint(5, 40)}%" for n in range(4)],
+            "tldr": "Short summary of the project.",
+            "problem_statement": _SENTENCE * 6,
+            "literature_review": _SENTENCE * 12,
+            "code_snippet": "def train(model, data):\n    return model.fit(data.X, data.y)\n" * 10,
+            "company": rng.choice(_COMPANIES) or None,
+            "github_link": f"https://github.com/example/project-{i + 1}",
+            "key_impact_metrics": [f"{rng.randint(10, 90)}% faster {stack[n]} stage" for n in range(3)],
+            "core_stack": stack[:3],
+            "tools": stack[3:],
+            "implementation": _paragraphs(rng, 12),
+            "discussion": _paragraphs(rng, 8),
+            "conclusion": _paragraphs(rng, 3),
+            "limitations": _paragraphs(rng, 4, (1, 3)),
+            "future_work": _paragraphs(rng, 4, (1, 3)),
+            "references": [f"Author {n} et al. ({2015 + n % 10}). Paper title {n}. Journal {n}." for n in range(25)],
+            "challenges": _paragraphs(rng, 5, (1, 3)),
+            "solutions": _paragraphs(rng, 5, (1, 3)),
+            "gallery_images": [f"https://images.example.com/projects/{i + 1}/{n}.png" for n in range(8)],
+            "similar_project_ids": rng.sample(range(1, count + 1), min(3, count)),
+            "created_at": created,
+            "updated_at": created,
+        }
+
+
+def split_project_rows(rows: Iterable[dict]) -> tuple[list[dict], list[dict]]:
+    """
+    (projects rows, project_details rows). Detail rows reference ids 1..n,
+    which is what the projects get when loaded in order into a fresh table.
+    """
+    projects, details = [], []
+    for project_id, row in enumerate(rows, start=1):
+        detail = {"project_id": project_id}
+        for name in models.PROJECT_DETAIL_COLUMNS:
+            if name in row:
+                detail[name] = row.pop(name)
+        projects.append(row)
+        details.append(detail)
+    return projects, details
+
+
+# ============= Loaders =============
+
+def _batched(rows: Iterator[dict]) -> Iterator[list[dict]]:
+    while batch := list(itertools.islice(rows, BATCH_SIZE)):
+        yield batch
+
+
+def _json_text(value) -> str:
+    return orjson.dumps(value).decode()
+
+
+def _enum_value(value) -> str:
+    return value.value
+
+
+def _sqlite_datetime(value: datetime) -> str:
+    # SQLAlchemy's SQLite DATETIME storage format, always with microseconds
+    text = value.isoformat(" ")
+    return text if value.microsecond else text + ".000000"
+
+
+def _converters(table: Table, keys: list[str], dialect: str) -> list[Callable | None]:
+    """
+    Per-column driver-value converter (None = pass through), resolved once from
+    the column types instead of type-checking every value.
+    """
+    converters = []
+    for key in keys:
+        column_type = table.c[key].type
+        if isinstance(column_type, JSON):
+            converters.append(_json_text)
+        elif isinstance(column_type, SAEnum):
+            converters.append(_enum_value)
+        elif isinstance(column_type, DateTime) and dialect == "sqlite":
+            converters.append(_sqlite_datetime)
+        else:
+            converters.append(None)
+    return converters
+
+
+def _convert_row(row: dict, keys: list[str], converters: list[Callable | None]) -> tuple:
+    return tuple(
+        value if convert is None or value is None else convert(value)
+        for value, convert in zip(map(row.get, keys), converters)
+    )
+
+
+def _copy_field(value) -> str:
+    """One driver value in PostgreSQL COPY text format."""
+    if value is None:
+        return "\\N"
+    if value is True or value is False:
+        return "t" if value else "f"
+    text = value.isoformat() if isinstance(value, datetime) else str(value)
+    return text.replace("\\", "\\\\").replace("\t", "\\t").replace("\n", "\\n").replace("\r", "\\r")
+
+
+def _copy_rows(engine: Engine, table: Table, keys: list[str], rows: Iterator[dict]) -> None:
+    preparer = engine.dialect.identifier_preparer
+    columns = ", ".join(preparer.quote(table.c[key].name) for key in keys)
+    statement = f"COPY {preparer.format_table(table)} ({columns}) FROM STDIN"
+    converters = _converters(table, keys, engine.dialect.name)
+    raw = engine.raw_connection()
+    try:
+        cursor = raw.cursor()
+        for batch in _batched(rows):
+            buffer = io.StringIO()
+            for row in batch:
+                buffer.write("\t".join(map(_copy_field, _convert_row(row, keys, converters))))
+                buffer.write("\n")
+            buffer.seek(0)
+            cursor.copy_expert(statement, buffer)
+        raw.commit()
+    finally:
+        raw.close()
+
+
+def _executemany_rows(engine: Engine, table: Table, keys: list[str], rows: Iterator[dict]) -> None:
+    # One compiled INSERT; values are converted here rather than by per-row bind processors
+    compiled = insert(table).values({key: None for key in keys}).compile(dialect=engine.dialect)
+    positional = compiled.positiontup is not None
+    if positional:
+        keys = list(compiled.positiontup)  # bind order follows the table, not the row dicts
+    converters = _converters(table, keys, engine.dialect.name)
+    with engine.begin() as conn:
+        for batch in _batched(rows):
+            params = [_convert_row(row, keys, converters) for row in batch]
+            if not positional:
+                params = [dict(zip(keys, values)) for values in params]
+            conn.exec_driver_sql(compiled.string, params)
+
+
+def bulk_load(engine: Engine, table: Table, rows: Iterable[dict]) -> None:
+    """Insert generated rows: COPY on PostgreSQL, batched executemany elsewhere."""
+    rows = iter(rows)
+    first = next(rows, None)
+    if first is None:
+        return
+    keys = list(first)
+    rows = itertools.chain((first,), rows)
+    if engine.dialect.name == "postgresql":
+        _copy_rows(engine, table, keys, rows)
+    else:
+        _executemany_rows(engine, table, keys, rows)
+
+
+def reset_schema(engine: Engine) -> None:
+    """Drop and recreate every table (the project_category type is kept on PostgreSQL)."""
+    models.Base.metadata.drop_all(bind=engine)
+    if engine.dialect.name == "postgresql":
+        with engine.begin() as conn:
+            models.ProjectModel.__table__.c.category.type.create(conn, checkfirst=True)
+    models.Base.metadata.create_all(bind=engine)
+
+
+def seed_all(engine: Engine, leads: int, telemetry: int, projects: int, seed: int = 42) -> dict[str, float]:
+    """Recreate the schema and load the dataset. Returns seconds spent per table."""
+    rng = random.Random(seed)
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    reset_schema(engine)
+    timings = {}
+    project_table_rows, detail_rows = split_project_rows(project_rows(projects, rng, now))
+    for table, rows in (
+        (models.ProjectModel.__table__, project_table_rows),
+        (models.ProjectDetailModel.__table__, detail_rows),
+        (models.ContactLead.__table__, lead_rows(leads, rng, now)),
+        (models.TelemetryEventModel.__table__, telemetry_rows(telemetry, rng, now, projects)),
+    ):
+        start = time.perf_counter()
+        # Building secondary indexes once after the load beats maintaining them per row
+        for index in table.indexes:
+            index.drop(bind=engine)
+        bulk_load(engine, table, rows)
+        for index in table.indexes:
+            index.create(bind=engine)
+        timings[table.name] = time.perf_counter() - start
+    if engine.dialect.name == "postgresql":
+        with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+            conn.exec_driver_sql("ANALYZE")
+    return timings
+
+
+def table_counts(engine: Engine) -> dict[str, int]:
+    with engine.connect() as conn:
+        return {
+            table.name: conn.execute(select(func.count()).select_from(table)).scalar_one()
+            for table in (models.ProjectModel.__table__, models.ProjectDetailModel.__table__, models.ContactLead.__table__,
+                          models.TelemetryEventModel.__table__)
+        }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--database-url", default=os.environ["DATABASE_URL"])
+    parser.add_argument("--leads", type=int, default=100_000)
+    parser.add_argument("--telemetry", type=int, default=1_000_000)
+    parser.add_argument("--projects", type=int, default=40)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    engine = create_engine(args.database_url)
+    timings = seed_all(engine, args.leads, args.telemetry, args.projects, seed=args.seed)
+    for table, count in table_counts(engine).items():
+        print(f"  {table:<18} {count:>10,} rows  {timings[table]:6.1f} s  {count / max(timings[table], 1e-9):>12,.0f} rows/s")
+
+
+if __name__ == "__main__":
+    main()
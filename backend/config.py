@@ -1,4 +1,6 @@
+import hashlib
 import os
+import tempfile
 from pathlib import Path
 
 from dotenv import load_dotenv
@@ -46,8 +48,81 @@ ADMIN_EMAIL = os.getenv("ADMIN_EMAIL", "kumararpit17773@gmail.com")
 CALENDLY_LINK = os.getenv("CALENDLY_LINK", "https://calendly.com/kumararpit17773/30min")
 
 # Rate Limiting
-RATE_LIMIT_PUBLIC = "10/minute"  # Public endpoints
 RATE_LIMIT_ADMIN = "100/minute"  # Admin endpoints
+# Shared limiter storage: memory:// (per process), sqlite:///ratelimit.db
+# (all workers on one host) or redis://host:6379/0 (any Redis-protocol server)
+RATE_LIMIT_STORAGE_URI = os.getenv("RATE_LIMIT_STORAGE_URI", "memory://")
+RATE_LIMIT_STRATEGY = os.getenv("RATE_LIMIT_STRATEGY", "moving-window")
+# Cost-weighted budgets: every call spends its route cost (ROUTE_COSTS in
+# services/rate_limiter.py) from a per-IP and a global budget
+RATE_LIMIT_BUDGET_IP = os.getenv("RATE_LIMIT_BUDGET_IP", "120/minute")
+RATE_LIMIT_BUDGET_GLOBAL = os.getenv("RATE_LIMIT_BUDGET_GLOBAL", "2000/minute")
+
+# Duplicate-submission protection for contact/CV forms
+IDEMPOTENCY_WINDOW_SECONDS = int(os.getenv("IDEMPOTENCY_WINDOW_SECONDS", "600"))
+IDEMPOTENCY_CACHE_SIZE = int(os.getenv("IDEMPOTENCY_CACHE_SIZE", "10000"))
+
+# Ingestion-time spam scoring (see services/lead_scoring.py)
+SPAM_SCORE_THRESHOLD = float(os.getenv("SPAM_SCORE_THRESHOLD", "0.7"))
+SPAM_BLOCKED_IPS = frozenset(
+    ip.strip() for ip in os.getenv("SPAM_BLOCKED_IPS", "").split(",") if ip.strip()
+)
+
+# Email domain deliverability checks (see services/email_validation.py)
+EMAIL_DOMAIN_CACHE_TTL = float(os.getenv("EMAIL_DOMAIN_CACHE_TTL", "86400"))
+EMAIL_DNS_TIMEOUT = float(os.getenv("EMAIL_DNS_TIMEOUT", "3"))
+
+# Response compression (see middleware/compression.py)
+COMPRESSION_MINIMUM_SIZE = int(os.getenv("COMPRESSION_MINIMUM_SIZE", "1024"))
+COMPRESSION_GZIP_LEVEL = int(os.getenv("COMPRESSION_GZIP_LEVEL", "6"))
+COMPRESSION_BROTLI_QUALITY = int(os.getenv("COMPRESSION_BROTLI_QUALITY", "4"))
+
+# Instrumentation (see services/metrics.py): Server-Timing header with app and
+# DB time per response, and the bearer token GET /metrics requires (unset: 404)
+RESPONSE_TIMING_HEADER = os.getenv("RESPONSE_TIMING_HEADER", "false").lower() == "true"
+METRICS_TOKEN = os.getenv("METRICS_TOKEN", "")
+
+# Development query auditor (see services/query_audit.py): logs slow queries
+# with their EXPLAIN plan and requests over budget / with repeated statements
+QUERY_AUDIT_ENABLED = os.getenv("QUERY_AUDIT_ENABLED", "false").lower() == "true"
+QUERY_AUDIT_SLOW_MS = float(os.getenv("QUERY_AUDIT_SLOW_MS", "200"))
+QUERY_AUDIT_MAX_PER_REQUEST = int(os.getenv("QUERY_AUDIT_MAX_PER_REQUEST", "10"))
+
+# Schema migrations (see migrations/runner.py): startup only checks the schema
+# version unless auto-upgrade is enabled; DDL waits at most the lock timeout
+MIGRATIONS_AUTO_UPGRADE = os.getenv("MIGRATIONS_AUTO_UPGRADE", "false").lower() == "true"
+MIGRATIONS_LOCK_TIMEOUT = os.getenv("MIGRATIONS_LOCK_TIMEOUT", "5s")
+
+# JSON project store (local/fallback backend, see services/project_service.py):
+# edits are appended to a journal, folded into projects.json past this size
+PROJECTS_JOURNAL_COMPACT_BYTES = int(os.getenv("PROJECTS_JOURNAL_COMPACT_BYTES", str(1024 * 1024)))
+
+# Related projects stored on each project (see services/similarity.py)
+SIMILAR_PROJECTS_K = int(os.getenv("SIMILAR_PROJECTS_K", "4"))
+
+# Cross-worker cache invalidation (see services/cache_bus.py):
+# auto | postgres (LISTEN/NOTIFY) | file (shared file, one host) | local
+CACHE_BUS_BACKEND = os.getenv("CACHE_BUS_BACKEND", "auto").lower()
+CACHE_BUS_CHANNEL = os.getenv("CACHE_BUS_CHANNEL", "cache_invalidation")
+CACHE_BUS_FILE = os.getenv("CACHE_BUS_FILE", str(Path(tempfile.gettempdir()) / "portfolio-cache-bus.log"))
+
+# Host-wide response cache shared by all workers (see services/shared_cache.py);
+# the default directory is per database, so deployments sharing a host don't mix entries
+_DATABASE_TAG = hashlib.sha256(SQLALCHEMY_DATABASE_URL.encode()).hexdigest()[:12]
+SHARED_CACHE_DIR = os.getenv(
+    "SHARED_CACHE_DIR", str(Path(tempfile.gettempdir()) / f"portfolio-shared-cache-{_DATABASE_TAG}")
+)
+
+# Delta sync feeds (?since= cursors, see services/sync.py): rows newer than the
+# settle window wait for the next poll so a late-committing write can't be
+# skipped; tombstones older than the retention make older cursors resync
+SYNC_SETTLE_SECONDS = float(os.getenv("SYNC_SETTLE_SECONDS", "2"))
+SYNC_TOMBSTONE_RETENTION_DAYS = int(os.getenv("SYNC_TOMBSTONE_RETENTION_DAYS", "30"))
+
+# Static snapshots of the public project/about/settings endpoints (see
+# services/snapshot_publisher.py), rewritten on every admin edit; unset disables
+SNAPSHOT_DIR = os.getenv("SNAPSHOT_DIR", "")
+SNAPSHOT_KEEP_VERSIONS = int(os.getenv("SNAPSHOT_KEEP_VERSIONS", "3"))
 
 # CORS Configuration
 _default_cors: list[str] = [
@@ -4,18 +4,38 @@ All business logic is modularized into separate services and routes.
 """
 import logging
 import os
+import time
+from contextlib import asynccontextmanager
 
 import sentry_sdk
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
-from slowapi import Limiter, _rate_limit_exceeded_handler
+from slowapi import _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
-from slowapi.middleware import SlowAPIMiddleware
+from slowapi.middleware import SlowAPIASGIMiddleware
 
 import database
-import models
-from config import APP_TITLE, APP_VERSION, CORS_ORIGINS
+from config import (
+    APP_TITLE,
+    APP_VERSION,
+    CORS_ORIGINS,
+    MIGRATIONS_AUTO_UPGRADE,
+    QUERY_AUDIT_ENABLED,
+    RESPONSE_TIMING_HEADER,
+)
+from middleware.compression import CompressionMiddleware
+from middleware.metrics import MetricsMiddleware
+from middleware.query_audit import QueryAuditMiddleware
+from middleware.security_headers import SecurityHeadersMiddleware
+from migrations.runner import check_schema_version, upgrade
+from services.cache_bus import create_transport, invalidation_bus
+from services.metrics import instrument_engine
+from services.query_audit import QueryAuditor
+from services.rate_limiter import limiter
+from services.shared_cache import shared_cache
+from services.snapshot_publisher import snapshot_publisher
+from utils.responses import FastJSONResponse
 
 logger = logging.getLogger("uvicorn.error")
 
@@ -28,28 +48,37 @@ if _sentry_dsn:
         environment=os.getenv("SENTRY_ENV", "production"),
     )
 
-# Create database tables if they don't exist
-models.Base.metadata.create_all(bind=database.engine)
-
-
-# ── Rate limiter with proxy-aware IP extraction ──
-def _get_real_ip(request: Request) -> str:
-    """Extract real client IP from X-Forwarded-For (proxy-safe)."""
-    forwarded = request.headers.get("X-Forwarded-For")
-    if forwarded:
-        return forwarded.split(",")[0].strip()
-    return request.client.host if request.client else "127.0.0.1"
-
 
-limiter = Limiter(key_func=_get_real_ip)
 
-# Initialize FastAPI app
-app = FastAPI(title=APP_TITLE, version=APP_VERSION)
-
-# Add rate limiter to app state
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Schema changes ship as versioned migrations (python -m migrations upgrade);
+    # startup only checks the recorded version unless auto-upgrade is enabled
+    started = time.time()
+    if MIGRATIONS_AUTO_UPGRADE:
+        upgrade(database.engine)
+    else:
+        check_schema_version(database.engine)
+    # The shared cache (services/shared_cache.py) survives restarts: drop entries
+    # loaded before this deploy and its migrations; other workers' fresher ones stay
+    shared_cache.invalidate_all(published_at=started)
+    # Admin edits clear response caches in every worker (services/cache_bus.py)
+    invalidation_bus.start(create_transport(database.engine))
+    # Static snapshots of public content (services/snapshot_publisher.py), if SNAPSHOT_DIR is set;
+    # republished at startup to pick up deploys and edits made outside the admin panel
+    snapshot_publisher.schedule()
+    yield
+    snapshot_publisher.stop()
+    invalidation_bus.stop()
+
+
+# Initialize FastAPI app (orjson-backed responses; see utils/responses.py)
+app = FastAPI(title=APP_TITLE, version=APP_VERSION, default_response_class=FastJSONResponse, lifespan=lifespan)
+
+# Add shared rate limiter (proxy-aware key, pluggable storage) to app state
 app.state.limiter = limiter
 app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
-app.add_middleware(SlowAPIMiddleware)
+app.add_middleware(SlowAPIASGIMiddleware)
 
 # Configure CORS middleware
 app.add_middleware(
@@ -57,22 +86,25 @@ app.add_middleware(
     allow_origins=CORS_ORIGINS,
     allow_credentials=True,
     allow_methods=["GET", "POST", "PATCH", "DELETE", "OPTIONS"],
-    allow_headers=["authorization", "content-type", "accept", "origin"],
-    expose_headers=["content-type", "authorization"],
+    allow_headers=["authorization", "content-type", "accept", "origin", "idempotency-key"],
+    expose_headers=["content-type", "authorization", "idempotent-replayed"],
 )
 
+# Compress JSON/CSV responses above the size threshold (brotli or gzip)
+app.add_middleware(CompressionMiddleware)
+
+# OWASP security headers, pure ASGI
+app.add_middleware(SecurityHeadersMiddleware)
 
-# ── Security headers middleware ──
-@app.middleware("http")
-async def add_security_headers(request: Request, call_next):
-    """Inject OWASP-recommended security headers on every response."""
-    response = await call_next(request)
-    response.headers["Strict-Transport-Security"] = "max-age=31536000; includeSubDomains"
-    response.headers["X-Content-Type-Options"] = "nosniff"
-    response.headers["X-Frame-Options"] = "DENY"
-    response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
-    response.headers["Permissions-Policy"] = "camera=(), microphone=(), geolocation=()"
-    return response
+# Per-route latency / query-count metrics (+ optional Server-Timing header)
+instrument_engine(database.engine)
+app.add_middleware(MetricsMiddleware, server_timing=RESPONSE_TIMING_HEADER)
+
+# Development-only N+1 / slow-query logging
+if QUERY_AUDIT_ENABLED:
+    query_auditor = QueryAuditor()
+    query_auditor.attach(database.engine)
+    app.add_middleware(QueryAuditMiddleware, auditor=query_auditor)
 
 
 # ── Global exception handler ──
@@ -87,7 +119,7 @@ async def global_exception_handler(request: Request, exc: Exception):
 
 
 # Include route routers
-from routes import about, analytics, auth, health, leads, projects, site_settings
+from routes import about, analytics, auth, health, leads, metrics, projects, site_settings
 
 # Health routes - include at both /api and root level for compatibility
 app.include_router(health.router)  # Includes at /api prefix (default)
@@ -116,3 +148,6 @@ app.include_router(site_settings.public_settings_router)
 app.include_router(analytics.router)
 app.include_router(analytics.public_telemetry_router)
 
+# Prometheus metrics scrape endpoint
+app.include_router(metrics.router)
+
@@ -0,0 +1,230 @@
+"""
+Response compression (brotli / gzip) as a pure ASGI middleware.
+
+  - Encoding is negotiated from Accept-Encoding q-values; brotli wins ties
+    when the optional `brotli` package is installed, otherwise gzip is used.
+  - Bodies below `minimum_size` and already-encoded responses pass through.
+  - Streaming responses (CSV export) are compressed chunk by chunk and
+    flushed per chunk, so the client still receives data progressively.
+  - Static payloads (about.json) use `PrecompressedJSON`: encoded and
+    compressed once at load, then served per request without any work.
+"""
+import gzip
+import hashlib
+import zlib
+
+import anyio.to_thread
+from fastapi.responses import Response
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from config import COMPRESSION_BROTLI_QUALITY, COMPRESSION_GZIP_LEVEL, COMPRESSION_MINIMUM_SIZE
+from utils.responses import dump_json
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+# Preference order when the client accepts several encodings with equal q
+SUPPORTED_ENCODINGS: tuple[str, ...] = ("br", "gzip") if brotli is not None else ("gzip",)
+
+COMPRESSIBLE_TYPES = frozenset({
+    "application/json", "application/javascript", "application/xml",
+    "image/svg+xml", "text/csv", "text/css", "text/html", "text/plain",
+})
+
+# Single bodies above this size are compressed off the event loop
+_THREAD_MINIMUM_SIZE = 128 * 1024
+
+
+def negotiate_encoding(accept_encoding: str, available: tuple[str, ...] = SUPPORTED_ENCODINGS) -> str | None:
+    """Pick the best encoding from `available` for an Accept-Encoding header, or None."""
+    if not accept_encoding:
+        return None
+    weights: dict[str, float] = {}
+    for part in accept_encoding.lower().split(","):
+        token, _, params = part.partition(";")
+        token = token.strip()
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        weights[token] = q
+
+    wildcard = weights.get("*", 0.0)
+    best, best_q = None, 0.0
+    for encoding in available:
+        q = weights.get(encoding, wildcard)
+        if q > best_q:
+            best, best_q = encoding, q
+    return best
+
+
+def compress(body: bytes, encoding: str, static: bool = False) -> bytes:
+    """One-shot compression. `static` uses maximum effort for payloads compressed once."""
+    if encoding == "br":
+        return brotli.compress(body, quality=11 if static else COMPRESSION_BROTLI_QUALITY)
+    return gzip.compress(body, compresslevel=9 if static else COMPRESSION_GZIP_LEVEL, mtime=0)
+
+
+class _StreamCompressor:
+    """Incremental compressor that flushes after every chunk."""
+
+    def __init__(self, encoding: str):
+        self._encoding = encoding
+        if encoding == "br":
+            self._brotli = brotli.Compressor(quality=COMPRESSION_BROTLI_QUALITY)
+        else:
+            self._zlib = zlib.compressobj(COMPRESSION_GZIP_LEVEL, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def chunk(self, data: bytes, final: bool) -> bytes:
+        if self._encoding == "br":
+            out = self._brotli.process(data)
+            return out + (self._brotli.finish() if final else self._brotli.flush())
+        out = self._zlib.compress(data)
+        return out + self._zlib.flush(zlib.Z_FINISH if final else zlib.Z_SYNC_FLUSH)
+
+
+class CompressionMiddleware:
+    """Negotiated brotli/gzip compression for compressible responses."""
+
+    def __init__(self, app: ASGIApp, minimum_size: int = COMPRESSION_MINIMUM_SIZE):
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+        await _CompressionResponder(self.app, encoding, self.minimum_size)(scope, receive, send)
+
+
+class _CompressionResponder:
+    """Per-request state: holds the start message until the first body chunk decides."""
+
+    def __init__(self, app: ASGIApp, encoding: str, minimum_size: int):
+        self.app = app
+        self.encoding = encoding
+        self.minimum_size = minimum_size
+        self.send: Send
+        self.start_message: Message | None = None
+        self.passthrough = False
+        self.stream: _StreamCompressor | None = None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        self.send = send
+        await self.app(scope, receive, self.send_compressed)
+
+    async def send_compressed(self, message: Message) -> None:
+        message_type = message["type"]
+
+        if message_type == "http.response.start":
+            headers = Headers(raw=message["headers"])
+            media_type = headers.get("content-type", "").partition(";")[0].strip().lower()
+            self.passthrough = (
+                "content-encoding" in headers
+                or message["status"] in (204, 206, 304)
+                or media_type not in COMPRESSIBLE_TYPES
+            )
+            if self.passthrough:
+                await self.send(message)
+            else:
+                self.start_message = message
+            return
+
+        if message_type != "http.response.body" or self.passthrough:
+            if self.start_message is not None:
+                await self.send(self.start_message)
+                self.start_message = None
+            await self.send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if self.stream is not None:
+            message["body"] = self.stream.chunk(body, final=not more_body)
+            await self.send(message)
+            return
+
+        start, self.start_message = self.start_message, None
+        headers = MutableHeaders(raw=start["headers"])
+        headers.add_vary_header("Accept-Encoding")
+
+        if not more_body:
+            if len(body) < self.minimum_size:
+                await self.send(start)
+                await self.send(message)
+                return
+            if len(body) >= _THREAD_MINIMUM_SIZE:
+                message["body"] = await anyio.to_thread.run_sync(compress, body, self.encoding)
+            else:
+                message["body"] = compress(body, self.encoding)
+            headers["Content-Encoding"] = self.encoding
+            headers["Content-Length"] = str(len(message["body"]))
+            await self.send(start)
+            await self.send(message)
+            return
+
+        # Streaming response: total size unknown, compress incrementally
+        self.stream = _StreamCompressor(self.encoding)
+        headers["Content-Encoding"] = self.encoding
+        if "content-length" in headers:
+            del headers["Content-Length"]
+        message["body"] = self.stream.chunk(body, final=False)
+        await self.send(start)
+        await self.send(message)
+
+
+class PrecompressedJSON:
+    """
+    JSON payload encoded once and compressed once per supported encoding.
+
+    `source` is the object the bytes were built from, so callers holding a
+    cached instance can tell whether it still matches their data. `etag` is
+    a strong validator derived from the encoded bytes, identical in every
+    worker for the same content.
+    """
+
+    __slots__ = ("source", "identity", "variants", "etag")
+
+    def __init__(self, content):
+        self.source = content
+        self.identity = dump_json(content)
+        self.etag = f'"{hashlib.blake2b(self.identity, digest_size=16).hexdigest()}"'
+        self.variants: dict[str, bytes] = {}
+        if len(self.identity) >= COMPRESSION_MINIMUM_SIZE:
+            self.variants = {encoding: compress(self.identity, encoding, static=True) for encoding in SUPPORTED_ENCODINGS}
+
+    def response(self, accept_encoding: str, headers: dict[str, str] | None = None,
+                 if_none_match: str | None = None) -> Response:
+        """
+        Serve the best variant for `accept_encoding` (identity if none match),
+        or 304 Not Modified when `if_none_match` carries this payload's ETag.
+        """
+        headers = {**(headers or {}), "ETag": self.etag}
+        if self.variants:
+            headers["Vary"] = "Accept-Encoding"
+        if if_none_match and _etag_matches(if_none_match, self.etag):
+            return Response(status_code=304, headers=headers)
+        body = self.identity
+        if self.variants:
+            encoding = negotiate_encoding(accept_encoding, tuple(self.variants))
+            if encoding is not None:
+                body = self.variants[encoding]
+                headers["Content-Encoding"] = encoding
+        return Response(content=body, media_type="application/json", headers=headers)
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    # Weak comparison (RFC 9110 13.1.2): a W/ prefix added by a proxy still matches
+    candidates = (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+    return any(tag in ("*", etag) for tag in candidates)
@@ -0,0 +1,66 @@
+"""
+Request instrumentation as a pure ASGI middleware.
+
+Records per-route latency and SQL query counts into services/metrics.py and,
+when enabled, reports them to the browser as
+`Server-Timing: app;dur=<ms>, db;dur=<ms>;desc="<n> queries"`.
+
+Routes are labelled by their path template (`/api/admin/leads/{lead_id}`),
+not the raw URL, so label cardinality stays bounded by the route table.
+"""
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from services.metrics import (
+    REQUEST_DB_QUERIES,
+    REQUEST_DURATION,
+    end_request_stats,
+    start_request_stats,
+)
+
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+def _route_label(scope: Scope) -> str:
+    route = scope.get("route")
+    return getattr(route, "path", None) or UNMATCHED_ROUTE
+
+
+class MetricsMiddleware:
+    """Time each HTTP request and count the SQL it issued."""
+
+    def __init__(self, app: ASGIApp, server_timing: bool = False, exclude_paths: tuple[str, ...] = ("/metrics",)):
+        self.app = app
+        self.server_timing = server_timing
+        self.exclude_paths = frozenset(exclude_paths)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] in self.exclude_paths:
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        stats, token = start_request_stats()
+        status_code = 500
+
+        async def send_with_timing(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                if self.server_timing:
+                    app_ms = (time.perf_counter() - start) * 1000
+                    value = (
+                        f'app;dur={app_ms:.2f}, '
+                        f'db;dur={stats.query_seconds * 1000:.2f};desc="{stats.queries} queries"'
+                    )
+                    message["headers"] = [*message.get("headers", ()), (b"server-timing", value.encode("latin-1"))]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            end_request_stats(token)
+            route = _route_label(scope)
+            REQUEST_DURATION.observe(time.perf_counter() - start, scope["method"], route, str(status_code))
+            REQUEST_DB_QUERIES.observe(stats.queries, route)
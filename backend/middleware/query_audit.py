@@ -0,0 +1,37 @@
+"""
+Per-request query audit (development only, see services/query_audit.py).
+"""
+import logging
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from config import QUERY_AUDIT_MAX_PER_REQUEST
+from services.query_audit import QueryAuditor
+
+logger = logging.getLogger(__name__)
+
+
+class QueryAuditMiddleware:
+    """Log requests that run too many statements or repeat the same one (N+1)."""
+
+    def __init__(self, app: ASGIApp, auditor: QueryAuditor,
+                 max_queries: int = QUERY_AUDIT_MAX_PER_REQUEST, repeat_threshold: int = 3):
+        self.app = app
+        self.auditor = auditor
+        self.max_queries = max_queries
+        self.repeat_threshold = repeat_threshold
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        with self.auditor.track() as log:
+            await self.app(scope, receive, send)
+        repeated = log.repeated(self.repeat_threshold)
+        if log.count > self.max_queries or repeated:
+            logger.warning(
+                "%s %s ran %d queries (budget %d)%s\n%s",
+                scope["method"], scope["path"], log.count, self.max_queries,
+                f"; repeated {sorted(repeated.values(), reverse=True)}x — possible N+1" if repeated else "",
+                log.summary(),
+            )
@@ -0,0 +1,43 @@
+"""
+Security headers as a pure ASGI middleware.
+
+Replaces the `@app.middleware("http")` function, which ran on
+BaseHTTPMiddleware and so wrapped every response in an extra task and
+memory stream. Here the headers are encoded once at import and appended to
+the `http.response.start` message; the body passes through untouched.
+"""
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# OWASP-recommended headers, pre-encoded for the raw ASGI header list
+SECURITY_HEADERS: tuple[tuple[bytes, bytes], ...] = tuple(
+    (name.lower().encode("latin-1"), value.encode("latin-1"))
+    for name, value in (
+        ("Strict-Transport-Security", "max-age=31536000; includeSubDomains"),
+        ("X-Content-Type-Options", "nosniff"),
+        ("X-Frame-Options", "DENY"),
+        ("Referrer-Policy", "strict-origin-when-cross-origin"),
+        ("Permissions-Policy", "camera=(), microphone=(), geolocation=()"),
+    )
+)
+_SECURITY_HEADER_NAMES = frozenset(name for name, _ in SECURITY_HEADERS)
+
+
+class SecurityHeadersMiddleware:
+    """Inject SECURITY_HEADERS on every HTTP response, replacing any values a route set itself."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = [h for h in message.get("headers", ()) if h[0].lower() not in _SECURITY_HEADER_NAMES]
+                headers.extend(SECURITY_HEADERS)
+                message["headers"] = headers
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
@@ -0,0 +1,17 @@
+"""
+Migration 000: baseline schema for an empty database.
+
+Builds every table and index from models.py as it currently stands; the
+runner then records all later migrations as applied, since the models
+already include them. Databases migrated by hand with psql are stamped
+instead of running this, e.g. `python -m migrations stamp 5`
+"""
+from sqlalchemy.engine import Connection
+
+import models
+
+
+def upgrade(conn: Connection) -> None:
+    if conn.dialect.name == "postgresql":
+        models.ProjectModel.__table__.c.category.type.create(conn, checkfirst=True)
+    models.Base.metadata.create_all(bind=conn)
@@ -0,0 +1,26 @@
+-- ============================================================================
+-- Migration 005: Duplicate-submission guard for contact/CV forms
+-- Neon PostgreSQL
+-- Safe to run: uses IF NOT EXISTS (idempotent)
+-- ============================================================================
+
+-- SHA-256 hex digest of the Idempotency-Key header, or of
+-- (lead type, email, subject, message, time window) when no header is sent.
+-- NULL for legacy rows and leads created outside the public forms.
+ALTER TABLE contact_leads
+ADD COLUMN IF NOT EXISTS idempotency_key VARCHAR(64) NULL;
+
+-- Unique index rejects the second insert of a double-submitted form, even
+-- when the duplicates are handled by different workers. NULLs never collide.
+CREATE UNIQUE INDEX IF NOT EXISTS idx_contact_leads_idempotency_key
+ON contact_leads(idempotency_key);
+
+COMMENT ON COLUMN contact_leads.idempotency_key IS 'Idempotency key of the originating form submission (see services/idempotency.py)';
+
+COMMIT;
+
+-- ============================================================================
+-- Migration complete!
+-- ✅ idempotency_key (VARCHAR(64)) - Duplicate-submission guard
+-- ✅ Unique index on idempotency_key
+-- ============================================================================
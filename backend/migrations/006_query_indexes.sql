@@ -0,0 +1,66 @@
+-- ============================================================================
+-- Migration 006: Composite and partial indexes for lead and telemetry queries
+-- Neon PostgreSQL
+-- Safe to run: uses IF NOT EXISTS (idempotent) and CONCURRENTLY (no write lock)
+--
+-- CREATE INDEX CONCURRENTLY cannot run inside a transaction block: run this
+-- file with plain `psql -f` (autocommit), not `psql -1` or a BEGIN/COMMIT
+-- wrapper. If a build is interrupted it leaves an INVALID index behind; drop
+-- it with DROP INDEX CONCURRENTLY and re-run this file.
+--
+-- Each index matches a query in services/lead_service.py or
+-- routes/analytics.py; benchmarks/bench_indexes.py checks it is used.
+-- ============================================================================
+
+-- get_filtered_leads(status=...) ORDER BY created_at DESC and count_unread_leads:
+-- equality on status, rows already in created_at order (no sort step)
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_contact_leads_status_created_at
+ON contact_leads(status, created_at);
+
+-- get_filtered_leads(priority=..., min_score=...):
+-- equality on priority, range on quality_score
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_contact_leads_priority_quality_score
+ON contact_leads(priority, quality_score);
+
+-- get_lead_by_idempotency_key: replaces the full unique index from 005.
+-- Legacy and manually created leads have no key, so a partial unique index
+-- holds only keyed rows and still rejects duplicate keys
+CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS idx_contact_leads_idempotency_key_present
+ON contact_leads(idempotency_key)
+WHERE idempotency_key IS NOT NULL;
+
+DROP INDEX CONCURRENTLY IF EXISTS idx_contact_leads_idempotency_key;
+-- Same guard when the column was created by create_all (brief table lock)
+ALTER TABLE contact_leads DROP CONSTRAINT IF EXISTS contact_leads_idempotency_key_key;
+
+-- get_source_breakdown: GROUP BY source (already present when 003 was applied)
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_contact_leads_source
+ON contact_leads(source);
+
+-- filter_leads_by_date filters on the legacy timestamp column
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_contact_leads_timestamp
+ON contact_leads(timestamp);
+
+-- Live visitors: COUNT(DISTINCT session_id) WHERE created_at >= now() - 15 min,
+-- answered from the index alone
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_telemetry_events_created_at_session_id
+ON telemetry_events(created_at, session_id);
+
+-- Single-column indexes made redundant by the composites above (each is the
+-- leading column of one); dropping them saves a write per insert/update
+DROP INDEX CONCURRENTLY IF EXISTS idx_contact_leads_status;
+DROP INDEX CONCURRENTLY IF EXISTS ix_contact_leads_status;
+DROP INDEX CONCURRENTLY IF EXISTS idx_contact_leads_priority;
+
+-- Refresh planner statistics so the new indexes are considered immediately
+ANALYZE contact_leads;
+ANALYZE telemetry_events;
+
+-- ============================================================================
+-- Migration complete!
+-- ✅ (status, created_at), (priority, quality_score) composites
+-- ✅ Partial unique index on idempotency_key (replaces the full one from 005)
+-- ✅ source and legacy timestamp indexes
+-- ✅ (created_at, session_id) on telemetry_events
+-- ✅ Redundant status / priority single-column indexes dropped
+-- ============================================================================
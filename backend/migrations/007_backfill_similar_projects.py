@@ -0,0 +1,14 @@
+"""
+Migration 007: compute similar_project_ids for existing projects.
+
+Replaces the hand-maintained lists with the similarity engine's output
+(services/similarity.py); from here on every project write keeps them
+current.
+"""
+from sqlalchemy.engine import Connection
+
+from services.similarity import refresh_similar_projects
+
+
+def upgrade(conn: Connection) -> None:
+    refresh_similar_projects(conn)
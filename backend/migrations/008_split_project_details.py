@@ -0,0 +1,29 @@
+"""
+Migration 008: move the long-form project sections into project_details.
+
+Creates the table, copies each project's long_description, literature
+review, code snippet and large JSONB arrays into it, then drops those
+columns from `projects`. Skips columns `projects` no longer has, so it is a
+no-op on a schema that already has the split.
+"""
+from sqlalchemy import column, insert, inspect, select, table
+from sqlalchemy.engine import Connection
+
+from models import PROJECT_DETAIL_COLUMNS, ProjectDetailModel
+
+
+def upgrade(conn: Connection) -> None:
+    details = ProjectDetailModel.__table__
+    details.create(conn, checkfirst=True)
+
+    existing = {c["name"] for c in inspect(conn).get_columns("projects")}
+    moved = [name for name in PROJECT_DETAIL_COLUMNS if name in existing]
+    if not moved:
+        return
+
+    projects = table("projects", column("id"), *(column(name) for name in moved))
+    conn.execute(insert(details).from_select(["project_id", *moved], select(*projects.c)))
+
+    quote = conn.dialect.identifier_preparer.quote
+    for name in moved:
+        conn.exec_driver_sql(f"ALTER TABLE projects DROP COLUMN {quote(name)}")
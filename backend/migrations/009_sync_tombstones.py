@@ -0,0 +1,14 @@
+"""
+Migration 009: sync_tombstones table for the delta sync feeds.
+
+Deleted project and lead ids are recorded here so `?since=` feeds can
+report them (services/sync.py). The (updated_at, id) indexes the feeds
+scan are built concurrently by 010_sync_indexes.sql.
+"""
+from sqlalchemy.engine import Connection
+
+from models import SyncTombstoneModel
+
+
+def upgrade(conn: Connection) -> None:
+    SyncTombstoneModel.__table__.create(conn, checkfirst=True)
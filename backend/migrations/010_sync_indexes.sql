@@ -0,0 +1,19 @@
+-- ============================================================================
+-- Migration 010: (updated_at, id) indexes for the delta sync feeds
+-- Neon PostgreSQL
+-- Safe to run: uses IF NOT EXISTS (idempotent) and CONCURRENTLY (no write lock)
+--
+-- CREATE INDEX CONCURRENTLY cannot run inside a transaction block: run this
+-- file with plain `psql -f` (autocommit). If a build is interrupted it leaves
+-- an INVALID index behind; drop it with DROP INDEX CONCURRENTLY and re-run.
+--
+-- GET /api/projects/changes and /api/admin/leads/changes read rows after a
+-- (updated_at, id) cursor in that order (services/sync.py): a range scan on
+-- these indexes with no sort step.
+-- ============================================================================
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_projects_updated_at_id
+ON projects(updated_at, id);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_contact_leads_updated_at_id
+ON contact_leads(updated_at, id);
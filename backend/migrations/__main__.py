@@ -0,0 +1,59 @@
+"""
+Command line for the migration runner (run from backend/):
+
+    python -m migrations status
+    python -m migrations upgrade [--target 6]
+    python -m migrations stamp 5
+"""
+import argparse
+import logging
+import sys
+
+from database import engine
+from migrations.runner import MigrationError, applied_migrations, current_version, discover, stamp, upgrade
+
+
+def _status() -> None:
+    if current_version(engine) is None:
+        print("Database is unversioned (no schema_migrations table)")
+        applied = {}
+    else:
+        applied = applied_migrations(engine)
+    for migration in discover():
+        row = applied.get(migration.version)
+        if row is None:
+            state = "pending"
+        elif row["checksum"] != migration.checksum:
+            state = f"applied {row['applied_at']:%Y-%m-%d %H:%M} (file changed since)"
+        else:
+            state = f"applied {row['applied_at']:%Y-%m-%d %H:%M}"
+        print(f"{migration.version:03d}  {migration.name:<36} {state}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m migrations", description="Versioned schema migrations")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("status", help="list migrations and whether they are applied")
+    upgrade_parser = commands.add_parser("upgrade", help="apply pending migrations")
+    upgrade_parser.add_argument("--target", type=int, help="stop after this version")
+    stamp_parser = commands.add_parser("stamp", help="record migrations up to VERSION as applied without running them")
+    stamp_parser.add_argument("version", type=int)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    try:
+        if args.command == "status":
+            _status()
+        elif args.command == "upgrade":
+            applied = upgrade(engine, target=args.target)
+            print(f"Applied {len(applied)} migration(s); schema at version {current_version(engine):03d}")
+        else:
+            stamped = stamp(engine, args.version)
+            print(f"Stamped {len(stamped)} migration(s); schema at version {current_version(engine):03d}")
+    except MigrationError as exc:
+        print(f"Error: {exc}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -7,11 +7,12 @@ Usage (from the backend/ directory, with venv activated):
 What it does:
   1. Uses Node.js to evaluate the TSX array and output clean JSON
   2. Maps camelCase keys → snake_case columns
-  3. Inserts each project into the `projects` table
+  3. Inserts each project into the `projects` table (long-form sections
+     into `project_details`)
   4. Prints a summary
 
 Prerequisites:
-  - The `projects` table must already exist (run 004_create_projects_table.sql first)
+  - The schema must be current (`python -m migrations upgrade`)
   - DATABASE_URL must be set in .env
   - Node.js must be available on PATH
 """
@@ -30,6 +31,7 @@ sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 from sqlalchemy import text
 
 from database import SessionLocal
+from models import PROJECT_DETAIL_COLUMNS
 
 # ============= Configuration =============
 
@@ -163,15 +165,23 @@ def map_project_to_db_row(project: dict) -> dict:
 # ============= Step 3: Insert into DB =============
 
 def insert_projects(rows: list[dict]) -> int:
-    """Insert project rows into the `projects` table. Returns count inserted."""
+    """
+    Insert project rows into the `projects` table, with the long-form
+    sections in `project_details`. Returns count inserted.
+    """
     db = SessionLocal()
     inserted = 0
     try:
         for row in rows:
-            columns = ", ".join(f'"{k}"' for k in row)
-            placeholders = ", ".join(f":{k}" for k in row)
-            sql = text(f'INSERT INTO projects ({columns}) VALUES ({placeholders})')
-            db.execute(sql, row)
+            project = {k: v for k, v in row.items() if k not in PROJECT_DETAIL_COLUMNS}
+            details = {k: v for k, v in row.items() if k in PROJECT_DETAIL_COLUMNS}
+            columns = ", ".join(f'"{k}"' for k in project)
+            placeholders = ", ".join(f":{k}" for k in project)
+            sql = text(f'INSERT INTO projects ({columns}) VALUES ({placeholders}) RETURNING id')
+            details["project_id"] = db.execute(sql, project).scalar_one()
+            columns = ", ".join(f'"{k}"' for k in details)
+            placeholders = ", ".join(f":{k}" for k in details)
+            db.execute(text(f'INSERT INTO project_details ({columns}) VALUES ({placeholders})'), details)
             inserted += 1
         db.commit()
     except Exception:
@@ -0,0 +1,292 @@
+"""
+Versioned schema migrations.
+
+Migrations live in this directory as `NNN_name.sql` or `NNN_name.py` and are
+applied in version order; each applied version is recorded in the
+`schema_migrations` table together with a checksum of the file.
+
+  - `.sql` files target PostgreSQL and run like `psql -f`: statement by
+    statement in autocommit mode, so a file's own BEGIN/COMMIT delimit its
+    transactions and CREATE INDEX CONCURRENTLY works. On other dialects they
+    are recorded without running.
+  - `.py` files define `upgrade(conn)` and run in one transaction on any dialect.
+
+An empty database is built by 000_initial_schema.py from models.py, and all
+later versions are recorded as applied (the models already include them).
+
+Migrations must be idempotent (IF NOT EXISTS / checkfirst): a run that fails
+half-way is retried from the top of the file. On PostgreSQL a `lock_timeout`
+makes DDL give up instead of queueing behind long transactions (and blocking
+traffic behind itself), and an advisory lock keeps concurrent upgrades
+(several workers with MIGRATIONS_AUTO_UPGRADE) from racing.
+
+The app never creates tables at startup; it only compares the recorded
+version with the newest file (`check_schema_version`). Run upgrades with:
+
+    python -m migrations status
+    python -m migrations upgrade
+    python -m migrations stamp 5     # existing database migrated by hand up to 005
+"""
+import hashlib
+import importlib.util
+import logging
+import re
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from functools import cache
+from pathlib import Path
+
+from sqlalchemy import Column, DateTime, Float, Integer, MetaData, String, Table, select
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.exc import SQLAlchemyError
+
+from config import MIGRATIONS_LOCK_TIMEOUT
+
+logger = logging.getLogger(__name__)
+
+MIGRATIONS_DIR = Path(__file__).resolve().parent
+_FILENAME = re.compile(r"^(\d{3})_(\w+)\.(sql|py)$")
+_ADVISORY_LOCK_ID = 0x6D6967726174  # "migrat"
+
+_metadata = MetaData()
+schema_migrations = Table(
+    "schema_migrations", _metadata,
+    Column("version", Integer, primary_key=True, autoincrement=False),
+    Column("name", String(200), nullable=False),
+    Column("checksum", String(64), nullable=False),
+    Column("applied_at", DateTime, nullable=False),
+    Column("execution_ms", Float, nullable=True),
+)
+
+
+class MigrationError(RuntimeError):
+    """A migration cannot be applied (failed statement, or unversioned database)."""
+
+
+@dataclass(frozen=True)
+class Migration:
+    version: int
+    name: str
+    path: Path
+
+    @property
+    def kind(self) -> str:
+        return self.path.suffix.lstrip(".")
+
+    @property
+    def checksum(self) -> str:
+        return hashlib.sha256(self.path.read_bytes()).hexdigest()
+
+    def __str__(self) -> str:
+        return self.path.name
+
+
+# ============= Discovery =============
+
+def discover(directory: Path = MIGRATIONS_DIR) -> list[Migration]:
+    migrations: dict[int, Migration] = {}
+    for path in sorted(directory.iterdir()):
+        match = _FILENAME.match(path.name)
+        if not match:
+            continue
+        version = int(match.group(1))
+        if version in migrations:
+            raise MigrationError(f"Duplicate migration version {version:03d}: {migrations[version]} and {path.name}")
+        migrations[version] = Migration(version, match.group(2), path)
+    return [migrations[v] for v in sorted(migrations)]
+
+
+@cache
+def latest_version() -> int:
+    """Newest migration version shipped with the code (read once per process)."""
+    migrations = discover()
+    return migrations[-1].version if migrations else 0
+
+
+def split_statements(sql: str) -> list[str]:
+    """
+    Split a SQL script into statements on top-level semicolons, skipping
+    semicolons inside comments, quoted strings/identifiers and $tag$ bodies.
+    """
+    statements, start, i, n = [], 0, 0, len(sql)
+    while i < n:
+        if sql.startswith("--", i):
+            end = sql.find("\n", i)
+            i = n if end == -1 else end + 1
+        elif sql.startswith("/*", i):
+            end = sql.find("*/", i + 2)
+            i = n if end == -1 else end + 2
+        elif sql[i] in "'\"":
+            quote = sql[i]
+            i += 1
+            while i < n:
+                if sql[i] == quote:
+                    if sql.startswith(quote * 2, i):  # escaped quote
+                        i += 2
+                        continue
+                    break
+                i += 1
+            i += 1
+        elif sql[i] == "$" and (tag := re.match(r"\$[A-Za-z_]*\$", sql[i:])):
+            end = sql.find(tag.group(0), i + len(tag.group(0)))
+            i = n if end == -1 else end + len(tag.group(0))
+        elif sql[i] == ";":
+            statements.append(sql[start:i])
+            start = i = i + 1
+        else:
+            i += 1
+    statements.append(sql[start:])
+    return [s.strip() for s in statements if _has_code(s)]
+
+
+def _has_code(statement: str) -> bool:
+    without_comments = re.sub(r"--[^\n]*|/\*.*?\*/", "", statement, flags=re.S)
+    return bool(without_comments.strip())
+
+
+# ============= Version Table =============
+
+def applied_migrations(engine: Engine) -> dict[int, dict]:
+    with engine.connect() as conn:
+        rows = conn.execute(select(schema_migrations)).mappings().all()
+    return {row["version"]: dict(row) for row in rows}
+
+
+def current_version(engine: Engine) -> int | None:
+    """Highest applied version, or None when the database is unversioned."""
+    try:
+        with engine.connect() as conn:
+            return conn.execute(select(schema_migrations.c.version).order_by(
+                schema_migrations.c.version.desc()).limit(1)).scalar() or 0
+    except SQLAlchemyError:
+        return None
+
+
+def _record(engine: Engine, migration: Migration, execution_ms: float | None) -> None:
+    with engine.begin() as conn:
+        conn.execute(schema_migrations.insert().values(
+            version=migration.version, name=migration.name, checksum=migration.checksum,
+            applied_at=datetime.now(timezone.utc).replace(tzinfo=None), execution_ms=execution_ms,
+        ))
+
+
+def _has_user_tables(engine: Engine) -> bool:
+    from sqlalchemy import inspect
+
+    return any(name != schema_migrations.name for name in inspect(engine).get_table_names())
+
+
+# ============= Apply =============
+
+def _run_sql(engine: Engine, migration: Migration) -> None:
+    statements = split_statements(migration.path.read_text(encoding="utf-8"))
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        # Raw DBAPI cursor: no parameter interpolation of '%' in the scripts
+        cursor = conn.connection.dbapi_connection.cursor()
+        try:
+            if MIGRATIONS_LOCK_TIMEOUT:
+                cursor.execute(f"SET lock_timeout = '{MIGRATIONS_LOCK_TIMEOUT}'")
+            for statement in statements:
+                try:
+                    cursor.execute(statement)
+                except Exception as exc:
+                    raise MigrationError(f"{migration} failed at:\n{statement}\n{exc}") from exc
+        finally:
+            cursor.close()
+
+
+def _run_python(engine: Engine, migration: Migration) -> None:
+    spec = importlib.util.spec_from_file_location(f"migrations.m{migration.version:03d}", migration.path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    with engine.begin() as conn:
+        module.upgrade(conn)
+
+
+def _advisory_lock(engine: Engine) -> Connection | None:
+    if engine.dialect.name != "postgresql":
+        return None
+    conn = engine.connect().execution_options(isolation_level="AUTOCOMMIT")
+    conn.exec_driver_sql(f"SELECT pg_advisory_lock({_ADVISORY_LOCK_ID})")
+    return conn
+
+
+def _bootstrap(engine: Engine) -> list[Migration]:
+    """
+    Empty database: the baseline builds the current model schema in one step,
+    so every later migration is recorded as applied without running it.
+    """
+    _metadata.create_all(bind=engine)
+    baseline, *rest = discover()
+    start = time.perf_counter()
+    _run_python(engine, baseline)
+    _record(engine, baseline, (time.perf_counter() - start) * 1000)
+    for migration in rest:
+        _record(engine, migration, None)
+    logger.info("Created schema from %s (version %03d)", baseline, latest_version())
+    return [baseline]
+
+
+def upgrade(engine: Engine, target: int | None = None) -> list[Migration]:
+    """Apply pending migrations up to `target` (default: all). Returns those applied."""
+    lock = _advisory_lock(engine)
+    try:
+        if current_version(engine) is None:
+            if _has_user_tables(engine):
+                raise MigrationError(
+                    "Database has tables but no schema_migrations table. Record the migrations "
+                    "already applied by hand first: python -m migrations stamp <version>"
+                )
+            return _bootstrap(engine)
+
+        done = applied_migrations(engine)
+        applied = []
+        for migration in discover():
+            if migration.version in done or (target is not None and migration.version > target):
+                continue
+            start = time.perf_counter()
+            if migration.kind == "py":
+                _run_python(engine, migration)
+                elapsed = (time.perf_counter() - start) * 1000
+            elif engine.dialect.name == "postgresql":
+                _run_sql(engine, migration)
+                elapsed = (time.perf_counter() - start) * 1000
+            else:
+                elapsed = None  # PostgreSQL-only script; recorded as applied
+            _record(engine, migration, elapsed)
+            applied.append(migration)
+            logger.info("Applied migration %s%s", migration, "" if elapsed is not None else " (skipped: not PostgreSQL)")
+        return applied
+    finally:
+        if lock is not None:
+            lock.exec_driver_sql(f"SELECT pg_advisory_unlock({_ADVISORY_LOCK_ID})")
+            lock.close()
+
+
+def stamp(engine: Engine, version: int) -> list[Migration]:
+    """Record every migration up to `version` as applied without running it."""
+    _metadata.create_all(bind=engine)
+    done = applied_migrations(engine)
+    stamped = [m for m in discover() if m.version <= version and m.version not in done]
+    for migration in stamped:
+        _record(engine, migration, None)
+    return stamped
+
+
+def check_schema_version(engine: Engine) -> int | None:
+    """
+    Startup check: one query for the recorded version, logged against the
+    newest migration file. Never modifies the database.
+    """
+    expected = latest_version()
+    current = current_version(engine)
+    if current is None:
+        logger.warning("Database schema is unversioned; run `python -m migrations upgrade` "
+                       "(or `stamp` for a database migrated by hand)")
+    elif current < expected:
+        logger.warning("Database schema is at version %03d but the code expects %03d; "
+                       "run `python -m migrations upgrade`", current, expected)
+    elif current > expected:
+        logger.warning("Database schema version %03d is newer than this code (%03d)", current, expected)
+    return current
@@ -3,10 +3,55 @@
 -- Generated automatically from src/data/projectsData.tsx
 -- ============================================================================
 
+-- Rows are written in the flat pre-008 layout to a temporary staging table,
+-- then split into projects / project_details at the end of the script
+-- (migration 008_split_project_details.py).
+-- ============================================================================
+CREATE TEMP TABLE projects_seed (
+    id                  INTEGER PRIMARY KEY,
+    title               VARCHAR(200)        NOT NULL,
+    description         VARCHAR(1000)       NOT NULL,
+    long_description    TEXT                NOT NULL,
+    image               TEXT                NOT NULL,
+    type                VARCHAR(100)        NOT NULL,
+    category            project_category    NOT NULL,
+    role                VARCHAR(100)        NOT NULL,
+    duration            VARCHAR(100)        NOT NULL,
+    tags                JSONB               NOT NULL DEFAULT '[]'::jsonb,
+    objectives          JSONB               NOT NULL DEFAULT '[]'::jsonb,
+    technologies        JSONB               NOT NULL DEFAULT '[]'::jsonb,
+    methods             JSONB               NOT NULL DEFAULT '[]'::jsonb,
+    results             JSONB               NOT NULL DEFAULT '[]'::jsonb,
+    tldr                TEXT,
+    problem_statement   TEXT,
+    literature_review   TEXT,
+    code_snippet        TEXT,
+    standings           TEXT,
+    company             VARCHAR(200),
+    github_link         TEXT,
+    article_link        TEXT,
+    live_demo_link      TEXT,
+    key_impact_metrics  JSONB,
+    core_stack          JSONB,
+    tools               JSONB,
+    implementation      JSONB,
+    discussion          JSONB,
+    conclusion          JSONB,
+    limitations         JSONB,
+    future_work         JSONB,
+    "references"        JSONB,
+    acknowledgements    JSONB,
+    challenges          JSONB,
+    solutions           JSONB,
+    gallery_images      JSONB,
+    similar_project_ids JSONB,
+    updated_at          TIMESTAMP
+);
+
 -- ============================================================================
 -- Project 1: General Championship Data Analytics - Social and Healthcare Risk Scorecard
 -- ============================================================================
-INSERT INTO projects (
+INSERT INTO projects_seed (
     id,
     title,
     description,
@@ -129,7 +174,7 @@ ON CONFLICT (id) DO UPDATE SET
 -- ============================================================================
 -- Project 2: Open IIT Data Analytics Competition - Footfall Prediction
 -- ============================================================================
-INSERT INTO projects (
+INSERT INTO projects_seed (
     id,
     title,
     description,
@@ -257,7 +302,7 @@ ON CONFLICT (id) DO UPDATE SET
 -- ============================================================================
 -- Project 3: FUGACITY Fest Website Development
 -- ============================================================================
-INSERT INTO projects (
+INSERT INTO projects_seed (
     id,
     title,
     description,
@@ -403,7 +448,7 @@ ON CONFLICT (id) DO UPDATE SET
 -- ============================================================================
 -- Project 4: Responsive Portfolio Website
 -- ============================================================================
-INSERT INTO projects (
+INSERT INTO projects_seed (
     id,
     title,
     description,
@@ -537,7 +582,7 @@ ON CONFLICT (id) DO UPDATE SET
 -- ============================================================================
 -- Project 5: Multimodal Price Prediction using Text, Image, and Tabular Data
 -- ============================================================================
-INSERT INTO projects (
+INSERT INTO projects_seed (
     id,
     title,
     description,
@@ -664,7 +709,7 @@ ON CONFLICT (id) DO UPDATE SET
 -- ============================================================================
 -- Project 6: Deep Learning Based Text Summarization System
 -- ============================================================================
-INSERT INTO projects (
+INSERT INTO projects_seed (
     id,
     title,
     description,
@@ -789,7 +834,7 @@ ON CONFLICT (id) DO UPDATE SET
 -- ============================================================================
 -- Project 7: Advanced Process Modelling & Simulation | IIT Kharagpur
 -- ============================================================================
-INSERT INTO projects (
+INSERT INTO projects_seed (
     id,
     title,
     description,
@@ -913,7 +958,7 @@ ON CONFLICT (id) DO UPDATE SET
 -- ============================================================================
 -- Project 8: Transport Analysis of Electrochemical Conversion of Carbon-dioxide to Methanol
 -- ============================================================================
-INSERT INTO projects (
+INSERT INTO projects_seed (
     id,
     title,
     description,
@@ -1036,7 +1081,7 @@ ON CONFLICT (id) DO UPDATE SET
 -- ============================================================================
 -- Project 9: Conversational AI Platform for Employee Welfare
 -- ============================================================================
-INSERT INTO projects (
+INSERT INTO projects_seed (
     id,
     title,
     description,
@@ -1160,7 +1205,7 @@ ON CONFLICT (id) DO UPDATE SET
 -- ============================================================================
 -- Project 10: DocuReason RAG: Multimodal Document Retrieval & Reasoning Framework
 -- ============================================================================
-INSERT INTO projects (
+INSERT INTO projects_seed (
     id,
     title,
     description,
@@ -1282,3 +1327,71 @@ ON CONFLICT (id) DO UPDATE SET
     similar_project_ids = EXCLUDED.similar_project_ids,
     updated_at = CURRENT_TIMESTAMP;
 
+
+-- ============================================================================
+-- Split the staged rows into projects / project_details
+-- ============================================================================
+INSERT INTO projects (
+    id, title, description, image, type, category, role, duration,
+    tags, objectives, technologies, methods, results,
+    tldr, standings, company, github_link, article_link, live_demo_link,
+    key_impact_metrics, core_stack, tools, similar_project_ids
+)
+SELECT
+    id, title, description, image, type, category, role, duration,
+    tags, objectives, technologies, methods, results,
+    tldr, standings, company, github_link, article_link, live_demo_link,
+    key_impact_metrics, core_stack, tools, similar_project_ids
+FROM projects_seed
+ON CONFLICT (id) DO UPDATE SET
+    title = EXCLUDED.title,
+    description = EXCLUDED.description,
+    image = EXCLUDED.image,
+    type = EXCLUDED.type,
+    category = EXCLUDED.category,
+    role = EXCLUDED.role,
+    duration = EXCLUDED.duration,
+    tags = EXCLUDED.tags,
+    objectives = EXCLUDED.objectives,
+    technologies = EXCLUDED.technologies,
+    methods = EXCLUDED.methods,
+    results = EXCLUDED.results,
+    tldr = EXCLUDED.tldr,
+    standings = EXCLUDED.standings,
+    company = EXCLUDED.company,
+    github_link = EXCLUDED.github_link,
+    article_link = EXCLUDED.article_link,
+    live_demo_link = EXCLUDED.live_demo_link,
+    key_impact_metrics = EXCLUDED.key_impact_metrics,
+    core_stack = EXCLUDED.core_stack,
+    tools = EXCLUDED.tools,
+    similar_project_ids = EXCLUDED.similar_project_ids,
+    updated_at = CURRENT_TIMESTAMP;
+
+INSERT INTO project_details (
+    project_id, long_description, problem_statement, literature_review, code_snippet,
+    implementation, discussion, conclusion, limitations, future_work,
+    "references", acknowledgements, challenges, solutions, gallery_images
+)
+SELECT
+    id, long_description, problem_statement, literature_review, code_snippet,
+    implementation, discussion, conclusion, limitations, future_work,
+    "references", acknowledgements, challenges, solutions, gallery_images
+FROM projects_seed
+ON CONFLICT (project_id) DO UPDATE SET
+    long_description = EXCLUDED.long_description,
+    problem_statement = EXCLUDED.problem_statement,
+    literature_review = EXCLUDED.literature_review,
+    code_snippet = EXCLUDED.code_snippet,
+    implementation = EXCLUDED.implementation,
+    discussion = EXCLUDED.discussion,
+    conclusion = EXCLUDED.conclusion,
+    limitations = EXCLUDED.limitations,
+    future_work = EXCLUDED.future_work,
+    "references" = EXCLUDED."references",
+    acknowledgements = EXCLUDED.acknowledgements,
+    challenges = EXCLUDED.challenges,
+    solutions = EXCLUDED.solutions,
+    gallery_images = EXCLUDED.gallery_images;
+
+DROP TABLE projects_seed;
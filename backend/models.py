@@ -8,14 +8,22 @@ from sqlalchemy import (
     DateTime,
     Enum,
     Float,
+    ForeignKey,
+    Index,
     Integer,
     String,
     Text,
+    text,
 )
-from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.dialects.postgresql import JSONB as PG_JSONB
+from sqlalchemy.ext.associationproxy import association_proxy
+from sqlalchemy.orm import relationship
 
 from database import Base
 
+# JSONB on PostgreSQL, plain JSON elsewhere (lets SQLite benchmarks/tests create every table)
+JSONB = JSON().with_variant(PG_JSONB(), "postgresql")
+
 
 def _utcnow():
     """Timezone-aware UTC now (replaces deprecated datetime.utcnow)."""
@@ -31,11 +39,56 @@ class ProjectCategoryEnum(str, enum.Enum):
     CHEMICAL_RESEARCH = "chemical-research"
 
 
-# ============= Project Model =============
+# ============= Project Models =============
+
+class ProjectDetailModel(Base):
+    """
+    Long-form write-up sections of a project, one row per project.
+
+    Kept out of `projects` so list scans don't drag tens of KB of TOASTed
+    text per row through the buffer cache; read through ProjectModel's
+    proxies below (migrations/008_split_project_details.py).
+    """
+    __tablename__ = "project_details"
+
+    project_id = Column(Integer, ForeignKey("projects.id", ondelete="CASCADE"), primary_key=True)
+
+    long_description = Column(Text, nullable=False)
+    problem_statement = Column(Text, nullable=True)
+    literature_review = Column(Text, nullable=True)
+    code_snippet = Column(Text, nullable=True)
+
+    implementation = Column(JSONB, nullable=True)
+    discussion = Column(JSONB, nullable=True)
+    conclusion = Column(JSONB, nullable=True)
+    limitations = Column(JSONB, nullable=True)
+    future_work = Column(JSONB, nullable=True)
+    # "references" is a reserved word in PG; SQLAlchemy quotes it
+    references = Column("references", JSONB, nullable=True)
+    acknowledgements = Column(JSONB, nullable=True)
+    challenges = Column(JSONB, nullable=True)
+    solutions = Column(JSONB, nullable=True)
+    gallery_images = Column(JSONB, nullable=True)
+
+
+# Columns of project_details other than the key, in table order
+PROJECT_DETAIL_COLUMNS: tuple[str, ...] = tuple(
+    c.name for c in ProjectDetailModel.__table__.columns if c.name != "project_id"
+)
+
+
+def _detail(name: str):
+    """Project attribute stored on its ProjectDetailModel row (created on first assignment)."""
+    return association_proxy("details", name, creator=lambda value: ProjectDetailModel(**{name: value}))
+
 
 class ProjectModel(Base):
     """SQLAlchemy model for the `projects` table (Neon PostgreSQL)."""
     __tablename__ = "projects"
+    __table_args__ = (
+        # Delta sync feed (services/sync.py): keyset scan over (updated_at, id)
+        Index("idx_projects_updated_at_id", "updated_at", "id"),
+    )
 
     # Primary key
     id = Column(Integer, primary_key=True, index=True)
@@ -43,7 +96,6 @@ class ProjectModel(Base):
     # Core required fields
     title = Column(String(200), nullable=False)
     description = Column(String(1000), nullable=False)
-    long_description = Column(Text, nullable=False)
     image = Column(Text, nullable=False)
     type = Column(String(100), nullable=False)
     category = Column(
@@ -66,9 +118,6 @@ class ProjectModel(Base):
 
     # Optional text fields
     tldr = Column(Text, nullable=True)
-    problem_statement = Column(Text, nullable=True)
-    literature_review = Column(Text, nullable=True)
-    code_snippet = Column(Text, nullable=True)
     standings = Column(Text, nullable=True)
     company = Column(String(200), nullable=True)
 
@@ -81,17 +130,6 @@ class ProjectModel(Base):
     key_impact_metrics = Column(JSONB, nullable=True)
     core_stack = Column(JSONB, nullable=True)
     tools = Column(JSONB, nullable=True)
-    implementation = Column(JSONB, nullable=True)
-    discussion = Column(JSONB, nullable=True)
-    conclusion = Column(JSONB, nullable=True)
-    limitations = Column(JSONB, nullable=True)
-    future_work = Column(JSONB, nullable=True)
-    # "references" is a reserved word in PG; column name is quoted in the migration
-    references = Column("references", JSONB, nullable=True)
-    acknowledgements = Column(JSONB, nullable=True)
-    challenges = Column(JSONB, nullable=True)
-    solutions = Column(JSONB, nullable=True)
-    gallery_images = Column(JSONB, nullable=True)
     similar_project_ids = Column(JSONB, nullable=True)
 
     # Audit timestamps
@@ -99,6 +137,24 @@ class ProjectModel(Base):
     updated_at = Column(DateTime, default=_utcnow,
                         onupdate=_utcnow, nullable=False)
 
+    # Heavy sections live in project_details, loaded on first access
+    # (use selectinload(ProjectModel.details) when reading many projects)
+    details = relationship(ProjectDetailModel, uselist=False, lazy="select", cascade="all, delete-orphan")
+    long_description = _detail("long_description")
+    problem_statement = _detail("problem_statement")
+    literature_review = _detail("literature_review")
+    code_snippet = _detail("code_snippet")
+    implementation = _detail("implementation")
+    discussion = _detail("discussion")
+    conclusion = _detail("conclusion")
+    limitations = _detail("limitations")
+    future_work = _detail("future_work")
+    references = _detail("references")
+    acknowledgements = _detail("acknowledgements")
+    challenges = _detail("challenges")
+    solutions = _detail("solutions")
+    gallery_images = _detail("gallery_images")
+
 
 # Status Enum for Lead Lifecycle
 class LeadStatus(str, enum.Enum):
@@ -122,6 +178,24 @@ class Priority(str, enum.Enum):
 
 class ContactLead(Base):
     __tablename__ = "contact_leads"
+    # Query indexes (migrations/006_query_indexes.sql); each is matched to a
+    # lead_service query and checked by benchmarks/bench_indexes.py
+    __table_args__ = (
+        # get_filtered_leads(status=...) ordered by newest, count_unread_leads
+        Index("idx_contact_leads_status_created_at", "status", "created_at"),
+        # get_filtered_leads(priority=..., min_score=...)
+        Index("idx_contact_leads_priority_quality_score", "priority", "quality_score"),
+        # get_lead_by_idempotency_key; legacy/manual leads have no key, so only keyed rows are indexed
+        Index("idx_contact_leads_idempotency_key_present", "idempotency_key", unique=True,
+              postgresql_where=text("idempotency_key IS NOT NULL"),
+              sqlite_where=text("idempotency_key IS NOT NULL")),
+        # get_source_breakdown (index-only GROUP BY)
+        Index("idx_contact_leads_source", "source"),
+        # filter_leads_by_date filters on the legacy timestamp column
+        Index("idx_contact_leads_timestamp", "timestamp"),
+        # Delta sync feed (services/sync.py): keyset scan over (updated_at, id)
+        Index("idx_contact_leads_updated_at_id", "updated_at", "id"),
+    )
 
     # Core Identity
     id = Column(Integer, primary_key=True, index=True)
@@ -139,7 +213,8 @@ class ContactLead(Base):
     message = Column(Text, nullable=False)
 
     # Lifecycle Management
-    status = Column(Enum(LeadStatus, values_callable=lambda x: [e.value for e in x]), default=LeadStatus.UNREAD.value, nullable=False, index=True)
+    # Indexed by idx_contact_leads_status_created_at (status is its leading column)
+    status = Column(Enum(LeadStatus, values_callable=lambda x: [e.value for e in x]), default=LeadStatus.UNREAD.value, nullable=False)
     priority = Column(Enum(Priority, values_callable=lambda x: [e.value for e in x]), default=Priority.MEDIUM.value, nullable=False)
 
     # "Honey Trap" Metadata - JSONB for flexible storage
@@ -169,10 +244,27 @@ class ContactLead(Base):
     # Source Attribution
     source = Column(String, default="contact_form")  # contact_form, linkedin, referral, etc.
 
+    # Duplicate-submission guard (see services/idempotency.py); NULL for manual/legacy rows
+    idempotency_key = Column(String(64), nullable=True)  # unique where set, see __table_args__
+
     # Deprecated field for backward compatibility
     timestamp = Column(DateTime, default=_utcnow)
 
 
+class SyncTombstoneModel(Base):
+    """Deleted row ids reported by the delta sync feeds (services/sync.py)."""
+    __tablename__ = "sync_tombstones"
+    __table_args__ = (
+        # tombstones_since / pruning: one entity, ordered by (deleted_at, entity_id)
+        Index("idx_sync_tombstones_entity_deleted_at", "entity", "deleted_at", "entity_id"),
+    )
+
+    id = Column(Integer, primary_key=True)
+    entity = Column(String(50), nullable=False)  # table name: projects, contact_leads
+    entity_id = Column(Integer, nullable=False)
+    deleted_at = Column(DateTime, default=_utcnow, nullable=False)
+
+
 class SiteSettingModel(Base):
     """SQLAlchemy model for application configuration & feature flags."""
     __tablename__ = "site_settings"
@@ -186,6 +278,10 @@ class SiteSettingModel(Base):
 class TelemetryEventModel(Base):
     """SQLAlchemy model for self-hosted real-time visitor event tracking."""
     __tablename__ = "telemetry_events"
+    __table_args__ = (
+        # Live visitors: COUNT(DISTINCT session_id) WHERE created_at >= cutoff, index-only
+        Index("idx_telemetry_events_created_at_session_id", "created_at", "session_id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     session_id = Column(String(100), index=True, nullable=False)
@@ -1,43 +1,45 @@
 """
 About/Profile public endpoint.
 Serves dynamic profile data from JSON for the About Me page.
-Data is loaded once at startup and cached in-memory.
+about.json is owned by `services.content_store.about_store`, which keeps the
+parsed data with its encoded/precompressed (brotli/gzip) bodies and ETag in
+memory, and reloads on admin saves or out-of-band edits.
 """
 import json
 import logging
-from pathlib import Path
 
 from fastapi import APIRouter, Request
-from fastapi.responses import JSONResponse
-from slowapi import Limiter
-from slowapi.util import get_remote_address
+
+from middleware.compression import PrecompressedJSON
+from services.content_store import about_store
+from services.snapshot_publisher import snapshot_publisher
+from utils.responses import FastJSONResponse
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/about", tags=["about"])
-limiter = Limiter(key_func=get_remote_address)
-
-DATA_FILE = Path(__file__).resolve().parent.parent / "data" / "about.json"
 
-# ── In-memory cache (loaded once at import time) ──
-_about_cache: dict | None = None
+# Static snapshot, republished when the admin editor saves (routes/site_settings.py)
+snapshot_publisher.register("about", lambda: about_store.get().body, source="/api/about")
 
 
 def _load_about_data() -> dict:
-    """Load about data from JSON file (with in-memory cache)."""
-    global _about_cache
-    if _about_cache is not None:
-        return _about_cache
-    with open(DATA_FILE, "r", encoding="utf-8") as f:
-        _about_cache = json.load(f)
-    logger.info("About data loaded from %s", DATA_FILE)
-    return _about_cache
+    """Current about data (content store; re-read only when the file changes)."""
+    return about_store.get().data
+
+
+def _encoded_about(data: dict) -> PrecompressedJSON:
+    """Encoded/compressed bodies and ETag for `data`, built once per store version."""
+    snapshot = about_store.peek()
+    if snapshot is not None and snapshot.data is data:
+        return snapshot.body
+    return PrecompressedJSON(data)
 
 
 @router.get(
     "",
     summary="Get About Me data (public)",
-    response_class=JSONResponse,
+    response_class=FastJSONResponse,
 )
 async def get_about_data(request: Request):
     """
@@ -46,14 +48,18 @@ async def get_about_data(request: Request):
     """
     try:
         data = _load_about_data()
-        return JSONResponse(content=data, headers={"Cache-Control": "public, max-age=3600"})
+        return _encoded_about(data).response(
+            request.headers.get("accept-encoding", ""),
+            headers={"Cache-Control": "public, max-age=3600"},
+            if_none_match=request.headers.get("if-none-match"),
+        )
     except FileNotFoundError:
-        return JSONResponse(
+        return FastJSONResponse(
             content={"error": "About data not found"},
             status_code=404,
         )
     except json.JSONDecodeError:
-        return JSONResponse(
+        return FastJSONResponse(
             content={"error": "Invalid about data format"},
             status_code=500,
         )
@@ -1,12 +1,10 @@
 """Authentication endpoints with JWT support and rate limiting."""
 from fastapi import APIRouter, Depends, Form, Request
-from slowapi import Limiter
-from slowapi.util import get_remote_address
 
 from services.auth_service_v2 import authenticate_admin, require_admin
+from services.rate_limiter import limiter
 
 router = APIRouter(prefix="/api/admin", tags=["auth"])
-limiter = Limiter(key_func=get_remote_address)
 
 # Auth-specific stricter rate limit to prevent brute-force
 _AUTH_RATE_LIMIT = "5/minute"
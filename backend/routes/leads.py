@@ -1,10 +1,8 @@
 """Lead management endpoints with rate limiting and JWT auth"""
 import csv
 import io
-import json
 import logging
 
-from email_validator import EmailNotValidError, validate_email
 from fastapi import (
     APIRouter,
     BackgroundTasks,
@@ -12,18 +10,16 @@ from fastapi import (
     Depends,
     Form,
     HTTPException,
+    Query,
     Request,
     status,
 )
 from fastapi.responses import StreamingResponse
-from slowapi import Limiter
-from slowapi.util import get_remote_address
 from sqlalchemy.orm import Session
-from starlette.concurrency import run_in_threadpool
 
 import database
 import models
-from config import ADMIN_EMAIL, RATE_LIMIT_ADMIN, RATE_LIMIT_PUBLIC, VITE_API_URL
+from config import ADMIN_EMAIL, RATE_LIMIT_ADMIN, VITE_API_URL
 from schemas.lead import (
     BulkStatusUpdate,
     NotesUpdate,
@@ -39,9 +35,19 @@ from services.email_service import (
     send_cv_request_email,
     send_recruiter_login_email,
 )
+from services.email_validation import EmailNotValidError, validate_email_address
+from services.idempotency import (
+    IDEMPOTENCY_HEADER,
+    REPLAY_HEADER,
+    DuplicateSubmissionError,
+    submission_cache,
+    submission_keys,
+)
+from services.lead_scoring import is_spam_lead
 from services.lead_service import (
     bulk_delete_leads,
     bulk_update_status,
+    count_unread_leads,
     create_contact_lead,
     delete_lead,
     filter_leads_by_date,
@@ -49,7 +55,9 @@ from services.lead_service import (
     get_all_leads,
     get_filtered_leads,
     get_lead_by_id,
+    get_lead_changes,
     get_lead_statistics,
+    get_leads_page,
     search_leads,
     unflag_lead,
     update_lead_notes,
@@ -58,21 +66,20 @@ from services.lead_service import (
     update_lead_status,
     update_lead_tags,
 )
+from services.metrics import run_in_threadpool
+from services.rate_limiter import ROUTE_COSTS, get_real_ip, limiter, public_budget
+from services.sync import SyncCursor
+from utils.responses import FastJSONResponse
 from utils.serializers import serialize_contact_lead
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api", tags=["leads"])
-limiter = Limiter(key_func=get_remote_address)
 
 
-def _validate_contact_payload(name: str, email: str, subject: str, message: str) -> None:
+async def _validate_contact_payload(name: str, email: str, subject: str, message: str) -> None:
     """Basic validation to prevent malformed or abusive submissions."""
-    try:
-        validate_email(email)
-    except EmailNotValidError as exc:  # pragma: no cover - runtime validation
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
-
+    # Cheap length checks first so oversized payloads never trigger a DNS lookup
     if len(subject) > 300:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Subject too long (max 300 chars)")
     if len(message) > 5000:
@@ -80,11 +87,32 @@ def _validate_contact_payload(name: str, email: str, subject: str, message: str)
     if len(name) > 200:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Name too long (max 200 chars)")
 
+    try:
+        await validate_email_address(email)
+    except EmailNotValidError as exc:  # pragma: no cover - runtime validation
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
+
+
+def _contact_response(lead_id: int) -> dict:
+    return {
+        "status": "success",
+        "id": lead_id,
+        "message": "Inquiry logged and acknowledgment dispatched."
+    }
+
+
+_CV_REQUEST_RESPONSE = {"status": "success", "detail": "Dispatch sequence initiated via Resend API"}
+
+
+def _replay(body: dict) -> FastJSONResponse:
+    """Return the original response of a duplicate submission, flagged as a replay."""
+    return FastJSONResponse(content=body, headers={REPLAY_HEADER: "true"})
+
 
 # ============= PUBLIC ENDPOINTS =============
 
 @router.post("/submit-contact")
-@limiter.limit(RATE_LIMIT_PUBLIC)
+@public_budget(ROUTE_COSTS["contact"])
 async def submit_contact(
     request: Request,
     background_tasks: BackgroundTasks,
@@ -100,14 +128,24 @@ async def submit_contact(
     """
     Submit a contact form inquiry.
     Saves lead to database with metadata and sends acknowledgment email asynchronously.
-    Rate limited to prevent spam.
+    Rate limited by cost (DB write + two emails) to prevent spam.
+    Duplicate submissions (same Idempotency-Key, or same content within the
+    idempotency window) replay the original response without writes or emails.
     """
-    _validate_contact_payload(name=name, email=email, subject=subject, message=message)
+    idem_key, *earlier_keys = submission_keys(
+        models.LeadType.CONTACT.value, email, subject, message,
+        header_key=request.headers.get(IDEMPOTENCY_HEADER),
+    )
+    replayed = submission_cache.find((idem_key, *earlier_keys))
+    if replayed is not None:
+        return _replay(replayed)
+
+    await _validate_contact_payload(name=name, email=email, subject=subject, message=message)
 
     try:
         # Capture "Honey Trap" metadata
         metadata = {
-            "ip_address": request.client.host,
+            "ip_address": get_real_ip(request),
             "user_agent": request.headers.get("user-agent", ""),
             "referer": request.headers.get("referer", ""),
             "origin": request.headers.get("origin", ""),
@@ -126,11 +164,24 @@ async def submit_contact(
             role,
             metadata,
             models.LeadType.CONTACT,
+            idem_key,
+            earlier_keys,
         )
+    except DuplicateSubmissionError as dup:
+        body = _contact_response(dup.lead.id)
+        submission_cache.put(idem_key, body)
+        return _replay(body)
     except Exception as e:
         logger.error("Database error in submit_contact: %s", e, exc_info=True)
         raise HTTPException(status_code=500, detail="Failed to save contact")
 
+    body = _contact_response(new_lead.id)
+    submission_cache.put(idem_key, body)
+
+    # Obvious spam is kept for review but never spends email quota
+    if is_spam_lead(new_lead):
+        return body
+
     # ── Dispatch the right email based on role ──
     is_recruiter = role and role.strip().lower() == "recruiter"
 
@@ -171,15 +222,11 @@ async def submit_contact(
             metadata=metadata,
         )
 
-    return {
-        "status": "success",
-        "id": new_lead.id,
-        "message": "Inquiry logged and acknowledgment dispatched."
-    }
+    return body
 
 
 @router.post("/v1/request-cv")
-@limiter.limit(RATE_LIMIT_PUBLIC)
+@public_budget(ROUTE_COSTS["cv_request"])
 async def handle_cv_request(
     request: Request,
     background_tasks: BackgroundTasks,
@@ -194,20 +241,29 @@ async def handle_cv_request(
     """
     Submit a CV request.
     Saves lead to database and sends CV with email asynchronously.
-    Rate limited to prevent abuse.
+    Rate limited by cost (DB write + PDF email) to prevent abuse.
+    Duplicate submissions replay the original response without re-sending the CV.
     """
-    _validate_contact_payload(name=name, email=email, subject=subject, message=message)
+    idem_key, *earlier_keys = submission_keys(
+        models.LeadType.CV_REQUEST.value, email, subject, message,
+        header_key=request.headers.get(IDEMPOTENCY_HEADER),
+    )
+    replayed = submission_cache.find((idem_key, *earlier_keys))
+    if replayed is not None:
+        return _replay(replayed)
+
+    await _validate_contact_payload(name=name, email=email, subject=subject, message=message)
 
     try:
         # Capture metadata
         metadata = {
-            "ip_address": request.client.host,
+            "ip_address": get_real_ip(request),
             "user_agent": request.headers.get("user-agent", ""),
             "referer": request.headers.get("referer", ""),
         }
 
         # Save lead to database
-        await run_in_threadpool(
+        new_lead = await run_in_threadpool(
             create_contact_lead,
             db,
             name,
@@ -219,11 +275,22 @@ async def handle_cv_request(
             role,
             metadata,
             models.LeadType.CV_REQUEST,
+            idem_key,
+            earlier_keys,
         )
+    except DuplicateSubmissionError:
+        submission_cache.put(idem_key, _CV_REQUEST_RESPONSE)
+        return _replay(_CV_REQUEST_RESPONSE)
     except Exception as e:
         logger.error("Database error in handle_cv_request: %s", e, exc_info=True)
         raise HTTPException(status_code=500, detail="Failed to save CV request")
 
+    submission_cache.put(idem_key, _CV_REQUEST_RESPONSE)
+
+    # Obvious spam is kept for review but never receives the CV
+    if is_spam_lead(new_lead):
+        return _CV_REQUEST_RESPONSE
+
     # Send CV email asynchronously
     background_tasks.add_task(
         send_cv_request_email,
@@ -248,7 +315,7 @@ async def handle_cv_request(
             metadata=metadata,
         )
 
-    return {"status": "success", "detail": "Dispatch sequence initiated via Resend API"}
+    return _CV_REQUEST_RESPONSE
 
 
     # ============= ADMIN ENDPOINTS =============
@@ -265,16 +332,15 @@ async def get_admin_leads(
     """Get leads with optional pagination (admin only)"""
     if page is not None and per_page is not None:
         skip = (page - 1) * per_page
-        leads = get_all_leads(db, skip=skip, limit=per_page)
-        total = db.query(models.ContactLead).count()
-        return {
+        leads, total = get_leads_page(db, skip=skip, limit=per_page)
+        return FastJSONResponse({
             "leads": leads,
             "total": total,
             "page": page,
             "per_page": per_page,
             "total_pages": (total + per_page - 1) // per_page
-        }
-    return get_all_leads(db)
+        })
+    return FastJSONResponse(get_all_leads(db))
 
 
 @router.get("/admin/leads/stats")
@@ -295,7 +361,7 @@ async def search_leads_endpoint(
     admin: dict = Depends(require_admin),
     db: Session = Depends(database.get_db)
 ):
-    return search_leads(db, q)
+    return FastJSONResponse(search_leads(db, q))
 
 
 @router.get("/admin/analytics/timeline")
@@ -344,12 +410,12 @@ async def filter_leads_endpoint(
     admin: dict = Depends(require_admin),
     db: Session = Depends(database.get_db)
 ):
-    return filter_leads_by_date(db, start_date, end_date)
+    return FastJSONResponse(filter_leads_by_date(db, start_date, end_date))
 
 
 
 @router.get("/admin/leads/export")
-@limiter.limit(RATE_LIMIT_ADMIN)
+@limiter.limit(RATE_LIMIT_ADMIN, cost=ROUTE_COSTS["export"])
 async def export_leads(
     request: Request,
     format: str = "csv",
@@ -359,8 +425,7 @@ async def export_leads(
     leads = get_all_leads(db)
 
     if format == "json":
-        output = json.dumps(leads)
-        return StreamingResponse(iter([output]), media_type="application/json")
+        return FastJSONResponse(leads)
 
     # Default CSV
     output = io.StringIO()
@@ -417,7 +482,33 @@ async def get_filtered_leads_endpoint(
     db: Session = Depends(database.get_db)
 ):
     """Get leads with optional filters (admin only)"""
-    return get_filtered_leads(db, status=status, priority=priority, min_score=min_score)
+    return FastJSONResponse(get_filtered_leads(db, status=status, priority=priority, min_score=min_score))
+
+
+@router.get("/admin/leads/unread-count")
+async def get_unread_leads_count(
+    admin: dict = Depends(require_admin),
+    db: Session = Depends(database.get_db)
+):
+    """Real-time badge counter for unread leads."""
+    return {"unread_count": count_unread_leads(db)}
+
+
+@router.get("/admin/leads/changes")
+@limiter.limit(RATE_LIMIT_ADMIN)
+async def lead_changes_endpoint(
+    request: Request,
+    since: str | None = Query(None, description="Cursor from the previous response; omit for a full sync"),
+    limit: int = Query(500, ge=1, le=1000),
+    admin: dict = Depends(require_admin),
+    db: Session = Depends(database.get_db)
+):
+    """Leads created, updated or deleted after `since` (delta sync for the admin panel's lead cache)"""
+    try:
+        cursor = SyncCursor.parse(since) if since else None
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid since cursor")
+    return FastJSONResponse(get_lead_changes(db, cursor, limit))
 
 
 @router.get("/admin/leads/{lead_id}")
@@ -580,18 +671,6 @@ async def bulk_update_status_endpoint(
     return {"status": f"Updated {updated_count} leads"}
 
 
-@router.get("/admin/leads/unread-count")
-async def get_unread_leads_count(
-    admin: dict = Depends(require_admin),
-    db: Session = Depends(database.get_db)
-):
-    """Real-time badge counter for unread leads."""
-    unread_count = db.query(models.ContactLead).filter(
-        models.ContactLead.status == models.LeadStatus.UNREAD
-    ).count()
-    return {"unread_count": unread_count}
-
-
 @router.post("/admin/leads/{lead_id}/reply")
 @limiter.limit(RATE_LIMIT_ADMIN)
 async def reply_to_lead_endpoint(
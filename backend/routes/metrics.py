@@ -0,0 +1,27 @@
+"""Prometheus scrape endpoint for the in-process metrics in services/metrics.py"""
+import hmac
+
+from fastapi import APIRouter, HTTPException, Request, status
+from fastapi.responses import PlainTextResponse
+
+from config import METRICS_TOKEN
+from services.metrics import render_prometheus
+
+router = APIRouter(tags=["metrics"])
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+@router.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+async def metrics(request: Request):
+    """
+    Per-route latency, query counts, threadpool and email metrics for this
+    worker. Opt-in: the endpoint does not exist (404) until METRICS_TOKEN is
+    set, and scrapers must send it as a bearer token.
+    """
+    if not METRICS_TOKEN:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+    supplied = request.headers.get("authorization", "").removeprefix("Bearer ").strip()
+    if not hmac.compare_digest(supplied.encode(), METRICS_TOKEN.encode()):
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid metrics token")
+    return PlainTextResponse(render_prometheus(), media_type=PROMETHEUS_CONTENT_TYPE)
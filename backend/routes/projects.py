@@ -3,50 +3,91 @@ Project management endpoints with JWT auth.
 Admin-only CRUD operations + public read endpoint for portfolio frontend.
 """
 import logging
-import time
 
-from fastapi import APIRouter, Depends, HTTPException, Request, status
-from fastapi.responses import JSONResponse
-from slowapi import Limiter
-from slowapi.util import get_remote_address
-
-from config import RATE_LIMIT_ADMIN, RATE_LIMIT_PUBLIC
-from schemas.project import ProjectCreate, ProjectResponse, ProjectUpdate
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+
+from config import RATE_LIMIT_ADMIN
+from middleware.compression import PrecompressedJSON
+from schemas.project import (
+    ProjectChangesResponse,
+    ProjectCreate,
+    ProjectResponse,
+    ProjectSearchResponse,
+    ProjectUpdate,
+)
 from services.auth_service_v2 import require_admin
+from services.cache_bus import invalidation_bus
+from services.project_search import ProjectSearchIndex
 from services.project_service import (
     create_project,
     delete_project,
     get_all_projects,
     get_project_by_id,
+    get_project_changes,
     get_version_info,
     update_project,
 )
+from services.rate_limiter import ROUTE_COSTS, limiter, public_budget
+from services.shared_cache import SharedEntry, shared_cache
+from services.snapshot_publisher import snapshot_publisher
+from services.sync import SyncCursor
+from utils.responses import FastJSONResponse, dump_json
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/admin/projects", tags=["projects"])
-limiter = Limiter(key_func=get_remote_address)
 
-# ── Simple TTL cache for public project list ──
-_projects_cache: dict = {"data": None, "expires": 0}
-_CACHE_TTL = 300  # 5 minutes
+# ── Public project list cache ──
+# Serialized once per host in the shared cache tier (one worker refreshes it
+# for all). Admin edits invalidate it everywhere through the cache bus, so the
+# TTL only bounds staleness if an invalidation message is lost
+_CACHE_KEY = "projects"
+_CACHE_TTL = 3600  # 1 hour
+
+
+def _load_projects_body() -> bytes:
+    return dump_json(get_all_projects())
+
+
+def _cached_projects_entry() -> SharedEntry:
+    invalidation_bus.poll()
+    return shared_cache.get(_CACHE_KEY, _load_projects_body, ttl=_CACHE_TTL)
+
+
+def _get_cached_projects() -> bytes:
+    """Return the cached project list as JSON bytes, refreshing from DB when stale."""
+    return _cached_projects_entry().body
+
 
+# Search index over the cached list, rebuilt when the shared entry changes
+_search_index: tuple[tuple[int, float], ProjectSearchIndex] | None = None
 
-def _get_cached_projects() -> list[dict]:
-    """Return cached projects or refresh from DB."""
-    now = time.time()
-    if _projects_cache["data"] is not None and now < _projects_cache["expires"]:
-        return _projects_cache["data"]
-    data = get_all_projects()
-    _projects_cache["data"] = data
-    _projects_cache["expires"] = now + _CACHE_TTL
-    return data
+
+def _get_search_index() -> ProjectSearchIndex:
+    global _search_index
+    entry = _cached_projects_entry()
+    key = (entry.version, entry.created_at)
+    if _search_index is None or _search_index[0] != key:
+        _search_index = (key, ProjectSearchIndex(orjson.loads(entry.body)))
+    return _search_index[1]
+
+
+def _clear_projects_cache(published_at: float | None = None) -> None:
+    shared_cache.invalidate(_CACHE_KEY, published_at)
 
 
 def _invalidate_projects_cache() -> None:
-    """Clear the project cache (called after create/update/delete)."""
-    _projects_cache["data"] = None
-    _projects_cache["expires"] = 0
+    """
+    Clear the project cache in every worker and republish the static
+    snapshot (called after create/update/delete).
+    """
+    invalidation_bus.publish(_CACHE_KEY)
+    snapshot_publisher.schedule(_CACHE_KEY)
+
+
+invalidation_bus.subscribe(_CACHE_KEY, _clear_projects_cache)
+snapshot_publisher.register(_CACHE_KEY, lambda: PrecompressedJSON(get_all_projects()), source="/api/projects")
 
 
 # ============= Separate Public Router (no /admin prefix) =============
@@ -58,14 +99,14 @@ public_router = APIRouter(prefix="/api/projects", tags=["projects-public"])
     "/version",
     summary="Get projects version info (lightweight freshness check)",
 )
-@limiter.limit(RATE_LIMIT_PUBLIC)
+@public_budget(ROUTE_COSTS["cached_read"])
 async def projects_version(request: Request):
     """
     Lightweight endpoint that returns project count and last updated timestamp.
     Used by the frontend to decide whether to re-fetch the full project list.
     """
     info = get_version_info()
-    response = JSONResponse(content=info)
+    response = FastJSONResponse(content=info)
     response.headers["Cache-Control"] = "public, max-age=60"
     return response
 
@@ -75,17 +116,72 @@ async def projects_version(request: Request):
     response_model=list[ProjectResponse],
     summary="Get all projects (public)",
 )
-@limiter.limit(RATE_LIMIT_PUBLIC)
+@public_budget(ROUTE_COSTS["cached_read"])
 async def list_projects_public_clean(request: Request):
     """
     Public endpoint at /api/projects — returns all projects for the
     portfolio frontend. No authentication required.
-    Responses are cached for 5 minutes and include Cache-Control header.
+    The body comes from the host-wide shared cache; browsers may reuse it
+    for 5 minutes (Cache-Control).
     """
-    data = _get_cached_projects()
-    response = JSONResponse(content=data)
-    response.headers["Cache-Control"] = "public, max-age=300"
-    return response
+    return Response(
+        content=_get_cached_projects(),
+        media_type="application/json",
+        headers={"Cache-Control": "public, max-age=300"},
+    )
+
+
+@public_router.get(
+    "/search",
+    response_model=ProjectSearchResponse,
+    summary="Search and facet projects (public)",
+)
+@public_budget(ROUTE_COSTS["cached_read"])
+async def search_projects(
+    request: Request,
+    q: str = Query("", max_length=200, description="Words matched as prefixes of indexed terms"),
+    category: list[str] = Query([]),
+    tag: list[str] = Query([]),
+    technology: list[str] = Query([]),
+    limit: int = Query(20, ge=1, le=100),
+    offset: int = Query(0, ge=0),
+):
+    """
+    Ranked project ids matching `q` and every category/tag/technology
+    filter, plus facet counts over all matches. The frontend fetches only
+    the projects it renders.
+    """
+    result = _get_search_index().search(
+        q, {"category": category, "tag": tag, "technology": technology}, limit=limit, offset=offset,
+    )
+    return FastJSONResponse(
+        content={"total": result.total, "ids": result.ids, "facets": result.facets},
+        headers={"Cache-Control": "public, max-age=60"},
+    )
+
+
+@public_router.get(
+    "/changes",
+    response_model=ProjectChangesResponse,
+    summary="Projects changed since a cursor (public delta sync)",
+)
+@public_budget(ROUTE_COSTS["db_read"])
+async def project_changes(
+    request: Request,
+    since: str | None = Query(None, description="Cursor from the previous response; omit for a full sync"),
+    limit: int = Query(200, ge=1, le=1000),
+):
+    """
+    Projects created or updated after `since`, plus tombstones for deleted
+    ones, oldest first. Lets the frontend keep its project list and sync it
+    incrementally instead of refetching it whenever /version changes; page
+    with the returned `cursor` while `has_more` is set.
+    """
+    try:
+        cursor = SyncCursor.parse(since) if since else None
+    except ValueError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid since cursor")
+    return FastJSONResponse(content=get_project_changes(cursor, limit), headers={"Cache-Control": "no-cache"})
 
 
 @public_router.get(
@@ -93,7 +189,7 @@ async def list_projects_public_clean(request: Request):
     response_model=ProjectResponse,
     summary="Get a single project (public)",
 )
-@limiter.limit(RATE_LIMIT_PUBLIC)
+@public_budget(ROUTE_COSTS["db_read"])
 async def get_project_public(request: Request, project_id: int):
     """Public endpoint to get a single project by ID."""
     project = get_project_by_id(project_id)
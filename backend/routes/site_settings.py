@@ -1,16 +1,20 @@
 """Site settings, feature flags, maintainability & content management router."""
 import json
-import os
 from datetime import datetime, timezone
 from typing import Dict, Any, List
 
-from fastapi import APIRouter, Depends, HTTPException, Body, status
+from fastapi import APIRouter, Depends, HTTPException, Body, Request, status
 from fastapi.responses import JSONResponse, StreamingResponse
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
 
 import database
 import models
+from config import RATE_LIMIT_ADMIN
+from middleware.compression import PrecompressedJSON
 from services.auth_service_v2 import require_admin
+from services.content_store import about_store
+from services.rate_limiter import ROUTE_COSTS, limiter
+from services.snapshot_publisher import snapshot_publisher
 
 router = APIRouter(prefix="/api/admin/site-settings", tags=["site-settings"])
 
@@ -26,28 +30,16 @@ DEFAULT_SETTINGS = {
     "meta_description": "Portfolio of Arpit Kumar — ML Engineer & AI Researcher at IIT Kharagpur."
 }
 
-ABOUT_FILE_PATH = os.path.join(os.path.dirname(__file__), "..", "data", "about.json")
 
-
-def _get_setting_db(db: Session, key: str) -> Any:
-    record = db.query(models.SiteSettingModel).filter(models.SiteSettingModel.key == key).first()
-    if record:
-        return record.value
-    return DEFAULT_SETTINGS.get(key)
-
-
-def _set_setting_db(db: Session, key: str, value: Any, description: str = ""):
-    record = db.query(models.SiteSettingModel).filter(models.SiteSettingModel.key == key).first()
-    if not record:
-        record = models.SiteSettingModel(key=key, value=value, description=description)
-        db.add(record)
-    else:
-        record.value = value
-        if description:
-            record.description = description
-    db.commit()
-    db.refresh(record)
-    return record
+def _get_settings_db(db: Session, keys) -> Dict[str, Any]:
+    """Read several settings in one query, falling back to DEFAULT_SETTINGS."""
+    keys = list(keys)
+    stored = dict(
+        db.query(models.SiteSettingModel.key, models.SiteSettingModel.value)
+        .filter(models.SiteSettingModel.key.in_(keys))
+        .all()
+    )
+    return {key: stored[key] if key in stored else DEFAULT_SETTINGS.get(key) for key in keys}
 
 
 @router.get("")
@@ -56,10 +48,7 @@ async def get_site_settings(
     admin: dict = Depends(require_admin)
 ) -> Dict[str, Any]:
     """Retrieve all website configuration settings and feature flags."""
-    settings = {}
-    for key, default_val in DEFAULT_SETTINGS.items():
-        settings[key] = _get_setting_db(db, key)
-    return {"settings": settings}
+    return {"settings": _get_settings_db(db, DEFAULT_SETTINGS)}
 
 
 @router.patch("")
@@ -69,27 +58,55 @@ async def update_site_settings(
     admin: dict = Depends(require_admin)
 ) -> Dict[str, Any]:
     """Update specific website feature flags or site configuration settings."""
-    updated = {}
+    existing = {
+        record.key: record
+        for record in db.query(models.SiteSettingModel).filter(models.SiteSettingModel.key.in_(list(updates))).all()
+    }
     for key, value in updates.items():
-        _set_setting_db(db, key, value)
-        updated[key] = value
-    return {"status": "success", "updated": updated}
+        record = existing.get(key)
+        if record is None:
+            db.add(models.SiteSettingModel(key=key, value=value, description=""))
+        else:
+            record.value = value
+    db.commit()
+    snapshot_publisher.schedule(_PUBLIC_SNAPSHOT)
+    return {"status": "success", "updated": dict(updates)}
 
 
 # Public endpoint for site settings (maintenance mode, open to work status, etc.)
 public_settings_router = APIRouter(prefix="/api/site-settings", tags=["public-settings"])
 
+_PUBLIC_SETTING_KEYS = (
+    "maintenance_mode", "open_to_work", "recruiter_gateway_enabled",
+    "contact_form_enabled", "active_resume_url",
+)
+
+
+def _public_settings(db: Session) -> Dict[str, Any]:
+    settings = _get_settings_db(db, _PUBLIC_SETTING_KEYS)
+    return {
+        "maintenance_mode": settings["maintenance_mode"] or False,
+        "open_to_work": settings["open_to_work"] if settings["open_to_work"] is not None else True,
+        "recruiter_gateway_enabled": settings["recruiter_gateway_enabled"] if settings["recruiter_gateway_enabled"] is not None else True,
+        "contact_form_enabled": settings["contact_form_enabled"] if settings["contact_form_enabled"] is not None else True,
+        "active_resume_url": settings["active_resume_url"] or "/resume.pdf"
+    }
+
 
 @public_settings_router.get("/public")
 async def get_public_site_settings(db: Session = Depends(database.get_db)):
     """Public endpoint for frontend to read maintenance mode & feature flags."""
-    return {
-        "maintenance_mode": _get_setting_db(db, "maintenance_mode") or False,
-        "open_to_work": _get_setting_db(db, "open_to_work") if _get_setting_db(db, "open_to_work") is not None else True,
-        "recruiter_gateway_enabled": _get_setting_db(db, "recruiter_gateway_enabled") if _get_setting_db(db, "recruiter_gateway_enabled") is not None else True,
-        "contact_form_enabled": _get_setting_db(db, "contact_form_enabled") if _get_setting_db(db, "contact_form_enabled") is not None else True,
-        "active_resume_url": _get_setting_db(db, "active_resume_url") or "/resume.pdf"
-    }
+    return _public_settings(db)
+
+
+def _render_public_settings() -> PrecompressedJSON:
+    with database.SessionLocal() as db:
+        return PrecompressedJSON(_public_settings(db))
+
+
+# Static snapshot of the public settings, republished on every PATCH
+_PUBLIC_SNAPSHOT = "site-settings"
+snapshot_publisher.register(_PUBLIC_SNAPSHOT, _render_public_settings, source="/api/site-settings/public")
 
 
 # ================= Content Management Endpoints =================
@@ -97,11 +114,10 @@ async def get_public_site_settings(db: Session = Depends(database.get_db)):
 @router.get("/content/about")
 async def get_about_content(admin: dict = Depends(require_admin)):
     """Read the current about.json structure for live editing."""
-    if not os.path.exists(ABOUT_FILE_PATH):
+    try:
+        return about_store.get().data
+    except FileNotFoundError:
         raise HTTPException(status_code=404, detail="about.json file not found")
-    with open(ABOUT_FILE_PATH, "r", encoding="utf-8") as f:
-        data = json.load(f)
-    return data
 
 
 @router.put("/content/about")
@@ -111,8 +127,8 @@ async def update_about_content(
 ):
     """Save updated about.json profile content."""
     try:
-        with open(ABOUT_FILE_PATH, "w", encoding="utf-8") as f:
-            json.dump(content, f, indent=2, ensure_ascii=False)
+        about_store.save(content)
+        snapshot_publisher.schedule("about")
         return {"status": "success", "message": "About section content saved successfully"}
     except Exception as exc:
         raise HTTPException(status_code=500, detail=f"Failed to update about.json: {str(exc)}")
@@ -121,12 +137,14 @@ async def update_about_content(
 # ================= Database Backup & Export Endpoint =================
 
 @router.post("/backup")
+@limiter.limit(RATE_LIMIT_ADMIN, cost=ROUTE_COSTS["export"])
 async def create_database_backup(
+    request: Request,
     db: Session = Depends(database.get_db),
     admin: dict = Depends(require_admin)
 ):
     """Generate a full JSON dump of projects, leads, and site settings."""
-    projects = db.query(models.ProjectModel).all()
+    projects = db.query(models.ProjectModel).options(selectinload(models.ProjectModel.details)).all()
     leads = db.query(models.ContactLead).all()
     settings = db.query(models.SiteSettingModel).all()
 
@@ -137,3 +137,25 @@ class ProjectResponse(BaseModel):
     standings: str | None = None
     created_at: str | None = None
     updated_at: str | None = None
+
+
+class ProjectSearchResponse(BaseModel):
+    """Schema for project search results: ranked ids plus facet counts."""
+    total: int
+    ids: list[int]
+    facets: dict[str, dict[str, int]]
+
+
+class SyncTombstone(BaseModel):
+    """A row deleted after the sync cursor."""
+    id: int
+    deleted_at: str
+
+
+class ProjectChangesResponse(BaseModel):
+    """Schema for the project delta sync feed (see services/sync.py)."""
+    changes: list[ProjectResponse]
+    deleted: list[SyncTombstone]
+    cursor: str
+    has_more: bool
+    reset: bool
@@ -0,0 +1,252 @@
+"""
+Cross-worker cache invalidation.
+
+Response caches (the public project list, about data) live in each uvicorn
+worker's memory. After an admin edit, `invalidation_bus.publish(key)` clears
+the key in the current process at once and broadcasts it to every other
+worker, whose subscribed handlers then drop their copy. Handlers receive the
+wall-clock time the key was published, so a host-wide cache (see
+services/shared_cache.py) can ignore an invalidation it has already
+refreshed past. Caches can therefore keep long TTLs; the TTL only bounds
+staleness if a message is lost.
+
+Transport is selected by CACHE_BUS_BACKEND:
+
+  - postgres  NOTIFY on a channel; each worker holds one extra connection
+              that LISTENs from a background thread
+  - file      append-only file shared by all workers on one host (SQLite /
+              local setups); readers check it with one stat() per cache read
+  - local     no broadcast (single worker)
+  - auto      postgres for a PostgreSQL DATABASE_URL, file otherwise
+
+Whenever a worker may have missed messages (listener reconnect, file
+rotated) it invalidates every key rather than guess.
+"""
+import json
+import logging
+import select
+import threading
+import time
+import uuid
+from collections.abc import Callable
+from pathlib import Path
+
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+
+from config import CACHE_BUS_BACKEND, CACHE_BUS_CHANNEL, CACHE_BUS_FILE
+from utils.files import atomic_write_bytes, file_signature
+
+logger = logging.getLogger(__name__)
+
+ALL_KEYS = "*"
+
+
+Deliver = Callable[[str, float], None]
+
+
+def _encode(key: str, origin: str, published_at: float) -> str:
+    return json.dumps({"key": key, "origin": origin, "at": published_at}, separators=(",", ":"))
+
+
+def _decode(payload: str, origin: str) -> tuple[str, float] | None:
+    """(key, published_at) from a broadcast payload, or None for messages sent by `origin` (this worker)."""
+    try:
+        message = json.loads(payload)
+        key, sender, published_at = message["key"], message["origin"], float(message["at"])
+    except (json.JSONDecodeError, KeyError, TypeError, ValueError):
+        logger.warning("Ignoring malformed cache invalidation: %r", payload)
+        return None
+    return None if sender == origin else (key, published_at)
+
+
+# ============= Transports =============
+
+class PostgresTransport:
+    """LISTEN/NOTIFY on `channel`, listened to by a daemon thread."""
+
+    def __init__(self, engine: Engine, channel: str = CACHE_BUS_CHANNEL, reconnect_delay: float = 5.0):
+        self._engine = engine
+        self._channel = channel
+        self._reconnect_delay = reconnect_delay
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._origin = uuid.uuid4().hex  # skip our own broadcasts (already applied locally)
+
+    def start(self, deliver: Deliver) -> None:
+        self._thread = threading.Thread(target=self._listen, args=(deliver,), name="cache-bus", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self._reconnect_delay + 1)
+
+    def publish(self, key: str, published_at: float) -> None:
+        # NOTIFY is transactional: delivered on commit
+        with self._engine.begin() as conn:
+            conn.execute(text("SELECT pg_notify(:channel, :payload)"),
+                         {"channel": self._channel, "payload": _encode(key, self._origin, published_at)})
+
+    def poll(self) -> None:
+        pass  # delivery happens on the listener thread
+
+    def _connect(self):
+        # Dedicated DBAPI connection outside the pool: it stays in LISTEN for the process lifetime
+        dialect = self._engine.dialect
+        cargs, cparams = dialect.create_connect_args(self._engine.url)
+        conn = dialect.dbapi.connect(*cargs, **cparams)
+        conn.autocommit = True
+        with conn.cursor() as cursor:
+            cursor.execute(f'LISTEN "{self._channel}"')
+        return conn
+
+    def _listen(self, deliver: Deliver) -> None:
+        first = True
+        while not self._stop.is_set():
+            conn = None
+            try:
+                conn = self._connect()
+                if not first:
+                    deliver(ALL_KEYS, time.time())  # messages sent while disconnected are lost
+                first = False
+                while not self._stop.is_set():
+                    if select.select([conn], [], [], 1.0)[0]:
+                        conn.poll()
+                        while conn.notifies:
+                            message = _decode(conn.notifies.pop(0).payload, self._origin)
+                            if message is not None:
+                                deliver(*message)
+            except Exception as e:
+                logger.warning("Cache invalidation listener disconnected: %s", e)
+                self._stop.wait(self._reconnect_delay)
+            finally:
+                if conn is not None:
+                    conn.close()
+
+
+class FileTransport:
+    """
+    One JSON line per invalidation appended to a file every worker on the
+    host can read. `poll()` replays lines past this worker's offset; the
+    publisher empties the file past `max_bytes` (new inode), which readers
+    treat as "invalidate everything".
+    """
+
+    def __init__(self, path: str | Path = CACHE_BUS_FILE, max_bytes: int = 256 * 1024):
+        self._path = Path(path)
+        self._max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._deliver: Deliver | None = None
+        self._inode: int | None = None
+        self._offset = 0
+        self._origin = uuid.uuid4().hex  # skip our own broadcasts (already applied locally)
+
+    def start(self, deliver: Deliver) -> None:
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._path.touch(exist_ok=True)
+        signature = file_signature(self._path)
+        self._inode, self._offset = signature[0], signature[2]  # skip history
+        self._deliver = deliver
+
+    def stop(self) -> None:
+        self._deliver = None
+
+    def publish(self, key: str, published_at: float) -> None:
+        with open(self._path, "ab") as f:
+            f.write((_encode(key, self._origin, published_at) + "\n").encode("utf-8"))
+            size = f.tell()
+        if size > self._max_bytes:
+            atomic_write_bytes(self._path, b"")
+
+    def poll(self) -> None:
+        if self._deliver is None or not self._lock.acquire(blocking=False):
+            return  # another thread is already reading the file
+        try:
+            signature = file_signature(self._path)
+            if signature is None or signature[0] != self._inode:
+                self._inode, self._offset = (signature[0], 0) if signature else (None, 0)
+                self._deliver(ALL_KEYS, time.time())
+                if signature is None:
+                    return
+            if signature[2] <= self._offset:
+                return
+            with open(self._path, "rb") as f:
+                f.seek(self._offset)
+                tail = f.read()
+            for line in tail.splitlines(keepends=True):
+                if not line.endswith(b"\n"):
+                    break  # publisher mid-write
+                self._offset += len(line)
+                message = _decode(line.decode("utf-8", "replace"), self._origin)
+                if message is not None:
+                    self._deliver(*message)
+        finally:
+            self._lock.release()
+
+
+def create_transport(engine: Engine, backend: str = CACHE_BUS_BACKEND):
+    """Transport for CACHE_BUS_BACKEND, or None for local-only invalidation."""
+    if backend == "auto":
+        backend = "postgres" if engine.dialect.name == "postgresql" else "file"
+    if backend == "postgres":
+        return PostgresTransport(engine)
+    if backend == "file":
+        return FileTransport()
+    if backend != "local":
+        raise ValueError(f"Unknown CACHE_BUS_BACKEND: {backend!r}")
+    return None
+
+
+# ============= Bus =============
+
+class InvalidationBus:
+    """Per-process registry of invalidation handlers plus an optional broadcast transport."""
+
+    def __init__(self):
+        self._handlers: dict[str, list[Callable[[float], None]]] = {}
+        self._transport = None
+
+    def subscribe(self, key: str, handler: Callable[[float], None]) -> None:
+        """Call `handler(published_at)` whenever `key` is invalidated in any worker."""
+        self._handlers.setdefault(key, []).append(handler)
+
+    def publish(self, key: str) -> None:
+        """Invalidate `key` here immediately, then in every other worker."""
+        published_at = time.time()
+        self._dispatch(key, published_at)
+        if self._transport is None:
+            return
+        try:
+            self._transport.publish(key, published_at)
+        except Exception as e:
+            # The edit itself succeeded; other workers catch up at TTL expiry
+            logger.warning("Cache invalidation broadcast for %r failed: %s", key, e)
+
+    def poll(self) -> None:
+        """Apply pending broadcasts (cheap; call before serving from a cache)."""
+        if self._transport is not None:
+            self._transport.poll()
+
+    def start(self, transport) -> None:
+        self._transport = transport
+        if transport is not None:
+            transport.start(self._dispatch)
+            logger.info("Cache invalidation bus started (%s)", type(transport).__name__)
+
+    def stop(self) -> None:
+        if self._transport is not None:
+            self._transport.stop()
+        self._transport = None
+
+    def _dispatch(self, key: str, published_at: float) -> None:
+        keys = list(self._handlers) if key == ALL_KEYS else [key]
+        for k in keys:
+            for handler in self._handlers.get(k, ()):
+                try:
+                    handler(published_at)
+                except Exception:
+                    logger.exception("Cache invalidation handler for %r failed", k)
+
+
+invalidation_bus = InvalidationBus()
@@ -0,0 +1,101 @@
+"""
+Versioned in-memory store for editable JSON content files (about.json).
+
+The store owns the file: the public endpoint and the admin editor both go
+through it. Each load produces an immutable `ContentSnapshot` holding the
+parsed data plus its encoded/compressed response bodies and ETag, built
+once per version rather than per request.
+
+  - Reads cost one stat(): the file is re-read only when its signature
+    (inode, mtime, size) changes, which also catches edits made outside the
+    app (deploys, manual edits).
+  - Saves replace the file atomically (temp file + fsync + rename), swap in
+    the new snapshot, and publish the content key on the cache bus so
+    workers on other hosts drop theirs.
+"""
+import json
+import logging
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+
+from middleware.compression import PrecompressedJSON
+from services.cache_bus import invalidation_bus
+from utils.files import atomic_write_bytes, file_signature
+
+logger = logging.getLogger(__name__)
+
+DATA_DIR = Path(__file__).resolve().parent.parent / "data"
+
+
+@dataclass(frozen=True)
+class ContentSnapshot:
+    version: int
+    signature: tuple[int, int, int] | None
+    data: dict
+    body: PrecompressedJSON
+
+    @property
+    def etag(self) -> str:
+        return self.body.etag
+
+
+class JSONContentStore:
+    """One JSON document on disk, served from a versioned in-memory snapshot."""
+
+    def __init__(self, path: str | Path, key: str):
+        self._path = Path(path)
+        self._key = key
+        self._lock = threading.Lock()
+        self._snapshot: ContentSnapshot | None = None
+        self._version = 0
+        invalidation_bus.subscribe(key, self.invalidate)
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def peek(self) -> ContentSnapshot | None:
+        """The current snapshot without checking the file."""
+        return self._snapshot
+
+    def get(self) -> ContentSnapshot:
+        """
+        Current snapshot, reloaded if the file changed.
+        Raises FileNotFoundError / json.JSONDecodeError like `json.load`.
+        """
+        invalidation_bus.poll()
+        snapshot = self._snapshot
+        signature = file_signature(self._path)
+        if snapshot is not None and snapshot.signature == signature:
+            return snapshot
+        with self._lock:
+            snapshot = self._snapshot
+            signature = file_signature(self._path)
+            if snapshot is not None and snapshot.signature == signature:
+                return snapshot
+            data = json.loads(self._path.read_bytes())
+            snapshot = self._install(data, signature)
+        logger.info("Loaded %s (version %d)", self._path, snapshot.version)
+        return snapshot
+
+    def save(self, data: dict) -> ContentSnapshot:
+        """Atomically replace the file with `data` and make it the served version everywhere."""
+        encoded = json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+        with self._lock:
+            atomic_write_bytes(self._path, encoded)
+            # Publishing also runs our own handler, so install the new snapshot after it
+            invalidation_bus.publish(self._key)
+            return self._install(data, file_signature(self._path))
+
+    def invalidate(self, published_at: float | None = None) -> None:
+        """Drop the snapshot; the next `get` re-reads the file."""
+        self._snapshot = None
+
+    def _install(self, data: dict, signature) -> ContentSnapshot:
+        self._version += 1
+        self._snapshot = ContentSnapshot(self._version, signature, data, PrecompressedJSON(data))
+        return self._snapshot
+
+
+about_store = JSONContentStore(DATA_DIR / "about.json", key="about")
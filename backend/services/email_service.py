@@ -23,6 +23,7 @@ from config import (
     RESEND_API_KEY,
     VITE_API_URL,
 )
+from services.metrics import timed_email
 from templates import (
     admin_notification,
     contact_acknowledgment,
@@ -36,6 +37,11 @@ logger = logging.getLogger(__name__)
 resend.api_key = RESEND_API_KEY
 
 
+def _send(template: str, payload: dict):
+    """Send through Resend, recording latency and outcome per template."""
+    return timed_email(template, lambda: resend.Emails.send(payload))
+
+
 # ──────────────────────────────────────────────
 # 1. Contact Form Acknowledgment
 # ──────────────────────────────────────────────
@@ -76,7 +82,7 @@ def send_contact_acknowledgment(
             email=email,
         )
 
-        resend.Emails.send({
+        _send("contact_acknowledgment", {
             "from": EMAIL_FROM,
             "to": [email],
             "reply_to": ADMIN_EMAIL,
@@ -138,7 +144,7 @@ def send_cv_request_email(
             calendly_link=CALENDLY_LINK,
         )
 
-        resend.Emails.send({
+        _send("cv_request", {
             "from": EMAIL_FROM,
             "to": [email],
             "reply_to": ADMIN_EMAIL,
@@ -234,7 +240,7 @@ def send_recruiter_login_email(
         if attachments:
             payload["attachments"] = attachments
 
-        resend.Emails.send(payload)
+        _send("recruiter_login", payload)
         logger.info("Recruiter welcome sent to %s (company: %s)", email, company or "N/A")
         return True
     except Exception as e:
@@ -291,7 +297,7 @@ def send_admin_notification(
             frontend_url=frontend_url,
         )
 
-        resend.Emails.send({
+        _send("admin_notification", {
             "from": EMAIL_FROM,
             "to": [admin_email],
             "subject": f"[New Lead] {lead_type}: {name} — {subject}",
@@ -334,7 +340,7 @@ def send_lead_reply_email(
         </div>
         """
 
-        resend.Emails.send({
+        _send("lead_reply", {
             "from": EMAIL_FROM,
             "to": [to_email],
             "reply_to": reply_to_addr,
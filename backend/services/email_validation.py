@@ -0,0 +1,143 @@
+"""
+Non-blocking email validation for the public contact/CV forms.
+
+`email_validator.validate_email` with deliverability checks performs a
+blocking DNS lookup, which stalls the event loop when called from an async
+handler. Validation here is split in two:
+
+  1. Syntax/normalization — pure Python, runs inline (microseconds).
+  2. Domain deliverability (MX / A fallback) — decided from, in order:
+       - KNOWN_DELIVERABLE_DOMAINS, a precomputed allowlist of common providers
+       - `domain_cache`, per-domain results with a TTL
+       - a DNS lookup in the threadpool, coalesced so concurrent submissions
+         for the same domain share one lookup
+"""
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+
+from email_validator import EmailNotValidError, EmailUndeliverableError, validate_email
+from email_validator.deliverability import caching_resolver, validate_email_deliverability
+
+from config import EMAIL_DNS_TIMEOUT, EMAIL_DOMAIN_CACHE_TTL
+from services.metrics import run_in_threadpool
+
+# Mail providers that are always deliverable — skip DNS entirely
+KNOWN_DELIVERABLE_DOMAINS: frozenset[str] = frozenset({
+    "gmail.com", "googlemail.com", "outlook.com", "hotmail.com", "live.com",
+    "msn.com", "yahoo.com", "yahoo.co.in", "yahoo.co.uk", "icloud.com", "me.com",
+    "mac.com", "aol.com", "proton.me", "protonmail.com", "pm.me", "zoho.com",
+    "zohomail.in", "gmx.com", "gmx.de", "mail.com", "yandex.com", "rediffmail.com",
+    "fastmail.com", "hey.com", "qq.com", "163.com", "naver.com",
+    "microsoft.com", "google.com", "amazon.com", "apple.com", "meta.com",
+    "iitkgp.ac.in", "kgpian.iitkgp.ac.in",
+})
+
+# Failed lookups are retried sooner than successful ones are re-checked
+_NEGATIVE_TTL_FACTOR = 0.1
+
+
+class DomainCache:
+    """Thread-safe, size-bounded domain → error message (None = deliverable) cache."""
+
+    def __init__(self, ttl: float = EMAIL_DOMAIN_CACHE_TTL, max_entries: int = 10_000):
+        self._ttl = ttl
+        self._max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[float, str | None]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, domain: str) -> tuple[bool, str | None]:
+        """Return (hit, error). `error` is None for deliverable domains."""
+        with self._lock:
+            entry = self._entries.get(domain)
+            if entry is None:
+                return False, None
+            expires, error = entry
+            if expires <= time.monotonic():
+                del self._entries[domain]
+                return False, None
+            self._entries.move_to_end(domain)
+            return True, error
+
+    def put(self, domain: str, error: str | None) -> None:
+        ttl = self._ttl if error is None else self._ttl * _NEGATIVE_TTL_FACTOR
+        with self._lock:
+            self._entries[domain] = (time.monotonic() + ttl, error)
+            self._entries.move_to_end(domain)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+domain_cache = DomainCache()
+
+_resolver = None
+_inflight: dict[str, asyncio.Future] = {}
+
+
+def _check_domain(ascii_domain: str, domain_i18n: str) -> str | None:
+    """Blocking MX lookup. Returns an error message, or None if deliverable."""
+    global _resolver
+    if _resolver is None:
+        _resolver = caching_resolver(timeout=EMAIL_DNS_TIMEOUT)
+    try:
+        validate_email_deliverability(ascii_domain, domain_i18n, dns_resolver=_resolver)
+    except EmailUndeliverableError as exc:
+        return str(exc)
+    return None
+
+
+async def _domain_error(ascii_domain: str, domain_i18n: str) -> str | None:
+    """Resolve deliverability for a domain via allowlist, cache or one shared lookup."""
+    if ascii_domain in KNOWN_DELIVERABLE_DOMAINS:
+        return None
+    hit, error = domain_cache.get(ascii_domain)
+    if hit:
+        return error
+
+    pending = _inflight.get(ascii_domain)
+    if pending is not None:
+        return await asyncio.shield(pending)
+
+    future = asyncio.get_running_loop().create_future()
+    _inflight[ascii_domain] = future
+    try:
+        error = await run_in_threadpool(_check_domain, ascii_domain, domain_i18n)
+        domain_cache.put(ascii_domain, error)
+        future.set_result(error)
+        return error
+    except BaseException as exc:
+        future.set_exception(exc)
+        # Mark retrieved so an unawaited failure is not logged as never-retrieved
+        future.exception()
+        raise
+    finally:
+        _inflight.pop(ascii_domain, None)
+
+
+async def validate_email_address(email: str) -> str:
+    """
+    Validate syntax and deliverability without blocking the event loop.
+
+    Returns the normalized address.
+
+    Raises:
+        EmailNotValidError: malformed address or undeliverable domain
+    """
+    info = validate_email(email, check_deliverability=False)
+    error = await _domain_error(info.ascii_domain, info.domain)
+    if error is not None:
+        raise EmailUndeliverableError(error)
+    return info.normalized
+
+
+__all__ = [
+    "EmailNotValidError",
+    "KNOWN_DELIVERABLE_DOMAINS",
+    "domain_cache",
+    "validate_email_address",
+]
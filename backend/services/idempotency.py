@@ -0,0 +1,134 @@
+"""
+Idempotency for public form submissions (contact + CV request).
+
+A submission is identified by the client's `Idempotency-Key` header (scoped
+to the submitter's email) when present, otherwise by a hash of (lead type, email, subject, message) and a
+fixed time-window bucket. A retry can cross into the next bucket, so a
+content-keyed submission also matches the previous bucket's key
+(`submission_keys`): identical content is deduplicated for at least one
+window. Two layers stop duplicates:
+
+  1. `submission_cache` — bounded in-memory LRU of recent keys → original
+     response body. Double-clicks and client retries on the same worker are
+     answered from here without touching the DB or the mailer.
+  2. The database — a lead stored under the previous bucket's key is looked
+     up before the insert, and a unique index on
+     `contact_leads.idempotency_key` catches duplicates of the current key
+     that land on another worker or after a restart; the insert fails and
+     the route replays a response rebuilt from the existing lead.
+"""
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+
+from config import IDEMPOTENCY_CACHE_SIZE, IDEMPOTENCY_WINDOW_SECONDS
+
+IDEMPOTENCY_HEADER = "Idempotency-Key"
+REPLAY_HEADER = "Idempotent-Replayed"
+
+
+class DuplicateSubmissionError(Exception):
+    """Raised when a lead with the same idempotency key already exists."""
+
+    def __init__(self, lead):
+        super().__init__(f"Duplicate submission of lead {lead.id}")
+        self.lead = lead
+
+
+def submission_key(
+    lead_type: str,
+    email: str,
+    subject: str,
+    message: str,
+    header_key: str | None = None,
+    now: float | None = None,
+) -> str:
+    """
+    Derive the idempotency key for a form submission.
+
+    Without a client-supplied key, identical content is deduplicated within
+    the current window bucket; the same message sent again in a later window
+    is treated as a new lead.
+    """
+    if header_key:
+        # Scoped to the submitter: the forms are public, so a key reused by
+        # someone else must not replay (and swallow) another person's lead
+        raw = "\x1f".join((lead_type, "header", email.strip().lower(), header_key.strip()))
+    else:
+        bucket = int((now if now is not None else time.time()) // IDEMPOTENCY_WINDOW_SECONDS)
+        raw = "\x1f".join((lead_type, email.strip().lower(), subject.strip(), message.strip(), str(bucket)))
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def submission_keys(
+    lead_type: str,
+    email: str,
+    subject: str,
+    message: str,
+    header_key: str | None = None,
+    now: float | None = None,
+) -> tuple[str, ...]:
+    """
+    Keys an earlier copy of this submission may be stored under. The first
+    is the key to store the submission with; without a client-supplied key
+    it is followed by the previous window bucket's key, so a retry just
+    after a bucket boundary still matches the original.
+    """
+    if header_key:
+        return (submission_key(lead_type, email, subject, message, header_key=header_key),)
+    now = now if now is not None else time.time()
+    return tuple(
+        submission_key(lead_type, email, subject, message, now=at)
+        for at in (now, now - IDEMPOTENCY_WINDOW_SECONDS)
+    )
+
+
+class SubmissionCache:
+    """Thread-safe, size-bounded LRU of key → response body with a TTL."""
+
+    def __init__(self, max_entries: int = IDEMPOTENCY_CACHE_SIZE, ttl: float = IDEMPOTENCY_WINDOW_SECONDS):
+        self._max_entries = max_entries
+        self._ttl = ttl
+        self._entries: OrderedDict[str, tuple[float, dict]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> dict | None:
+        """Return the stored response for `key`, or None if unknown/expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires, response = entry
+            if expires <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return response
+
+    def find(self, keys: tuple[str, ...]) -> dict | None:
+        """Return the stored response for the first of `keys` that is known."""
+        for key in keys:
+            response = self.get(key)
+            if response is not None:
+                return response
+        return None
+
+    def put(self, key: str, response: dict) -> None:
+        """Remember the response for `key`, evicting the oldest entries past capacity."""
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self._ttl, response)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# Process-wide singleton used by the lead routes
+submission_cache = SubmissionCache()
@@ -0,0 +1,230 @@
+"""
+Ingestion-time spam and quality scoring for contact/CV leads.
+
+`score_lead` combines cheap, allocation-light features that need no network
+or DB round-trip:
+
+  - disposable email domain (precomputed frozenset lookup)
+  - link density of the message
+  - known-bad IP / automated user agent
+  - submission velocity per IP (in-process sliding window)
+  - Shannon entropy of the message (keyboard mash / repeated characters)
+
+Spam signals are combined with a noisy-OR into `spam_score`; positive
+signals (company, recruiter/CV intent, corporate domain, substantive
+message) form the base quality, which is then discounted by the spam score.
+"""
+import math
+import re
+import threading
+import time
+from collections import Counter, OrderedDict, deque
+from typing import NamedTuple
+
+import models
+from config import SPAM_BLOCKED_IPS, SPAM_SCORE_THRESHOLD
+
+# ── Precomputed lookup sets ──
+
+DISPOSABLE_EMAIL_DOMAINS: frozenset[str] = frozenset({
+    "10minutemail.com", "20minutemail.com", "33mail.com", "anonbox.net",
+    "burnermail.io", "discard.email", "dispostable.com", "dropmail.me",
+    "emailondeck.com", "fakeinbox.com", "fakemail.net", "getairmail.com",
+    "getnada.com", "guerrillamail.biz", "guerrillamail.com", "guerrillamail.de",
+    "guerrillamail.info", "guerrillamail.net", "guerrillamail.org", "harakirimail.com",
+    "incognitomail.org", "inboxkitten.com", "mailcatch.com", "maildrop.cc",
+    "mailinator.com", "mailinator.net", "mailnesia.com", "mailsac.com",
+    "mintemail.com", "mohmal.com", "mytemp.email", "nada.email",
+    "sharklasers.com", "spam4.me", "spamgourmet.com", "temp-mail.io",
+    "temp-mail.org", "tempail.com", "tempmail.com", "tempmail.dev",
+    "tempmail.net", "tempmailo.com", "tempr.email", "throwawaymail.com",
+    "trashmail.com", "trashmail.de", "trashmail.net", "yopmail.com",
+    "yopmail.fr", "yopmail.net",
+})
+
+FREEMAIL_DOMAINS: frozenset[str] = frozenset({
+    "gmail.com", "googlemail.com", "yahoo.com", "yahoo.co.in", "outlook.com",
+    "hotmail.com", "live.com", "msn.com", "icloud.com", "me.com", "aol.com",
+    "proton.me", "protonmail.com", "zoho.com", "gmx.com", "mail.com",
+    "yandex.com", "rediffmail.com",
+})
+
+# Lower-cased substrings of user agents sent by scripts rather than browsers
+BOT_USER_AGENT_MARKERS: tuple[str, ...] = (
+    "curl/", "wget/", "python-requests", "python-urllib", "aiohttp", "httpx",
+    "go-http-client", "okhttp", "java/", "libwww-perl", "scrapy", "headlesschrome",
+    "phantomjs", "postmanruntime", "insomnia",
+)
+
+_LINK_RE = re.compile(r"https?://|www\.", re.IGNORECASE)
+
+# ── Signal weights (probability-like, combined with noisy-OR) ──
+
+_WEIGHTS = {
+    "blocked_ip": 0.9,
+    "disposable_domain": 0.6,
+    "bot_user_agent": 0.5,
+    "missing_user_agent": 0.3,
+    "link_heavy": 0.5,
+    "has_links": 0.15,
+    "velocity_burst": 0.8,
+    "velocity_high": 0.4,
+    "entropy_anomaly": 0.4,
+}
+
+VELOCITY_WINDOW_SECONDS = 600
+_VELOCITY_HIGH = 3    # submissions per IP per window before it looks suspicious
+_VELOCITY_BURST = 10  # submissions per IP per window that look like a spam wave
+
+
+class LeadScore(NamedTuple):
+    quality_score: float
+    spam_score: float
+    is_spam: bool
+    priority: str
+    signals: list[str]
+
+
+# ============= Velocity Tracking =============
+
+class VelocityTracker:
+    """
+    Per-IP sliding window of submission timestamps.
+
+    Bounded to `max_ips` entries (least recently seen evicted). Counts are
+    per process; the rate limiter enforces the hard cross-worker cap.
+    """
+
+    def __init__(self, window: float = VELOCITY_WINDOW_SECONDS, max_ips: int = 50_000):
+        self._window = window
+        self._max_ips = max_ips
+        self._hits: OrderedDict[str, deque] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def record(self, ip: str, now: float | None = None) -> int:
+        """Record a submission from `ip` and return its count within the window."""
+        now = now if now is not None else time.monotonic()
+        cutoff = now - self._window
+        with self._lock:
+            hits = self._hits.get(ip)
+            if hits is None:
+                hits = self._hits[ip] = deque()
+            else:
+                self._hits.move_to_end(ip)
+            while hits and hits[0] <= cutoff:
+                hits.popleft()
+            hits.append(now)
+            while len(self._hits) > self._max_ips:
+                self._hits.popitem(last=False)
+            return len(hits)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._hits.clear()
+
+
+velocity_tracker = VelocityTracker()
+
+
+# ============= Feature Helpers =============
+
+def shannon_entropy(text: str) -> float:
+    """Bits per character of `text` (English prose sits around 4.0–4.5)."""
+    if not text:
+        return 0.0
+    length = len(text)
+    return -sum((n / length) * math.log2(n / length) for n in Counter(text).values())
+
+
+def _email_domain(email: str) -> str:
+    return email.rsplit("@", 1)[-1].strip().lower()
+
+
+def _entropy_anomalous(message: str) -> bool:
+    """Flag repeated-character filler and random keyboard mash on non-trivial messages."""
+    compact = message.strip()
+    if len(compact) < 20:
+        return False
+    entropy = shannon_entropy(compact.lower())
+    if entropy < 2.5:
+        return True
+    # Random strings have high entropy and almost no whitespace
+    return entropy > 5.0 and compact.count(" ") < len(compact) / 20
+
+
+# ============= Scoring =============
+
+def score_lead(
+    email: str,
+    message: str,
+    company: str | None = None,
+    role: str | None = None,
+    lead_type: str | None = None,
+    ip_address: str | None = None,
+    user_agent: str | None = None,
+    velocity: int = 1,
+) -> LeadScore:
+    """Score a submission. Pure function apart from reading module constants."""
+    signals: list[str] = []
+    domain = _email_domain(email)
+
+    if ip_address and ip_address in SPAM_BLOCKED_IPS:
+        signals.append("blocked_ip")
+    if domain in DISPOSABLE_EMAIL_DOMAINS:
+        signals.append("disposable_domain")
+
+    ua = (user_agent or "").lower()
+    if not ua:
+        signals.append("missing_user_agent")
+    elif any(marker in ua for marker in BOT_USER_AGENT_MARKERS):
+        signals.append("bot_user_agent")
+
+    links = len(_LINK_RE.findall(message))
+    words = max(len(message.split()), 1)
+    if links >= 3 or (links and links / words > 0.2):
+        signals.append("link_heavy")
+    elif links:
+        signals.append("has_links")
+
+    if velocity > _VELOCITY_BURST:
+        signals.append("velocity_burst")
+    elif velocity > _VELOCITY_HIGH:
+        signals.append("velocity_high")
+
+    if _entropy_anomalous(message):
+        signals.append("entropy_anomaly")
+
+    not_spam = 1.0
+    for signal in signals:
+        not_spam *= 1.0 - _WEIGHTS[signal]
+    spam_score = round(1.0 - not_spam, 3)
+    is_spam = spam_score >= SPAM_SCORE_THRESHOLD
+
+    base_quality = 0.4
+    if company and company.strip():
+        base_quality += 0.15
+    if (role or "").strip().lower() == "recruiter" or lead_type == models.LeadType.CV_REQUEST.value:
+        base_quality += 0.2
+    if domain not in FREEMAIL_DOMAINS and domain not in DISPOSABLE_EMAIL_DOMAINS:
+        base_quality += 0.15
+    if words >= 15:
+        base_quality += 0.1
+    quality_score = round(min(base_quality, 1.0) * (1.0 - spam_score), 3)
+
+    if is_spam:
+        priority = models.Priority.LOW.value
+    elif quality_score >= 0.8:
+        priority = models.Priority.HIGH.value
+    else:
+        priority = models.Priority.MEDIUM.value
+
+    return LeadScore(quality_score, spam_score, is_spam, priority, signals)
+
+
+def is_spam_lead(lead) -> bool:
+    """True when ingestion scoring marked this lead as spam."""
+    metadata = getattr(lead, "metadata_json", None)
+    if not isinstance(metadata, dict):
+        return False
+    scoring = metadata.get("scoring")
+    return isinstance(scoring, dict) and scoring.get("is_spam") is True
@@ -1,22 +1,34 @@
 """Lead management service for database operations"""
 import logging
+from collections.abc import Sequence
 from datetime import datetime, timedelta, timezone
 
 from sqlalchemy import case, extract, func
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 import models
-from utils.serializers import serialize_contact_lead
+from services.idempotency import DuplicateSubmissionError
+from services.lead_scoring import score_lead, velocity_tracker
+from services.sync import SyncCursor, read_changes, record_tombstones
+from utils.serializers import CONTACT_LEAD_COLUMNS, serialize_contact_lead_row
 
 logger = logging.getLogger(__name__)
 
 
 def create_contact_lead(db: Session, name: str, email: str, subject: str, message: str,
                        company: str | None = None, form_type: str = "contacts", role: str | None = None,
-                       metadata: dict | None = None, lead_type: str | None = None) -> models.ContactLead:
+                       metadata: dict | None = None, lead_type: str | None = None,
+                       idempotency_key: str | None = None,
+                       earlier_keys: Sequence[str] = ()) -> models.ContactLead:
     """
     Create and persist a new contact lead to database.
 
+    The lead is scored at ingestion (see services/lead_scoring.py): quality
+    score and priority are set automatically, and obvious spam is flagged,
+    tagged "spam" and marked in metadata["scoring"] so callers can skip
+    outbound emails.
+
     Args:
         db: Database session
         name: Lead name
@@ -27,10 +39,45 @@ def create_contact_lead(db: Session, name: str, email: str, subject: str, messag
         form_type: Type of form submission
         role: User role
         metadata: Additional metadata (IP, user-agent, etc.)
+        idempotency_key: Submission key guarded by a unique index
+        earlier_keys: Other keys a copy of this submission may be stored
+            under (the previous idempotency window's, see submission_keys)
 
     Returns:
         Created ContactLead model instance
+
+    Raises:
+        DuplicateSubmissionError: a lead with the same idempotency key exists
     """
+    if earlier_keys:
+        existing = (
+            db.query(models.ContactLead)
+            .filter(models.ContactLead.idempotency_key.in_(list(earlier_keys)))
+            .first()
+        )
+        if existing is not None:
+            raise DuplicateSubmissionError(existing)
+    metadata = dict(metadata or {})
+    lead_type_value = (lead_type or models.LeadType.CONTACT).value if hasattr(lead_type or models.LeadType.CONTACT, 'value') else (lead_type or models.LeadType.CONTACT)
+    ip_address = metadata.get("ip_address")
+    score = score_lead(
+        email=email,
+        message=message,
+        company=company,
+        role=role,
+        lead_type=lead_type_value,
+        ip_address=ip_address,
+        user_agent=metadata.get("user_agent"),
+        velocity=velocity_tracker.record(ip_address) if ip_address else 1,
+    )
+    metadata["scoring"] = {
+        "spam_score": score.spam_score,
+        "is_spam": score.is_spam,
+        "signals": score.signals,
+    }
+    if score.is_spam:
+        logger.info("Lead from %s scored as spam (%.2f): %s", email, score.spam_score, ", ".join(score.signals))
+
     new_lead = models.ContactLead(
         name=name,
         email=email,
@@ -39,15 +86,32 @@ def create_contact_lead(db: Session, name: str, email: str, subject: str, messag
         company=company,
         form_type=form_type,
         role=role,
-        metadata_json=metadata or {},
-        lead_type=(lead_type or models.LeadType.CONTACT).value if hasattr(lead_type or models.LeadType.CONTACT, 'value') else (lead_type or models.LeadType.CONTACT)
+        metadata_json=metadata,
+        lead_type=lead_type_value,
+        idempotency_key=idempotency_key,
+        quality_score=score.quality_score,
+        priority=score.priority,
+        flagged=score.is_spam,
+        tags=["spam"] if score.is_spam else [],
     )
     db.add(new_lead)
-    db.commit()
+    try:
+        db.commit()
+    except IntegrityError:
+        db.rollback()
+        existing = get_lead_by_idempotency_key(db, idempotency_key) if idempotency_key else None
+        if existing is None:
+            raise
+        raise DuplicateSubmissionError(existing)
     db.refresh(new_lead)
     return new_lead
 
 
+def get_lead_by_idempotency_key(db: Session, idempotency_key: str) -> models.ContactLead | None:
+    """Get the lead created by a previous submission with this key"""
+    return db.query(models.ContactLead).filter(models.ContactLead.idempotency_key == idempotency_key).first()
+
+
 def get_all_leads(db: Session, skip: int = 0, limit: int | None = None) -> list:
     """
     Fetch all leads sorted by newest first.
@@ -60,15 +124,48 @@ def get_all_leads(db: Session, skip: int = 0, limit: int | None = None) -> list:
     Returns:
         List of serialized lead dictionaries
     """
-    query = db.query(models.ContactLead).order_by(models.ContactLead.created_at.desc())
+    query = db.query(*CONTACT_LEAD_COLUMNS).order_by(models.ContactLead.created_at.desc())
 
     if skip > 0:
         query = query.offset(skip)
     if limit:
         query = query.limit(limit)
 
-    leads = query.all()
-    return [serialize_contact_lead(lead) for lead in leads]
+    return [serialize_contact_lead_row(row) for row in query.all()]
+
+
+def get_leads_page(db: Session, skip: int, limit: int) -> tuple[list, int]:
+    """
+    Fetch one page of leads (newest first) together with the total lead count.
+
+    The total comes from a `COUNT(*) OVER ()` window column on the page query,
+    so a page costs one round trip instead of page + count. Only an empty page
+    (past the end) needs a separate count.
+
+    Returns:
+        (serialized leads, total number of leads)
+    """
+    total_col = func.count().over().label("total")
+    rows = (
+        db.query(*CONTACT_LEAD_COLUMNS, total_col)
+        .order_by(models.ContactLead.created_at.desc())
+        .offset(skip)
+        .limit(limit)
+        .all()
+    )
+    if not rows:
+        return [], db.query(func.count(models.ContactLead.id)).scalar() or 0
+    return [serialize_contact_lead_row(row[:-1]) for row in rows], rows[0][-1]
+
+
+def get_lead_changes(db: Session, since: SyncCursor | None, limit: int) -> dict:
+    """
+    Leads created, updated or deleted after `since`, oldest change first
+    (delta sync feed, see services/sync.py).
+    """
+    return read_changes(db, models.ContactLead.__tablename__, db.query(*CONTACT_LEAD_COLUMNS),
+                        models.ContactLead.updated_at, models.ContactLead.id, serialize_contact_lead_row,
+                        since, limit)
 
 
 def get_lead_by_id(db: Session, lead_id: int) -> models.ContactLead:
@@ -88,6 +185,7 @@ def delete_lead(db: Session, lead_id: int) -> bool:
         return False
 
     db.delete(lead)
+    record_tombstones(db, models.ContactLead.__tablename__, [lead_id])
     db.commit()
     return True
 
@@ -177,7 +275,7 @@ def search_leads(db: Session, query: str) -> list:
     Returns:
         List of matching leads
     """
-    leads = db.query(models.ContactLead).filter(
+    rows = db.query(*CONTACT_LEAD_COLUMNS).filter(
         (models.ContactLead.name.contains(query)) |
         (models.ContactLead.email.contains(query)) |
         (models.ContactLead.subject.contains(query)) |
@@ -185,7 +283,7 @@ def search_leads(db: Session, query: str) -> list:
         (models.ContactLead.internal_notes.contains(query))
     ).all()
 
-    return [serialize_contact_lead(lead) for lead in leads]
+    return [serialize_contact_lead_row(row) for row in rows]
 
 
 def filter_leads_by_date(db: Session, start_date: str, end_date: str) -> list:
@@ -200,12 +298,12 @@ def filter_leads_by_date(db: Session, start_date: str, end_date: str) -> list:
     Returns:
         List of leads in date range
     """
-    leads = db.query(models.ContactLead).filter(
+    rows = db.query(*CONTACT_LEAD_COLUMNS).filter(
         models.ContactLead.timestamp >= start_date,
         models.ContactLead.timestamp <= end_date
     ).all()
 
-    return [serialize_contact_lead(lead) for lead in leads]
+    return [serialize_contact_lead_row(row) for row in rows]
 
 
 def get_filtered_leads(db: Session, status: str | None = None, priority: str | None = None, min_score: float | None = None) -> list:
@@ -221,7 +319,7 @@ def get_filtered_leads(db: Session, status: str | None = None, priority: str | N
     Returns:
         List of filtered leads
     """
-    query = db.query(models.ContactLead)
+    query = db.query(*CONTACT_LEAD_COLUMNS)
 
     if status:
         query = query.filter(models.ContactLead.status == status)
@@ -230,8 +328,15 @@ def get_filtered_leads(db: Session, status: str | None = None, priority: str | N
     if min_score is not None:
         query = query.filter(models.ContactLead.quality_score >= min_score)
 
-    leads = query.order_by(models.ContactLead.created_at.desc()).all()
-    return [serialize_contact_lead(lead) for lead in leads]
+    rows = query.order_by(models.ContactLead.created_at.desc()).all()
+    return [serialize_contact_lead_row(row) for row in rows]
+
+
+def count_unread_leads(db: Session) -> int:
+    """Count unread leads (index-only on idx_contact_leads_status_created_at)"""
+    return db.query(func.count(models.ContactLead.id)).filter(
+        models.ContactLead.status == models.LeadStatus.UNREAD
+    ).scalar() or 0
 
 
 def bulk_update_status(db: Session, lead_ids: list, status: str) -> int:
@@ -268,9 +373,11 @@ def bulk_delete_leads(db: Session, lead_ids: list) -> int:
     Returns:
         Number of deleted leads
     """
+    existing_ids = [row.id for row in db.query(models.ContactLead.id).filter(models.ContactLead.id.in_(lead_ids))]
     deleted_count = db.query(models.ContactLead).filter(
-        models.ContactLead.id.in_(lead_ids)
+        models.ContactLead.id.in_(existing_ids)
     ).delete(synchronize_session=False)
+    record_tombstones(db, models.ContactLead.__tablename__, existing_ids)
 
     db.commit()
     return deleted_count
@@ -0,0 +1,235 @@
+"""
+In-process instrumentation with Prometheus text exposition.
+
+Collected per worker process (scrape each worker, or aggregate in Prometheus):
+
+  - http_request_duration_seconds{method,route,status}  histogram
+  - http_request_db_queries{route}                      histogram (queries per request)
+  - db_query_duration_seconds{statement}                histogram (SQLAlchemy engine events)
+  - threadpool_wait_seconds                             histogram (queue wait before a worker thread picks up a job)
+  - threadpool_busy_threads / threadpool_waiting_tasks   gauges (anyio default limiter)
+  - email_send_duration_seconds{template,outcome}       histogram
+
+`RequestStats` for the current request lives in a ContextVar; anyio copies the
+context into worker threads, so queries from sync dependencies and
+`run_in_threadpool` jobs are attributed to the request that issued them.
+
+No client library is needed: the exposition format is a few lines of text.
+"""
+import bisect
+import threading
+import time
+from collections.abc import Callable, Iterable
+from contextvars import ContextVar
+from dataclasses import dataclass
+from functools import partial
+
+import anyio.to_thread
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.concurrency import run_in_threadpool as _starlette_run_in_threadpool
+
+LATENCY_BUCKETS: tuple[float, ...] = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_COUNT_BUCKETS: tuple[float, ...] = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+
+
+# ============= Metric Types =============
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(pairs: Iterable[tuple[str, str]]) -> str:
+    rendered = ",".join(f'{name}="{_escape(str(value))}"' for name, value in pairs)
+    return f"{{{rendered}}}" if rendered else ""
+
+
+class Histogram:
+    """Cumulative-bucket histogram keyed by a fixed tuple of label names."""
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple[str, ...] = (),
+                 buckets: tuple[float, ...] = LATENCY_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self.buckets = tuple(sorted(buckets))
+        # labels → [per-bucket counts (+Inf last), sum, count]
+        self._series: dict[tuple[str, ...], list] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, *labels: str) -> None:
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = self._series[labels] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            series[0][index] += 1
+            series[1] += value
+            series[2] += 1
+
+    def collect(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            snapshot = [(labels, list(s[0]), s[1], s[2]) for labels, s in sorted(self._series.items())]
+        for labels, counts, total, count in snapshot:
+            pairs = list(zip(self.labelnames, labels))
+            cumulative = 0
+            for bound, bucket_count in zip((*self.buckets, float("inf")), counts):
+                cumulative += bucket_count
+                le = "+Inf" if bound == float("inf") else repr(float(bound))
+                lines.append(f"{self.name}_bucket{_format_labels([*pairs, ('le', le)])} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(pairs)} {total}")
+            lines.append(f"{self.name}_count{_format_labels(pairs)} {count}")
+        return lines
+
+    def clear(self) -> None:
+        with self._lock:
+            self._series.clear()
+
+
+class Gauge:
+    """Gauge whose value is read from a callback at scrape time."""
+
+    def __init__(self, name: str, documentation: str, read: Callable[[], float]):
+        self.name = name
+        self.documentation = documentation
+        self._read = read
+
+    def collect(self) -> list[str]:
+        try:
+            value = self._read()
+        except Exception:  # pragma: no cover - e.g. scraped outside an event loop
+            return []
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} gauge", f"{self.name} {value}"]
+
+    def clear(self) -> None:
+        pass
+
+
+def _thread_limiter_stat(attr: str) -> float:
+    limiter = anyio.to_thread.current_default_thread_limiter()
+    if attr == "waiting":
+        return limiter.statistics().tasks_waiting
+    return limiter.borrowed_tokens
+
+
+REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds", "Time until the response body completed.",
+    ("method", "route", "status"),
+)
+REQUEST_DB_QUERIES = Histogram(
+    "http_request_db_queries", "SQL statements executed per request.",
+    ("route",), buckets=QUERY_COUNT_BUCKETS,
+)
+DB_QUERY_DURATION = Histogram(
+    "db_query_duration_seconds", "SQL statement execution time.", ("statement",),
+)
+THREADPOOL_WAIT = Histogram(
+    "threadpool_wait_seconds", "Time a job waited for a free worker thread.",
+)
+EMAIL_SEND_DURATION = Histogram(
+    "email_send_duration_seconds", "Outbound email API call latency.", ("template", "outcome"),
+)
+
+REGISTRY: tuple = (
+    REQUEST_DURATION,
+    REQUEST_DB_QUERIES,
+    DB_QUERY_DURATION,
+    THREADPOOL_WAIT,
+    EMAIL_SEND_DURATION,
+    Gauge("threadpool_busy_threads", "Worker threads currently in use.", partial(_thread_limiter_stat, "busy")),
+    Gauge("threadpool_waiting_tasks", "Jobs queued for a worker thread.", partial(_thread_limiter_stat, "waiting")),
+)
+
+
+def render_prometheus() -> str:
+    """All metrics in Prometheus text exposition format (version 0.0.4)."""
+    lines: list[str] = []
+    for metric in REGISTRY:
+        lines.extend(metric.collect())
+    return "\n".join(lines) + "\n"
+
+
+def reset_metrics() -> None:
+    for metric in REGISTRY:
+        metric.clear()
+
+
+# ============= Per-Request Stats =============
+
+@dataclass
+class RequestStats:
+    queries: int = 0
+    query_seconds: float = 0.0
+
+
+_request_stats: ContextVar[RequestStats | None] = ContextVar("request_stats", default=None)
+
+
+def start_request_stats() -> tuple[RequestStats, object]:
+    """Begin collecting stats for the current request. Returns (stats, reset token)."""
+    stats = RequestStats()
+    return stats, _request_stats.set(stats)
+
+
+def end_request_stats(token) -> None:
+    _request_stats.reset(token)
+
+
+def current_request_stats() -> RequestStats | None:
+    return _request_stats.get()
+
+
+# ============= SQLAlchemy Engine Events =============
+
+def _statement_kind(statement: str) -> str:
+    head = statement.lstrip().split(None, 1)
+    return head[0].upper() if head else "OTHER"
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    starts = conn.info.get("query_start")
+    if not starts:
+        return
+    elapsed = time.perf_counter() - starts.pop()
+    DB_QUERY_DURATION.observe(elapsed, _statement_kind(statement))
+    stats = _request_stats.get()
+    if stats is not None:
+        stats.queries += 1
+        stats.query_seconds += elapsed
+
+
+def instrument_engine(engine: Engine) -> None:
+    """Attach query timing listeners to `engine` (idempotent)."""
+    if not event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+# ============= Threadpool / Email =============
+
+async def run_in_threadpool(func: Callable, *args, **kwargs):
+    """`starlette.concurrency.run_in_threadpool` that records queue wait."""
+    submitted = time.perf_counter()
+
+    def timed():
+        THREADPOOL_WAIT.observe(time.perf_counter() - submitted)
+        return func(*args, **kwargs)
+
+    return await _starlette_run_in_threadpool(timed)
+
+
+def timed_email(template: str, send: Callable[[], object]):
+    """Run an email API call, recording its latency and outcome."""
+    start = time.perf_counter()
+    outcome = "error"
+    try:
+        result = send()
+        outcome = "sent"
+        return result
+    finally:
+        EMAIL_SEND_DURATION.observe(time.perf_counter() - start, template, outcome)
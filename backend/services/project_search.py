@@ -0,0 +1,126 @@
+"""
+In-memory inverted index behind GET /api/projects/search.
+
+Built once per version of the cached project list (see routes/projects.py),
+so a search is a few dict/set operations instead of a scan over every
+project's full payload:
+
+  - postings: term → {project id: weight}, over title (3), tags and
+    technologies (2 each), category (2) and description (1)
+  - facet postings: category / tag / technology value → ids, used both for
+    filters and for the facet counts returned with every result set
+
+Query words match any indexed term they prefix ("pyt" → "pytorch"); every
+word must match (AND). Results rank by summed weight x IDF, ties by id.
+"""
+import bisect
+import math
+import re
+from collections import Counter
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+_TOKEN = re.compile(r"[a-z0-9][a-z0-9+#.-]*[a-z0-9+#]|[a-z0-9]")
+
+# (API field, weight); list fields index every element
+_TEXT_FIELDS: tuple[tuple[str, float], ...] = (
+    ("title", 3.0),
+    ("tags", 2.0),
+    ("technologies", 2.0),
+    ("category", 2.0),
+    ("description", 1.0),
+)
+FACET_FIELDS: tuple[tuple[str, str], ...] = (("category", "category"), ("tag", "tags"), ("technology", "technologies"))
+
+
+def tokenize(text: str) -> list[str]:
+    return _TOKEN.findall(text.lower())
+
+
+def _values(project: dict, field: str) -> list[str]:
+    value = project.get(field)
+    if value is None:
+        return []
+    return [v for v in value if isinstance(v, str)] if isinstance(value, list) else [str(value)]
+
+
+@dataclass
+class SearchResult:
+    total: int
+    ids: list[int]
+    facets: dict[str, dict[str, int]]
+
+
+class ProjectSearchIndex:
+    """Inverted index plus facet postings over a list of API-shaped project dicts."""
+
+    def __init__(self, projects: Iterable[dict]):
+        self._postings: dict[str, dict[int, float]] = {}
+        self._facets: dict[str, dict[str, set[int]]] = {name: {} for name, _ in FACET_FIELDS}
+        self._project_facets: dict[int, dict[str, tuple[str, ...]]] = {}
+        for project in projects:
+            self._add(project)
+        self._ids = frozenset(self._project_facets)
+        self._terms = sorted(self._postings)
+        n = len(self._ids)
+        self._idf = {term: math.log((1 + n) / (1 + len(ids))) + 1 for term, ids in self._postings.items()}
+        self._all_facets = self._count_facets(self._ids)
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def _add(self, project: dict) -> None:
+        pid = project["id"]
+        for field, weight in _TEXT_FIELDS:
+            for value in _values(project, field):
+                for token in tokenize(value):
+                    postings = self._postings.setdefault(token, {})
+                    postings[pid] = postings.get(pid, 0.0) + weight
+        facets = {}
+        for name, field in FACET_FIELDS:
+            values = tuple(dict.fromkeys(_values(project, field)))
+            facets[name] = values
+            for value in values:
+                self._facets[name].setdefault(value, set()).add(pid)
+        self._project_facets[pid] = facets
+
+    def _match_word(self, word: str) -> dict[int, float]:
+        """Score per project for every indexed term starting with `word`."""
+        scores: dict[int, float] = {}
+        start = bisect.bisect_left(self._terms, word)
+        for term in self._terms[start:]:
+            if not term.startswith(word):
+                break
+            idf = self._idf[term]
+            for pid, weight in self._postings[term].items():
+                scores[pid] = scores.get(pid, 0.0) + weight * idf
+        return scores
+
+    def _count_facets(self, ids: Iterable[int]) -> dict[str, dict[str, int]]:
+        counters = {name: Counter() for name, _ in FACET_FIELDS}
+        for pid in ids:
+            for name, values in self._project_facets[pid].items():
+                counters[name].update(values)
+        return {name: dict(sorted(counter.items(), key=lambda kv: (-kv[1], kv[0]))) for name, counter in counters.items()}
+
+    def search(self, q: str = "", filters: dict[str, list[str]] | None = None,
+               limit: int = 20, offset: int = 0) -> SearchResult:
+        """
+        Ranked ids matching every word of `q` and every filter value
+        (`filters` maps a facet name to required values), with facet counts
+        over the full match set.
+        """
+        candidates = set(self._ids)
+        for name, values in (filters or {}).items():
+            for value in values:
+                candidates &= self._facets[name].get(value, set())
+
+        scores = dict.fromkeys(candidates, 0.0)
+        for word in dict.fromkeys(tokenize(q)):
+            matched = self._match_word(word)
+            scores = {pid: score + matched[pid] for pid, score in scores.items() if pid in matched}
+
+        ranked = sorted(scores, key=lambda pid: (-scores[pid], pid))
+        unfiltered = not q.strip() and not any(filters.values() if filters else ())
+        facets = self._all_facets if unfiltered else self._count_facets(ranked)
+        return SearchResult(total=len(ranked), ids=ranked[offset:offset + limit], facets=facets)
@@ -3,20 +3,27 @@ Project Service with Repository Pattern.
 
 Architecture:
   - ProjectRepository (ABC) defines the interface
-  - JSONProjectRepository reads/writes a JSON file
+  - JSONProjectRepository serves a JSON file + edit journal from an in-memory index
   - DatabaseProjectRepository uses SQLAlchemy + PostgreSQL (active)
 
 The active repository is set via the `project_repo` singleton at the bottom.
 """
 import json
 import logging
-import threading
+import os
 from abc import ABC, abstractmethod
 from datetime import datetime, timezone
 from pathlib import Path
 
+from sqlalchemy.orm import selectinload
+
+from config import PROJECTS_JOURNAL_COMPACT_BYTES
 from database import SessionLocal
 from models import ProjectModel
+from services.similarity import refresh_similar_projects
+from services.sync import SyncCursor, read_changes, record_tombstones
+from utils.files import atomic_write_bytes, durable_append, file_signature
+from utils.rwlock import RWLock
 
 logger = logging.getLogger(__name__)
 
@@ -59,92 +66,180 @@ class ProjectRepository(ABC):
 
 class JSONProjectRepository(ProjectRepository):
     """
-    Thread-safe JSON-file backed repository.
-    Reads/writes to backend/data/projects.json.
+    JSON-file backed repository, served from memory.
+    Reads/writes backend/data/projects.json plus an append-only journal,
+    projects.json.journal.
+
+    Each create/update/delete appends one NDJSON line to the journal
+    ({"op": "put", "project": {...}} or {"op": "delete", "id": N}) and fsyncs
+    it, so an edit costs one small write instead of re-serializing every
+    project. Loading reads the snapshot and replays the journal; a torn last
+    line left by a crash is ignored and cut off before the next append. Once
+    the journal passes `compact_bytes` it is folded into the snapshot (atomic
+    temp file + fsync + rename) and emptied. Replaying a put or delete twice
+    is harmless, so a crash between those two steps loses nothing.
+
+    Projects are indexed by id in memory; the files are re-read only when
+    their signatures (inode, mtime, size) change, and journal growth from
+    another process is replayed from the last offset. Reads share an RWLock,
+    writes hold it exclusively. Assumes one writing process at a time (admin
+    edits); concurrent writers in different processes are not serialized.
     """
 
-    def __init__(self, file_path: str | None = None):
+    def __init__(self, file_path: str | None = None, compact_bytes: int = PROJECTS_JOURNAL_COMPACT_BYTES):
         if file_path is None:
             file_path = str(Path(__file__).resolve().parent.parent / "data" / "projects.json")
         self._file_path = Path(file_path)
-        self._lock = threading.Lock()
+        self._journal_path = self._file_path.with_name(self._file_path.name + ".journal")
+        self._compact_bytes = compact_bytes
+        self._lock = RWLock()
+        self._projects: dict[int, dict] = {}
+        self._snapshot_signature: tuple[int, int, int] | None = None
+        self._journal_signature: tuple[int, int, int] | None = None
+        self._journal_offset = 0  # bytes of complete journal lines applied
         self._ensure_file()
 
     def _ensure_file(self):
         """Create the data file and directory if they don't exist."""
         self._file_path.parent.mkdir(parents=True, exist_ok=True)
         if not self._file_path.exists():
-            self._file_path.write_text("[]", encoding="utf-8")
+            atomic_write_bytes(self._file_path, b"[]")
+
+    # --- Loading (caller holds the write lock) ---
 
-    def _read(self) -> list[dict]:
-        """Read all projects from disk."""
+    def _load(self) -> None:
+        """Rebuild the index from the snapshot, then replay the whole journal."""
+        self._snapshot_signature = file_signature(self._file_path)
         try:
-            content = self._file_path.read_text(encoding="utf-8").strip()
-            if not content:
-                return []
-            return json.loads(content)
-        except (json.JSONDecodeError, FileNotFoundError):
-            return []
-
-    def _write(self, projects: list[dict]):
-        """Write all projects to disk."""
-        self._file_path.write_text(
-            json.dumps(projects, indent=2, ensure_ascii=False),
-            encoding="utf-8",
+            content = self._file_path.read_bytes().strip()
+            projects = json.loads(content) if content else []
+        except (json.JSONDecodeError, FileNotFoundError) as e:
+            logger.warning("Could not read %s: %s", self._file_path, e)
+            projects = []
+        self._projects = {p["id"]: p for p in projects}
+        self._journal_offset = 0
+        self._replay_journal()
+
+    def _replay_journal(self) -> None:
+        """Apply complete journal lines past the current offset."""
+        self._journal_signature = file_signature(self._journal_path)
+        if self._journal_signature is None:
+            self._journal_offset = 0
+            return
+        with open(self._journal_path, "rb") as f:
+            f.seek(self._journal_offset)
+            tail = f.read()
+        for line in tail.splitlines(keepends=True):
+            if not line.endswith(b"\n"):
+                break  # torn write, or another process mid-append
+            try:
+                self._apply(json.loads(line))
+            except (json.JSONDecodeError, KeyError, TypeError) as e:
+                logger.warning("Stopping journal replay at byte %d of %s: %s",
+                               self._journal_offset, self._journal_path, e)
+                break
+            self._journal_offset += len(line)
+
+    def _apply(self, entry: dict) -> None:
+        if entry["op"] == "put":
+            self._projects[entry["project"]["id"]] = entry["project"]
+        elif entry["op"] == "delete":
+            self._projects.pop(entry["id"], None)
+        else:
+            raise KeyError(entry["op"])
+
+    def _refresh(self) -> None:
+        """Catch up with changes on disk (another process, or a manual edit)."""
+        if self._signatures_current():
+            return
+        with self._lock.write():
+            self._catch_up()
+
+    def _signatures_current(self) -> bool:
+        return (file_signature(self._file_path) == self._snapshot_signature
+                and file_signature(self._journal_path) == self._journal_signature)
+
+    def _catch_up(self) -> None:
+        if self._signatures_current():
+            return
+        journal = file_signature(self._journal_path)
+        appended_only = (
+            file_signature(self._file_path) == self._snapshot_signature
+            and journal is not None and self._journal_signature is not None
+            and journal[0] == self._journal_signature[0] and journal[2] >= self._journal_offset
         )
-
-    def _next_id(self, projects: list[dict]) -> int:
+        if appended_only:
+            self._replay_journal()
+        else:
+            self._load()
+
+    # --- Writing (caller holds the write lock) ---
+
+    def _append(self, entry: dict) -> None:
+        """Journal `entry` durably, then apply it in memory."""
+        journal = file_signature(self._journal_path)
+        if journal is not None and journal[2] > self._journal_offset:
+            os.truncate(self._journal_path, self._journal_offset)  # drop a torn tail
+        line = (json.dumps(entry, ensure_ascii=False, separators=(",", ":")) + "\n").encode("utf-8")
+        self._journal_offset = durable_append(self._journal_path, line)
+        self._journal_signature = file_signature(self._journal_path)
+        self._apply(entry)
+        if self._journal_offset > self._compact_bytes:
+            self._compact()
+
+    def _compact(self) -> None:
+        """Fold the journal into the snapshot file and empty it."""
+        data = json.dumps(list(self._projects.values()), indent=2, ensure_ascii=False).encode("utf-8")
+        atomic_write_bytes(self._file_path, data)
+        atomic_write_bytes(self._journal_path, b"")
+        self._snapshot_signature = file_signature(self._file_path)
+        self._journal_signature = file_signature(self._journal_path)
+        self._journal_offset = 0
+
+    def _next_id(self) -> int:
         """Generate the next auto-increment ID."""
-        if not projects:
-            return 1
-        return max(p.get("id", 0) for p in projects) + 1
+        return max(self._projects, default=0) + 1
 
     # --- Public API ---
 
     def get_all(self) -> list[dict]:
-        with self._lock:
-            return self._read()
+        self._refresh()
+        with self._lock.read():
+            return [dict(p) for p in self._projects.values()]
 
     def get_by_id(self, project_id: int) -> dict | None:
-        with self._lock:
-            projects = self._read()
-            return next((p for p in projects if p["id"] == project_id), None)
+        self._refresh()
+        with self._lock.read():
+            project = self._projects.get(project_id)
+            return dict(project) if project is not None else None
 
     def create(self, project_data: dict) -> dict:
         now = datetime.now(timezone.utc).isoformat()
-        with self._lock:
-            projects = self._read()
-            project_data["id"] = self._next_id(projects)
-            project_data["created_at"] = now
-            project_data["updated_at"] = now
-            projects.append(project_data)
-            self._write(projects)
-        return project_data
+        with self._lock.write():
+            self._catch_up()
+            project = {**project_data, "id": self._next_id(), "created_at": now, "updated_at": now}
+            self._append({"op": "put", "project": project})
+        return dict(project)
 
     def update(self, project_id: int, updates: dict) -> dict | None:
         now = datetime.now(timezone.utc).isoformat()
-        with self._lock:
-            projects = self._read()
-            for i, p in enumerate(projects):
-                if p["id"] == project_id:
-                    # Only update provided (non-None) fields
-                    for key, value in updates.items():
-                        if value is not None:
-                            projects[i][key] = value
-                    projects[i]["updated_at"] = now
-                    self._write(projects)
-                    return p
-        return None
+        with self._lock.write():
+            self._catch_up()
+            current = self._projects.get(project_id)
+            if current is None:
+                return None
+            # Only update provided (non-None) fields
+            project = {**current, **{k: v for k, v in updates.items() if v is not None}, "updated_at": now}
+            self._append({"op": "put", "project": project})
+        return dict(project)
 
     def delete(self, project_id: int) -> bool:
-        with self._lock:
-            projects = self._read()
-            original_len = len(projects)
-            projects = [p for p in projects if p["id"] != project_id]
-            if len(projects) < original_len:
-                self._write(projects)
-                return True
-        return False
+        with self._lock.write():
+            self._catch_up()
+            if project_id not in self._projects:
+                return False
+            self._append({"op": "delete", "id": project_id})
+        return True
 
 
 # ============= Database Implementation =============
@@ -228,8 +323,12 @@ def _dict_to_model_kwargs(data: dict) -> dict:
 class DatabaseProjectRepository(ProjectRepository):
     """
     PostgreSQL-backed repository using SQLAlchemy ORM.
-    Reads from / writes to the `projects` table in Neon.
+    Reads from / writes to the `projects` table in Neon, with the long-form
+    sections in `project_details` (models.ProjectDetailModel); the model's
+    proxies keep the split invisible to the API dicts.
     Uses context-managed sessions for proper resource cleanup.
+    Every write recomputes similar_project_ids (services/similarity.py) in
+    the same transaction; deletes leave a sync tombstone (services/sync.py).
     """
 
     @staticmethod
@@ -248,11 +347,13 @@ class DatabaseProjectRepository(ProjectRepository):
 
     def get_all(self) -> list[dict]:
         with self._session() as db:
-            rows = db.query(ProjectModel).order_by(ProjectModel.id).all()
+            # Details for every project in one extra IN query rather than one per row
+            rows = db.query(ProjectModel).options(selectinload(ProjectModel.details)).order_by(ProjectModel.id).all()
             return [_model_to_dict(r) for r in rows]
 
     def get_by_id(self, project_id: int) -> dict | None:
         with self._session() as db:
+            # project_details is loaded lazily, when _model_to_dict reads the first heavy field
             row = db.query(ProjectModel).filter(ProjectModel.id == project_id).first()
             return _model_to_dict(row) if row else None
 
@@ -262,6 +363,8 @@ class DatabaseProjectRepository(ProjectRepository):
                 kwargs = _dict_to_model_kwargs(project_data)
                 project = ProjectModel(**kwargs)
                 db.add(project)
+                db.flush()
+                refresh_similar_projects(db)
                 db.commit()
                 db.refresh(project)
                 return _model_to_dict(project)
@@ -279,6 +382,8 @@ class DatabaseProjectRepository(ProjectRepository):
                 for col, value in kwargs.items():
                     setattr(row, col, value)
                 row.updated_at = datetime.now(timezone.utc)
+                db.flush()
+                refresh_similar_projects(db)
                 db.commit()
                 db.refresh(row)
                 return _model_to_dict(row)
@@ -293,6 +398,9 @@ class DatabaseProjectRepository(ProjectRepository):
                 if not row:
                     return False
                 db.delete(row)
+                record_tombstones(db, ProjectModel.__tablename__, [project_id])
+                db.flush()
+                refresh_similar_projects(db)
                 db.commit()
                 return True
             except Exception:
@@ -334,6 +442,14 @@ def delete_project(project_id: int) -> bool:
     return project_repo.delete(project_id)
 
 
+def get_project_changes(since: SyncCursor | None, limit: int) -> dict:
+    """Projects created, updated or deleted after `since` (delta sync feed, see services/sync.py)."""
+    with DatabaseProjectRepository._session() as db:
+        query = db.query(ProjectModel).options(selectinload(ProjectModel.details))
+        return read_changes(db, ProjectModel.__tablename__, query, ProjectModel.updated_at, ProjectModel.id,
+                            _model_to_dict, since, limit)
+
+
 def get_version_info() -> dict:
     """Return lightweight version info: count + last updated timestamp."""
     try:
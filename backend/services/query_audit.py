@@ -0,0 +1,116 @@
+"""
+Query auditor for development and tests: N+1 and slow-query detection.
+
+Hooks SQLAlchemy `before/after_cursor_execute` on an engine and records every
+statement into the active `QueryLog` (a ContextVar, so each request or test
+block gets its own log, including queries issued from worker threads).
+
+  - Statements slower than `slow_query_ms` are logged with their EXPLAIN plan
+    (`EXPLAIN QUERY PLAN` on SQLite), run on the same DBAPI connection.
+  - `middleware.query_audit.QueryAuditMiddleware` logs requests that exceed
+    a statement budget or repeat the same SQL — the usual N+1 signature.
+  - Tests use `QueryAuditor.track()` (wrapped by the `query_budget` fixture
+    in tests/conftest.py) to fail when a route exceeds its declared budget.
+
+Disabled by default; set QUERY_AUDIT_ENABLED=true for local development.
+"""
+import logging
+import time
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from config import QUERY_AUDIT_SLOW_MS
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class QueryLog:
+    statements: list[str] = field(default_factory=list)
+    durations: list[float] = field(default_factory=list)
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+    def repeated(self, threshold: int) -> dict[str, int]:
+        """Statements executed at least `threshold` times (N+1 candidates)."""
+        return {sql: n for sql, n in Counter(self.statements).items() if n >= threshold}
+
+    def summary(self) -> str:
+        return "\n".join(f"  [{i + 1}] {sql.strip()}" for i, sql in enumerate(self.statements))
+
+
+_active_log: ContextVar[QueryLog | None] = ContextVar("query_audit_log", default=None)
+
+
+class QueryAuditor:
+    """Statement recorder and slow-query EXPLAIN logger for one or more engines."""
+
+    def __init__(self, slow_query_ms: float = QUERY_AUDIT_SLOW_MS, explain: bool = True):
+        self.slow_query_ms = slow_query_ms
+        self.explain = explain
+
+    def attach(self, engine: Engine) -> None:
+        if not event.contains(engine, "before_cursor_execute", self._before):
+            event.listen(engine, "before_cursor_execute", self._before)
+            event.listen(engine, "after_cursor_execute", self._after)
+
+    def detach(self, engine: Engine) -> None:
+        if event.contains(engine, "before_cursor_execute", self._before):
+            event.remove(engine, "before_cursor_execute", self._before)
+            event.remove(engine, "after_cursor_execute", self._after)
+
+    @contextmanager
+    def track(self) -> Iterator[QueryLog]:
+        """Record every statement executed inside the block."""
+        log = QueryLog()
+        token = _active_log.set(log)
+        try:
+            yield log
+        finally:
+            _active_log.reset(token)
+
+    # ── Engine events ──
+
+    def _before(self, conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("audit_start", []).append(time.perf_counter())
+
+    def _after(self, conn, cursor, statement, parameters, context, executemany):
+        starts = conn.info.get("audit_start")
+        if not starts:
+            return
+        elapsed_ms = (time.perf_counter() - starts.pop()) * 1000
+        log = _active_log.get()
+        if log is not None:
+            log.statements.append(statement)
+            log.durations.append(elapsed_ms)
+        if elapsed_ms >= self.slow_query_ms:
+            plan = self._explain(conn, statement, parameters) if self.explain and not executemany else None
+            logger.warning(
+                "Slow query (%.1f ms): %s\nParameters: %r%s",
+                elapsed_ms, statement.strip(), parameters,
+                f"\nPlan:\n{plan}" if plan else "",
+            )
+
+    @staticmethod
+    def _explain(conn, statement: str, parameters) -> str | None:
+        """EXPLAIN a SELECT on the raw DBAPI connection (bypasses these events)."""
+        if not statement.lstrip().upper().startswith(("SELECT", "WITH")):
+            return None
+        prefix = "EXPLAIN QUERY PLAN " if conn.dialect.name == "sqlite" else "EXPLAIN "
+        try:
+            cursor = conn.connection.dbapi_connection.cursor()
+            try:
+                cursor.execute(prefix + statement, parameters)
+                return "\n".join("  " + " | ".join(str(col) for col in row) for row in cursor.fetchall())
+            finally:
+                cursor.close()
+        except Exception as exc:  # pragma: no cover - plan is best effort
+            return f"  (EXPLAIN failed: {exc})"
@@ -0,0 +1,248 @@
+"""
+Shared rate limiter for every router.
+
+All routes decorate with the single `limiter` defined here so that limits are
+counted in one place, keyed on the proxy-aware client IP. The storage backend
+is selected by RATE_LIMIT_STORAGE_URI:
+
+  - memory://                 in-process moving window (single worker)
+  - sqlite:///path/to/file.db file store shared by all workers on one host
+  - redis://host:6379/0       any Redis-protocol server (Redis, Valkey, KeyDB…)
+
+With the in-memory backend each uvicorn worker counts separately, so the
+effective limit is N × the configured rate. Use the SQLite or Redis backend
+when running more than one worker.
+
+Public routes are limited by cost rather than by request count: each route
+declares what one call costs (see ROUTE_COSTS) and spends that many tokens
+from a per-IP and a global budget. Over a moving window this behaves like a
+token bucket whose tokens return one window after they were spent, so a CV
+dispatch drains a client's budget twenty times faster than a cached read.
+"""
+import logging
+import os
+import sqlite3
+import threading
+import time
+from urllib.parse import urlparse
+
+from fastapi import Request
+from limits.storage import MovingWindowSupport, Storage
+from slowapi import Limiter
+
+from config import (
+    RATE_LIMIT_BUDGET_GLOBAL,
+    RATE_LIMIT_BUDGET_IP,
+    RATE_LIMIT_STORAGE_URI,
+    RATE_LIMIT_STRATEGY,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def get_real_ip(request: Request) -> str:
+    """Extract real client IP from X-Forwarded-For (proxy-safe)."""
+    forwarded = request.headers.get("X-Forwarded-For")
+    if forwarded:
+        return forwarded.split(",")[0].strip()
+    return request.client.host if request.client else "127.0.0.1"
+
+
+# ============= SQLite File Storage =============
+
+class SQLiteStorage(Storage, MovingWindowSupport):
+    """
+    Rate limit storage in a local SQLite file.
+
+    Every worker on the host opens the same file, and each hit runs inside a
+    `BEGIN IMMEDIATE` transaction, so counts are shared and race-free across
+    processes. WAL mode keeps readers from blocking the single writer.
+
+    URI format mirrors SQLAlchemy: `sqlite:///relative.db` or
+    `sqlite:////absolute/path.db`.
+    """
+
+    STORAGE_SCHEME = ["sqlite"]
+
+    # How often (seconds) expired rows are swept from the tables
+    _SWEEP_INTERVAL = 60.0
+
+    def __init__(self, uri: str | None = None, wrap_exceptions: bool = False, **options):
+        path = urlparse(uri or "").path
+        self._path = path[1:] if path.startswith("/") else path
+        if not self._path:
+            raise ValueError("SQLite rate limit storage requires a file path, e.g. sqlite:///ratelimit.db")
+        self._timeout = float(options.get("timeout", 5.0))
+        self._local = threading.local()
+        self._last_sweep = 0.0
+        super().__init__(uri, wrap_exceptions=wrap_exceptions, **options)
+        self._init_schema()
+
+    @property
+    def base_exceptions(self) -> type[Exception] | tuple[type[Exception], ...]:
+        return sqlite3.Error
+
+    def _conn(self) -> sqlite3.Connection:
+        """Return this thread's connection (sqlite3 connections are not thread-safe)."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None or getattr(self._local, "pid", None) != os.getpid():
+            conn = sqlite3.connect(self._path, timeout=self._timeout, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    def _init_schema(self) -> None:
+        conn = self._conn()
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS rl_counters ("
+            " key TEXT PRIMARY KEY, value INTEGER NOT NULL, expires_at REAL NOT NULL)"
+        )
+        conn.execute("CREATE TABLE IF NOT EXISTS rl_entries (key TEXT NOT NULL, atime REAL NOT NULL)")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_rl_entries_key_atime ON rl_entries (key, atime)")
+
+    def _maybe_sweep(self, conn: sqlite3.Connection, now: float) -> None:
+        """Drop expired counters/entries at most once per sweep interval."""
+        if now - self._last_sweep < self._SWEEP_INTERVAL:
+            return
+        self._last_sweep = now
+        conn.execute("DELETE FROM rl_counters WHERE expires_at <= ?", (now,))
+        # Moving-window entries never outlive the longest configured window (1 day)
+        conn.execute("DELETE FROM rl_entries WHERE atime <= ?", (now - 86400,))
+
+    # --- Fixed window ---
+
+    def incr(self, key: str, expiry: int, amount: int = 1) -> int:
+        now = time.time()
+        conn = self._conn()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.execute("DELETE FROM rl_counters WHERE key = ? AND expires_at <= ?", (key, now))
+            conn.execute(
+                "INSERT INTO rl_counters (key, value, expires_at) VALUES (?, ?, ?)"
+                " ON CONFLICT(key) DO UPDATE SET value = value + excluded.value",
+                (key, amount, now + expiry),
+            )
+            (value,) = conn.execute("SELECT value FROM rl_counters WHERE key = ?", (key,)).fetchone()
+            self._maybe_sweep(conn, now)
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        return value
+
+    def get(self, key: str) -> int:
+        row = self._conn().execute(
+            "SELECT value FROM rl_counters WHERE key = ? AND expires_at > ?", (key, time.time())
+        ).fetchone()
+        return row[0] if row else 0
+
+    def get_expiry(self, key: str) -> float:
+        row = self._conn().execute("SELECT expires_at FROM rl_counters WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else time.time()
+
+    def check(self) -> bool:
+        try:
+            self._conn().execute("SELECT 1")
+            return True
+        except sqlite3.Error:
+            return False
+
+    def reset(self) -> int | None:
+        conn = self._conn()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            (counters,) = conn.execute("SELECT COUNT(*) FROM rl_counters").fetchone()
+            (keys,) = conn.execute("SELECT COUNT(DISTINCT key) FROM rl_entries").fetchone()
+            conn.execute("DELETE FROM rl_counters")
+            conn.execute("DELETE FROM rl_entries")
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        return max(counters, keys)
+
+    def clear(self, key: str) -> None:
+        conn = self._conn()
+        conn.execute("DELETE FROM rl_counters WHERE key = ?", (key,))
+        conn.execute("DELETE FROM rl_entries WHERE key = ?", (key,))
+
+    # --- Moving window ---
+
+    def acquire_entry(self, key: str, limit: int, expiry: int, amount: int = 1) -> bool:
+        if amount > limit:
+            return False
+        now = time.time()
+        conn = self._conn()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.execute("DELETE FROM rl_entries WHERE key = ? AND atime <= ?", (key, now - expiry))
+            (count,) = conn.execute("SELECT COUNT(*) FROM rl_entries WHERE key = ?", (key,)).fetchone()
+            acquired = count + amount <= limit
+            if acquired:
+                conn.executemany("INSERT INTO rl_entries (key, atime) VALUES (?, ?)", [(key, now)] * amount)
+            self._maybe_sweep(conn, now)
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        return acquired
+
+    def get_moving_window(self, key: str, limit: int, expiry: int) -> tuple[float, int]:
+        now = time.time()
+        oldest, count = self._conn().execute(
+            "SELECT MIN(atime), COUNT(*) FROM rl_entries WHERE key = ? AND atime > ?",
+            (key, now - expiry),
+        ).fetchone()
+        return (oldest, count) if count else (now, 0)
+
+
+# ============= Singleton Limiter =============
+
+limiter = Limiter(
+    key_func=get_real_ip,
+    storage_uri=RATE_LIMIT_STORAGE_URI,
+    strategy=RATE_LIMIT_STRATEGY,
+)
+
+
+# ============= Cost-Weighted Budgets =============
+
+# Tokens spent per call, roughly proportional to the backend work triggered
+ROUTE_COSTS: dict[str, int] = {
+    "cached_read": 1,   # in-memory cached payloads (project list, version)
+    "db_read": 2,       # uncached single-row DB read
+    "contact": 10,      # DB write + acknowledgment + admin notification
+    "cv_request": 20,   # DB write + CV email with PDF attachment + admin notification
+    "export": 25,       # full-table scan rendered to CSV/JSON
+}
+
+
+def _global_key() -> str:
+    """Single key so every client draws from the same global budget."""
+    return "global"
+
+
+def public_budget(cost: int):
+    """
+    Charge `cost` tokens per call against the per-IP and the global budget.
+
+    Both budgets are shared across all decorated routes, so a client that
+    spends its allowance on CV requests cannot keep hammering cheap reads
+    (and vice versa).
+
+    slowapi checks limits in the order they were applied and stops at the
+    first one exceeded, so the per-IP budget is applied first: a request it
+    rejects never spends global tokens, and one client cannot drain the
+    global budget for everyone else.
+    """
+    def decorator(func):
+        func = limiter.shared_limit(RATE_LIMIT_BUDGET_IP, scope="budget:ip", cost=cost)(func)
+        return limiter.shared_limit(
+            RATE_LIMIT_BUDGET_GLOBAL, scope="budget:global", key_func=_global_key, cost=cost,
+        )(func)
+    return decorator
+
+
+logger.info("Rate limiter storage: %s (%s)", urlparse(RATE_LIMIT_STORAGE_URI).scheme, RATE_LIMIT_STRATEGY)
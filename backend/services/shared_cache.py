@@ -0,0 +1,181 @@
+"""
+Host-wide cache tier shared by all uvicorn/gunicorn workers.
+
+Each key is one file under SHARED_CACHE_DIR: a fixed header (magic,
+version, created/expiry times, body length) followed by the serialized
+response body. Workers mmap the file and slice the body out per request, so
+the bytes live once in the page cache instead of once per worker as Python
+objects.
+
+On a miss or expiry a worker takes an exclusive `flock` on the key's lock
+file and calls the loader; the new entry (version + 1) is written to a temp
+file and renamed into place, which readers notice by the changed inode.
+Other workers that find the lock taken keep serving the stale body, or wait
+for the refresher when they have nothing to serve, so a cold start or
+expiry costs one load per host rather than one per worker.
+
+Entries outlive the process, so startup drops those loaded before it
+(`invalidate_all`): a deploy or migration may have changed what they hold.
+
+Without `fcntl` (Windows) there is no cross-process lock and each worker
+refreshes on its own.
+"""
+import logging
+import mmap
+import os
+import struct
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+
+from config import SHARED_CACHE_DIR
+from utils.files import atomic_write_bytes, file_signature
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+_MAGIC = b"PFCACHE1"
+# magic, version, created_at, expires_at, body length
+_HEADER = struct.Struct("<8sQddQ")
+
+
+@dataclass(frozen=True)
+class SharedEntry:
+    version: int
+    created_at: float
+    expires_at: float
+    body: bytes
+
+
+class _Mapped:
+    """An open mmap of one cache file, valid while the file keeps its signature."""
+
+    __slots__ = ("signature", "map", "version", "created_at", "expires_at", "length")
+
+    def __init__(self, path: Path):
+        with open(path, "rb") as f:
+            self.signature = file_signature(path)
+            self.map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self.version, self.created_at, self.expires_at, self.length = _HEADER.unpack_from(self.map)
+        if magic != _MAGIC or _HEADER.size + self.length > len(self.map):
+            self.map.close()
+            raise ValueError(f"corrupt shared cache file {path}")
+
+    def entry(self) -> SharedEntry:
+        body = self.map[_HEADER.size:_HEADER.size + self.length]
+        return SharedEntry(self.version, self.created_at, self.expires_at, body)
+
+
+class SharedCache:
+    """Serialized values shared through files in `directory`, refreshed by one worker at a time."""
+
+    def __init__(self, directory: str | Path = SHARED_CACHE_DIR):
+        self._directory = Path(directory)
+        self._directory.mkdir(parents=True, exist_ok=True)
+        self._mapped: dict[str, _Mapped] = {}
+        self._mapped_lock = threading.Lock()  # remaps close maps other threads may be slicing
+
+    def _path(self, key: str) -> Path:
+        return self._directory / f"{key}.cache"
+
+    def _lock_path(self, key: str) -> Path:
+        return self._directory / f"{key}.lock"
+
+    def _read(self, key: str) -> SharedEntry | None:
+        """Current entry from disk (re-mapped only when the file was replaced)."""
+        with self._mapped_lock:
+            return self._read_locked(key)
+
+    def _read_locked(self, key: str) -> SharedEntry | None:
+        path = self._path(key)
+        signature = file_signature(path)
+        mapped = self._mapped.get(key)
+        if mapped is not None and mapped.signature == signature:
+            return mapped.entry()
+        if mapped is not None:
+            del self._mapped[key]
+            mapped.map.close()
+        if signature is None:
+            return None
+        try:
+            mapped = _Mapped(path)
+        except (FileNotFoundError, ValueError, struct.error) as e:
+            logger.warning("Ignoring shared cache entry %r: %s", key, e)
+            return None
+        self._mapped[key] = mapped
+        return mapped.entry()
+
+    def get(self, key: str, loader: Callable[[], bytes], ttl: float) -> SharedEntry:
+        """
+        Fresh entry for `key`, calling `loader` (which returns the serialized
+        body) only in the one worker that wins the refresh lock.
+        """
+        entry = self._read(key)
+        if entry is not None and entry.expires_at > time.time():
+            return entry
+        if fcntl is None:
+            return self._refresh(key, loader, ttl, entry)
+
+        with open(self._lock_path(key), "a") as lock:
+            try:
+                fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                if entry is not None:
+                    return entry  # another worker is refreshing; serve stale meanwhile
+                fcntl.flock(lock, fcntl.LOCK_EX)  # cold: wait for its result
+            try:
+                # Whoever held the lock may just have refreshed it
+                current = self._read(key)
+                if current is not None and current.expires_at > time.time():
+                    return current
+                return self._refresh(key, loader, ttl, current)
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+    def _refresh(self, key: str, loader: Callable[[], bytes], ttl: float, previous: SharedEntry | None) -> SharedEntry:
+        # created_at is taken before loading: the body reflects data as of this time
+        started = time.time()
+        body = loader()
+        version = previous.version + 1 if previous is not None else 1
+        expires_at = time.time() + ttl
+        atomic_write_bytes(self._path(key), _HEADER.pack(_MAGIC, version, started, expires_at, len(body)) + body)
+        return SharedEntry(version, started, expires_at, body)
+
+    def invalidate(self, key: str, published_at: float | None = None) -> None:
+        """
+        Drop `key` for every worker on the host. With `published_at`, an entry
+        loaded after that time already reflects the change and is kept. Waits
+        for an in-flight refresh, whose result may predate the change.
+        """
+        if fcntl is None:
+            self._unlink_if_older(key, published_at)
+            return
+        with open(self._lock_path(key), "a") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                self._unlink_if_older(key, published_at)
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+    def invalidate_all(self, published_at: float | None = None) -> None:
+        """`invalidate` every key on disk."""
+        for path in self._directory.glob("*.cache"):
+            self.invalidate(path.stem, published_at)
+
+    def _unlink_if_older(self, key: str, published_at: float | None) -> None:
+        entry = self._read(key)
+        if entry is None or (published_at is not None and entry.created_at > published_at):
+            return
+        try:
+            os.unlink(self._path(key))
+        except FileNotFoundError:
+            pass
+
+
+shared_cache = SharedCache()
@@ -0,0 +1,197 @@
+"""
+Static snapshots of the public read endpoints.
+
+The project list, about data and public site settings change a few times a
+month, so after each admin edit the editing worker renders them to static
+files that nginx or a CDN can serve with the backend off the read path:
+
+    SNAPSHOT_DIR/
+      manifest.json                  no-cache; points at the current files
+      projects.<hash>.json           immutable: name changes with content
+      projects.<hash>.json.gz        precompressed (nginx gzip_static)
+      projects.<hash>.json.br        precompressed (brotli_static, if brotli is installed)
+      about.<hash>.json ...
+      site-settings.<hash>.json ...
+
+A client fetches the small manifest, then the hashed files it references,
+which can be cached forever (`Cache-Control: public, max-age=31536000,
+immutable`). Publishes run one at a time per host (render, write and
+manifest update under one lock), so the manifest only moves to newer
+content. Files are written before the manifest that names them, and the
+last SNAPSHOT_KEEP_VERSIONS versions per snapshot are kept for clients
+holding an older manifest. Publishing is a no-op when SNAPSHOT_DIR is unset.
+
+`DirectoryStore` is the storage backend; an object store (S3, R2) would
+implement the same put/get/delete/lock interface.
+"""
+import json
+import logging
+import os
+import time
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+
+from config import SNAPSHOT_DIR, SNAPSHOT_KEEP_VERSIONS
+from middleware.compression import PrecompressedJSON
+from utils.files import atomic_write_bytes
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+MANIFEST = "manifest.json"
+_SUFFIXES = {"gzip": ".gz", "br": ".br"}
+
+
+class DirectoryStore:
+    """Snapshot files in a local directory, replaced atomically."""
+
+    def __init__(self, directory: str | Path):
+        self._directory = Path(directory)
+        self._directory.mkdir(parents=True, exist_ok=True)
+
+    def put(self, key: str, data: bytes) -> None:
+        atomic_write_bytes(self._directory / key, data)
+
+    def get(self, key: str) -> bytes | None:
+        try:
+            return (self._directory / key).read_bytes()
+        except FileNotFoundError:
+            return None
+
+    def delete(self, key: str) -> None:
+        try:
+            os.unlink(self._directory / key)
+        except FileNotFoundError:
+            pass
+
+    @contextmanager
+    def lock(self):
+        """Serialize publishes across workers (no-op without fcntl)."""
+        if fcntl is None:
+            yield
+            return
+        with open(self._directory / ".publish.lock", "a") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+
+class SnapshotPublisher:
+    """Renders registered snapshots into a store and keeps its manifest current."""
+
+    def __init__(self, store: DirectoryStore | None, keep: int = SNAPSHOT_KEEP_VERSIONS):
+        self._store = store
+        self._keep = max(keep, 1)
+        self._renderers: dict[str, tuple[Callable[[], PrecompressedJSON], str]] = {}
+        self._executor: ThreadPoolExecutor | None = None
+
+    @property
+    def enabled(self) -> bool:
+        return self._store is not None
+
+    def register(self, name: str, render: Callable[[], PrecompressedJSON], source: str) -> None:
+        """`render()` returns the encoded body of the public endpoint at `source`."""
+        self._renderers[name] = (render, source)
+
+    def schedule(self, *names: str) -> Future | None:
+        """
+        Publish `names` (default: all) on a background thread, one publish
+        at a time per process, so admin requests don't wait for brotli.
+        Returns None when disabled.
+        """
+        if not self.enabled:
+            return None
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="snapshot-publisher")
+        return self._executor.submit(self._publish_logged, names)
+
+    def stop(self) -> None:
+        """Finish scheduled publishes."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def publish(self, *names: str) -> dict | None:
+        """
+        Render `names` (default: all) and point the manifest at them.
+        Returns the manifest, or None when disabled.
+        """
+        if not self.enabled:
+            return None
+        names = names or tuple(self._renderers)
+        with self._store.lock():
+            # Render under the lock: a worker that rendered before another
+            # worker's later edit must not be able to write after it
+            rendered = {name: self._renderers[name][0]() for name in names}
+            manifest = self._read_manifest()
+            changed, expired = False, []
+            for name, body in rendered.items():
+                digest = body.etag.strip('"')
+                entry = manifest["snapshots"].get(name)
+                if entry is not None and entry["hash"] == digest:
+                    continue  # unchanged (e.g. published by another worker already)
+                new_entry = self._write(name, digest, body)
+                history = [entry["path"], *entry.get("previous", [])] if entry is not None else []
+                history = [path for path in history if path != new_entry["path"]]
+                new_entry["previous"] = history[:self._keep - 1]
+                expired += history[self._keep - 1:]
+                manifest["snapshots"][name] = new_entry
+                changed = True
+            if changed:
+                manifest["version"] += 1
+                manifest["published_at"] = datetime.now(timezone.utc).isoformat()
+                self._store.put(MANIFEST, json.dumps(manifest, indent=2).encode("utf-8"))
+                # Older versions go only after the manifest stops referencing them
+                for path in expired:
+                    self._delete(path)
+        return manifest
+
+    def _publish_logged(self, names: tuple[str, ...]) -> None:
+        start = time.perf_counter()
+        try:
+            manifest = self.publish(*names)
+        except Exception:
+            logger.exception("Publishing snapshots %s failed", names)
+            return
+        logger.info("Published snapshots %s (manifest v%d) in %.0f ms",
+                    names, manifest["version"], (time.perf_counter() - start) * 1000)
+
+    def _read_manifest(self) -> dict:
+        raw = self._store.get(MANIFEST)
+        if raw is not None:
+            try:
+                return json.loads(raw)
+            except json.JSONDecodeError:
+                logger.warning("Replacing unreadable snapshot manifest")
+        return {"version": 0, "published_at": None, "snapshots": {}}
+
+    def _write(self, name: str, digest: str, body: PrecompressedJSON) -> dict:
+        path = f"{name}.{digest}.json"
+        for encoding, data in body.variants.items():
+            self._store.put(path + _SUFFIXES[encoding], data)
+        self._store.put(path, body.identity)
+        return {
+            "path": path,
+            "hash": digest,
+            "bytes": len(body.identity),
+            "encodings": sorted(body.variants),
+            "source": self._renderers[name][1],
+            "published_at": datetime.now(timezone.utc).isoformat(),
+        }
+
+    def _delete(self, path: str) -> None:
+        self._store.delete(path)
+        for suffix in _SUFFIXES.values():
+            self._store.delete(path + suffix)
+
+
+snapshot_publisher = SnapshotPublisher(DirectoryStore(SNAPSHOT_DIR) if SNAPSHOT_DIR else None)
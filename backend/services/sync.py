@@ -0,0 +1,123 @@
+"""
+Delta sync: `?since=` change feeds over `updated_at`, with tombstones.
+
+Clients keep a local copy of a collection (projects, leads) and ask only
+for what changed after their cursor instead of refetching everything:
+
+  - A cursor is the (updated_at, id) of the last change seen, encoded as
+    "<ISO timestamp>_<id>" (a bare timestamp also works). Rows are read in
+    (updated_at, id) order with a keyset predicate served by an
+    (updated_at, id) index, so pages never skip or repeat rows that share a
+    timestamp (bulk updates stamp many rows at once).
+  - Deletes leave a tombstone (models.SyncTombstoneModel) in the same
+    transaction; the feed merges them with live rows by time. Clients apply
+    `deleted` before `changes`.
+  - Changes younger than SYNC_SETTLE_SECONDS are held back until a later
+    poll: a transaction that stamped updated_at earlier but committed later
+    would otherwise land behind a cursor that has already moved past it.
+  - Tombstones are pruned after SYNC_TOMBSTONE_RETENTION_DAYS. A missing or
+    older cursor gets `reset: true` and the collection from the start; the
+    client replaces its copy with it.
+"""
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import and_, delete, insert, or_
+from sqlalchemy.orm import Query, Session
+
+from config import SYNC_SETTLE_SECONDS, SYNC_TOMBSTONE_RETENTION_DAYS
+from models import SyncTombstoneModel
+
+_CHANGE, _DELETE = 0, 1
+
+
+def _naive_utc(value: datetime) -> datetime:
+    """Timestamps are stored as naive UTC."""
+    return value.astimezone(timezone.utc).replace(tzinfo=None) if value.tzinfo is not None else value
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+@dataclass(frozen=True, order=True)
+class SyncCursor:
+    at: datetime
+    id: int = 0
+
+    def encode(self) -> str:
+        return f"{self.at.isoformat()}_{self.id}"
+
+    @classmethod
+    def parse(cls, value: str) -> "SyncCursor":
+        """Decode a cursor (or a bare ISO timestamp). Raises ValueError if malformed."""
+        at, sep, id_ = value.strip().partition("_")
+        return cls(_naive_utc(datetime.fromisoformat(at)), int(id_) if sep else 0)
+
+
+def after(updated_at, id_, cursor: SyncCursor):
+    """SQL predicate (updated_at, id) > cursor, written so an (updated_at, id) index serves it."""
+    return or_(updated_at > cursor.at, and_(updated_at == cursor.at, id_ > cursor.id))
+
+
+def record_tombstones(db: Session, entity: str, ids: Iterable[int]) -> None:
+    """Tombstone deleted rows of `entity` and prune its expired tombstones. The caller commits."""
+    now = _now()
+    rows = [{"entity": entity, "entity_id": i, "deleted_at": now} for i in ids]
+    if rows:
+        db.execute(insert(SyncTombstoneModel), rows)
+    db.execute(
+        delete(SyncTombstoneModel)
+        .where(SyncTombstoneModel.entity == entity,
+               SyncTombstoneModel.deleted_at < now - timedelta(days=SYNC_TOMBSTONE_RETENTION_DAYS))
+        .execution_options(synchronize_session=False)
+    )
+
+
+def read_changes(db: Session, entity: str, query: Query, updated_at, id_, serialize: Callable,
+                 since: SyncCursor | None, limit: int) -> dict:
+    """
+    One page of the change feed for `entity`: rows of `query` (a query over
+    the entity's table; `updated_at`/`id_` are its columns) changed after
+    `since`, serialized with `serialize`, plus tombstones, oldest first.
+    """
+    now = _now()
+    until = now - timedelta(seconds=SYNC_SETTLE_SECONDS)
+    reset = since is None or since.at < now - timedelta(days=SYNC_TOMBSTONE_RETENTION_DAYS)
+    if reset:
+        since = None
+
+    rows = query.filter(updated_at <= until)
+    if since is not None:
+        rows = rows.filter(after(updated_at, id_, since))
+    items = [
+        (SyncCursor(_naive_utc(row.updated_at), row.id), _CHANGE, row)
+        for row in rows.order_by(updated_at, id_).limit(limit + 1)
+    ]
+    if since is not None:
+        # After a reset the client rebuilds from live rows; tombstones only matter past a cursor
+        tombstones = (
+            db.query(SyncTombstoneModel.deleted_at, SyncTombstoneModel.entity_id)
+            .filter(SyncTombstoneModel.entity == entity, SyncTombstoneModel.deleted_at <= until,
+                    after(SyncTombstoneModel.deleted_at, SyncTombstoneModel.entity_id, since))
+            .order_by(SyncTombstoneModel.deleted_at, SyncTombstoneModel.entity_id)
+            .limit(limit + 1)
+        )
+        items += [(SyncCursor(_naive_utc(at), entity_id), _DELETE, None) for at, entity_id in tombstones]
+    items.sort(key=lambda item: item[:2])
+
+    has_more = len(items) > limit
+    page = items[:limit]
+    if has_more:
+        cursor = page[-1][0]
+    else:
+        # Everything up to the settle horizon has been returned
+        cursor = max(key for key in (SyncCursor(until), page[-1][0] if page else None, since) if key is not None)
+    return {
+        "changes": [serialize(row) for _, kind, row in page if kind == _CHANGE],
+        "deleted": [{"id": key.id, "deleted_at": key.at.isoformat()} for key, kind, _ in page if kind == _DELETE],
+        "cursor": cursor.encode(),
+        "has_more": has_more,
+        "reset": reset,
+    }
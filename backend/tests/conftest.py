@@ -3,7 +3,8 @@ Shared test fixtures and early patching.
 This file runs before any test module is imported.
 """
 import os
-from unittest.mock import MagicMock
+import tempfile
+from contextlib import contextmanager
 
 import pytest
 
@@ -12,16 +13,28 @@ os.environ.setdefault("DATABASE_URL", "sqlite:///./test.db")
 os.environ.setdefault("JWT_SECRET_KEY", "test-secret-key-not-for-production")
 os.environ.setdefault("ADMIN_SECRET_KEY", "test-admin-key")
 os.environ.setdefault("RESEND_API_KEY", "re_test_fake_key")
-
-# 2. Patch create_all before main.py is imported (models use JSONB = PostgreSQL only)
-import sqlalchemy.sql.schema as _schema
-
-_original_create_all = _schema.MetaData.create_all
-_schema.MetaData.create_all = MagicMock()
+os.environ.setdefault("SHARED_CACHE_DIR", tempfile.mkdtemp(prefix="portfolio-shared-cache-"))
 
 from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
 
+import database
+import models
 from main import app
+from services.email_validation import domain_cache
+from services.idempotency import submission_cache
+from services.query_audit import QueryAuditor
+from services.rate_limiter import limiter
+
+
+@pytest.fixture(autouse=True)
+def _reset_request_guards():
+    """Start every test with full rate limit budgets and no remembered submissions or domain lookups."""
+    limiter.reset()
+    submission_cache.clear()
+    domain_cache.clear()
 
 
 @pytest.fixture
@@ -42,3 +55,50 @@ def admin_token():
 def auth_header(admin_token):
     """Authorization header dict for admin endpoints."""
     return {"Authorization": f"Bearer {admin_token}"}
+
+
+@pytest.fixture
+def sqlite_db():
+    """
+    In-memory SQLite engine wired into `database.get_db`.
+
+    Every table is created (JSONB columns fall back to JSON on SQLite);
+    yields the engine.
+    """
+    engine = create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+    models.Base.metadata.create_all(bind=engine)
+    session_factory = sessionmaker(bind=engine, autoflush=False)
+
+    def get_test_db():
+        db = session_factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[database.get_db] = get_test_db
+    try:
+        yield engine
+    finally:
+        app.dependency_overrides.pop(database.get_db, None)
+        engine.dispose()
+
+
+@pytest.fixture
+def query_budget(sqlite_db):
+    """
+    Context manager factory failing the test when the block runs more SQL
+    statements than declared, e.g. `with query_budget(1): client.get(...)`.
+    """
+    auditor = QueryAuditor(explain=False)
+    auditor.attach(sqlite_db)
+
+    @contextmanager
+    def budget(max_queries: int):
+        with auditor.track() as log:
+            yield log
+        if log.count > max_queries:
+            pytest.fail(f"Query budget exceeded: {log.count} > {max_queries}\n{log.summary()}")
+
+    yield budget
+    auditor.detach(sqlite_db)
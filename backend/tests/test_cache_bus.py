@@ -0,0 +1,99 @@
+"""
+Cache invalidation bus tests — local dispatch, the shared-file transport
+between two "workers", and the project list cache wiring.
+"""
+import pytest
+
+from services.cache_bus import ALL_KEYS, FileTransport, InvalidationBus
+
+
+@pytest.fixture
+def workers(tmp_path):
+    """Two buses sharing one invalidation file, as two uvicorn workers would."""
+    buses = [InvalidationBus(), InvalidationBus()]
+    for bus in buses:
+        bus.start(FileTransport(tmp_path / "bus.log"))
+    yield buses
+    for bus in buses:
+        bus.stop()
+
+
+def _recorder(bus, key):
+    calls = []
+    bus.subscribe(key, lambda published_at: calls.append(key))
+    return calls
+
+
+class TestInvalidationBus:
+    """publish / subscribe"""
+
+    def test_publish_clears_locally_without_transport(self):
+        bus = InvalidationBus()
+        calls = _recorder(bus, "projects")
+        other = _recorder(bus, "about")
+        bus.publish("projects")
+        assert calls == ["projects"]
+        assert other == []
+
+    def test_all_keys_reaches_every_handler(self):
+        bus = InvalidationBus()
+        calls = _recorder(bus, "projects")
+        about = _recorder(bus, "about")
+        bus._dispatch(ALL_KEYS, 0.0)
+        assert calls == ["projects"]
+        assert about == ["about"]
+
+    def test_failing_handler_does_not_block_others(self):
+        bus = InvalidationBus()
+        bus.subscribe("projects", lambda published_at: 1 / 0)
+        calls = _recorder(bus, "projects")
+        bus.publish("projects")
+        assert calls == ["projects"]
+
+
+class TestFileTransport:
+    """Broadcast between workers on one host"""
+
+    def test_other_worker_sees_invalidation_on_poll(self, workers):
+        publisher, subscriber = workers
+        own = _recorder(publisher, "projects")
+        remote = _recorder(subscriber, "projects")
+
+        publisher.publish("projects")
+        assert remote == []
+        subscriber.poll()
+        publisher.poll()
+        assert remote == ["projects"]
+        assert own == ["projects"]  # applied once, not again from the file
+
+        subscriber.poll()
+        assert remote == ["projects"]
+
+    def test_rotation_invalidates_everything(self, tmp_path):
+        publisher, subscriber = InvalidationBus(), InvalidationBus()
+        publisher.start(FileTransport(tmp_path / "bus.log", max_bytes=100))
+        subscriber.start(FileTransport(tmp_path / "bus.log", max_bytes=100))
+        about = _recorder(subscriber, "about")
+        for _ in range(3):
+            publisher.publish("projects")
+        subscriber.poll()
+        assert about == ["about"]
+        assert (tmp_path / "bus.log").stat().st_size < 100
+
+
+class TestProjectCacheWiring:
+    """routes.projects cache follows the bus"""
+
+    def test_invalidation_clears_project_cache(self, monkeypatch):
+        from routes import projects
+
+        loads = []
+        monkeypatch.setattr(projects, "get_all_projects", lambda: loads.append(1) or [{"id": len(loads)}])
+        projects._clear_projects_cache()
+        try:
+            assert projects._get_cached_projects() == b'[{"id":1}]'
+            assert projects._get_cached_projects() == b'[{"id":1}]'
+            projects._invalidate_projects_cache()
+            assert projects._get_cached_projects() == b'[{"id":2}]'
+        finally:
+            projects._clear_projects_cache()
@@ -0,0 +1,105 @@
+"""
+Compression tests — encoding negotiation, size threshold, streaming and
+the precompressed about payload.
+"""
+import gzip
+import json
+
+from fastapi import FastAPI
+from fastapi.responses import Response, StreamingResponse
+from fastapi.testclient import TestClient
+
+from middleware.compression import CompressionMiddleware, PrecompressedJSON, negotiate_encoding
+
+BIG_JSON = json.dumps({"items": [f"item {i}" for i in range(500)]}).encode()
+
+
+def _compressing_client() -> TestClient:
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, minimum_size=100)
+
+    @app.get("/big")
+    async def big():
+        return Response(BIG_JSON, media_type="application/json")
+
+    @app.get("/small")
+    async def small():
+        return Response(b'{"ok": true}', media_type="application/json")
+
+    @app.get("/png")
+    async def png():
+        return Response(b"\x89PNG" * 100, media_type="image/png")
+
+    @app.get("/stream")
+    async def stream():
+        return StreamingResponse(iter([b"id,name\n", b"1,Jane\n" * 200]), media_type="text/csv")
+
+    return TestClient(app)
+
+
+class TestNegotiateEncoding:
+    """negotiate_encoding"""
+
+    def test_prefers_highest_q(self):
+        assert negotiate_encoding("gzip;q=0.8, br", ("br", "gzip")) == "br"
+        assert negotiate_encoding("gzip, br;q=0.5", ("br", "gzip")) == "gzip"
+
+    def test_tie_uses_server_preference(self):
+        assert negotiate_encoding("gzip, br", ("br", "gzip")) == "br"
+
+    def test_wildcard_and_refusal(self):
+        assert negotiate_encoding("*", ("gzip",)) == "gzip"
+        assert negotiate_encoding("gzip;q=0", ("gzip",)) is None
+        assert negotiate_encoding("deflate", ("gzip",)) is None
+        assert negotiate_encoding("", ("gzip",)) is None
+
+
+class TestCompressionMiddleware:
+    """CompressionMiddleware"""
+
+    def test_large_body_is_gzipped(self):
+        resp = _compressing_client().get("/big", headers={"Accept-Encoding": "gzip"})
+        assert resp.headers["content-encoding"] == "gzip"
+        assert "accept-encoding" in resp.headers["vary"].lower()
+        assert resp.content == BIG_JSON
+
+    def test_small_body_untouched(self):
+        resp = _compressing_client().get("/small", headers={"Accept-Encoding": "gzip"})
+        assert "content-encoding" not in resp.headers
+
+    def test_incompressible_type_untouched(self):
+        resp = _compressing_client().get("/png", headers={"Accept-Encoding": "gzip"})
+        assert "content-encoding" not in resp.headers
+
+    def test_no_accept_encoding(self):
+        resp = _compressing_client().get("/big", headers={"Accept-Encoding": "identity"})
+        assert "content-encoding" not in resp.headers
+        assert resp.content == BIG_JSON
+
+    def test_streaming_response_is_compressed(self):
+        resp = _compressing_client().get("/stream", headers={"Accept-Encoding": "gzip"})
+        assert resp.headers["content-encoding"] == "gzip"
+        assert "content-length" not in resp.headers
+        assert resp.text == "id,name\n" + "1,Jane\n" * 200
+
+
+class TestPrecompressedJSON:
+    """PrecompressedJSON and GET /api/about"""
+
+    def test_variants_built_once(self):
+        payload = PrecompressedJSON({"items": list(range(1000))})
+        resp = payload.response("gzip")
+        assert resp.headers["content-encoding"] == "gzip"
+        assert gzip.decompress(resp.body) == payload.identity
+
+    def test_small_payload_has_no_variants(self):
+        payload = PrecompressedJSON({"ok": True})
+        assert payload.variants == {}
+        assert "content-encoding" not in payload.response("gzip").headers
+
+    def test_about_served_precompressed(self, client):
+        resp = client.get("/api/about", headers={"Accept-Encoding": "gzip"})
+        assert resp.status_code == 200
+        assert resp.headers["content-encoding"] == "gzip"
+        assert "max-age=3600" in resp.headers["cache-control"]
+        assert isinstance(resp.json(), dict)
@@ -0,0 +1,88 @@
+"""
+Content store tests — about.json snapshots, atomic saves, out-of-band edit
+detection, ETag revalidation and the admin editor endpoints.
+"""
+import json
+from unittest.mock import patch
+
+import pytest
+
+from services.content_store import JSONContentStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    path = tmp_path / "about.json"
+    path.write_text(json.dumps({"name": "Arpit"}), encoding="utf-8")
+    return JSONContentStore(path, key="about-test")
+
+
+class TestJSONContentStore:
+    """get / save / invalidate"""
+
+    def test_unchanged_file_is_not_reparsed(self, store, monkeypatch):
+        first = store.get()
+        monkeypatch.setattr(json, "loads", lambda *_: pytest.fail("file re-read"))
+        assert store.get() is first
+
+    def test_out_of_band_edit_is_picked_up(self, store):
+        first = store.get()
+        store.path.write_text(json.dumps({"name": "Edited elsewhere"}), encoding="utf-8")
+        second = store.get()
+        assert second.data == {"name": "Edited elsewhere"}
+        assert second.version == first.version + 1
+        assert second.etag != first.etag
+
+    def test_save_is_atomic_and_served_immediately(self, store):
+        snapshot = store.save({"name": "Saved", "bio": "Ünïcode"})
+        assert store.get() is snapshot
+        assert json.loads(store.path.read_text(encoding="utf-8")) == {"name": "Saved", "bio": "Ünïcode"}
+        assert [p.name for p in store.path.parent.iterdir()] == ["about.json"]
+
+    def test_invalidate_forces_reload(self, store):
+        first = store.get()
+        store.invalidate()
+        assert store.peek() is None
+        assert store.get().data == first.data
+
+    def test_missing_file_raises(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            JSONContentStore(tmp_path / "missing.json", key="missing").get()
+
+    def test_etag_is_content_derived(self, tmp_path, store):
+        other = tmp_path / "copy.json"
+        other.write_bytes(store.path.read_bytes())
+        assert JSONContentStore(other, key="copy").get().etag == store.get().etag
+
+
+class TestAboutRevalidation:
+    """GET /api/about with If-None-Match"""
+
+    @patch("routes.about._load_about_data")
+    def test_matching_etag_returns_304(self, mock_load, client):
+        mock_load.return_value = {"name": "Arpit"}
+        etag = client.get("/api/about").headers["etag"]
+        resp = client.get("/api/about", headers={"If-None-Match": etag})
+        assert resp.status_code == 304
+        assert resp.content == b""
+        assert resp.headers["etag"] == etag
+
+    @patch("routes.about._load_about_data")
+    def test_stale_etag_returns_body(self, mock_load, client):
+        mock_load.return_value = {"name": "Arpit"}
+        resp = client.get("/api/about", headers={"If-None-Match": '"stale"'})
+        assert resp.status_code == 200
+        assert resp.json() == {"name": "Arpit"}
+
+
+class TestAboutEditor:
+    """GET/PUT /api/admin/site-settings/content/about"""
+
+    def test_save_then_public_read(self, client, auth_header, store, monkeypatch):
+        monkeypatch.setattr("routes.site_settings.about_store", store)
+        monkeypatch.setattr("routes.about.about_store", store)
+
+        resp = client.put("/api/admin/site-settings/content/about", json={"name": "New"}, headers=auth_header)
+        assert resp.status_code == 200
+        assert client.get("/api/admin/site-settings/content/about", headers=auth_header).json() == {"name": "New"}
+        assert client.get("/api/about").json() == {"name": "New"}
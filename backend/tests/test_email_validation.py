@@ -0,0 +1,80 @@
+"""
+Email validation tests — allowlisted domains skip DNS, lookups are cached
+per domain and concurrent lookups for the same domain are coalesced.
+"""
+import asyncio
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from services.email_validation import (
+    DomainCache,
+    EmailNotValidError,
+    validate_email_address,
+)
+
+
+class TestValidateEmailAddress:
+    """validate_email_address"""
+
+    @patch("services.email_validation._check_domain")
+    def test_allowlisted_domain_skips_dns(self, mock_check):
+        assert asyncio.run(validate_email_address("Jane@Gmail.com")) == "Jane@gmail.com"
+        mock_check.assert_not_called()
+
+    @patch("services.email_validation._check_domain")
+    def test_syntax_error_skips_dns(self, mock_check):
+        with pytest.raises(EmailNotValidError):
+            asyncio.run(validate_email_address("not-an-email"))
+        mock_check.assert_not_called()
+
+    @patch("services.email_validation._check_domain", return_value=None)
+    def test_lookup_result_is_cached(self, mock_check):
+        asyncio.run(validate_email_address("a@acme.io"))
+        asyncio.run(validate_email_address("b@acme.io"))
+        assert mock_check.call_count == 1
+
+    @patch("services.email_validation._check_domain", return_value="The domain name nowhere-mail.io does not exist.")
+    def test_undeliverable_domain_raises(self, mock_check):
+        for _ in range(2):
+            with pytest.raises(EmailNotValidError, match="does not exist"):
+                asyncio.run(validate_email_address("a@nowhere-mail.io"))
+        assert mock_check.call_count == 1
+
+    def test_concurrent_lookups_are_coalesced(self):
+        calls = []
+        lock = threading.Lock()
+
+        def slow_check(ascii_domain, domain_i18n):
+            with lock:
+                calls.append(ascii_domain)
+            time.sleep(0.05)
+            return None
+
+        async def submit_many():
+            return await asyncio.gather(*(validate_email_address(f"u{i}@acme.io") for i in range(10)))
+
+        with patch("services.email_validation._check_domain", side_effect=slow_check):
+            results = asyncio.run(submit_many())
+        assert len(results) == 10
+        assert calls == ["acme.io"]
+
+
+class TestDomainCache:
+    """Per-domain TTL cache"""
+
+    def test_negative_results_expire_sooner(self):
+        cache = DomainCache(ttl=100)
+        cache.put("good.io", None)
+        cache.put("bad.io", "no MX")
+        with patch("services.email_validation.time.monotonic", return_value=time.monotonic() + 50):
+            assert cache.get("good.io") == (True, None)
+            assert cache.get("bad.io") == (False, None)
+
+    def test_bounded(self):
+        cache = DomainCache(ttl=100, max_entries=1)
+        cache.put("a.io", None)
+        cache.put("b.io", None)
+        assert cache.get("a.io") == (False, None)
@@ -0,0 +1,182 @@
+"""
+Idempotency tests — duplicate contact/CV submissions must replay the
+original response without new DB writes or emails.
+"""
+from unittest.mock import MagicMock, patch
+
+import pytest
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+import models
+from services.idempotency import (
+    IDEMPOTENCY_WINDOW_SECONDS,
+    DuplicateSubmissionError,
+    SubmissionCache,
+    submission_key,
+    submission_keys,
+)
+from services.lead_service import create_contact_lead
+
+# One second either side of a window bucket boundary
+BEFORE_BOUNDARY = 10 * IDEMPOTENCY_WINDOW_SECONDS - 1.0
+AFTER_BOUNDARY = 10 * IDEMPOTENCY_WINDOW_SECONDS + 1.0
+
+CONTACT_FORM = {
+    "name": "Jane", "email": "jane@test.com",
+    "subject": "Hi", "message": "Hello there",
+}
+
+
+class TestSubmissionKey:
+    """submission_key"""
+
+    def test_same_content_same_window(self):
+        a = submission_key("contact", "Jane@Test.com ", "Hi", "Hello", now=1000.0)
+        b = submission_key("contact", "jane@test.com", "Hi", "Hello", now=1001.0)
+        assert a == b
+
+    def test_lead_type_is_part_of_key(self):
+        assert submission_key("contact", "j@t.com", "Hi", "Hello", now=0) != \
+            submission_key("cv_request", "j@t.com", "Hi", "Hello", now=0)
+
+    def test_header_key_overrides_content(self):
+        a = submission_key("contact", "a@t.com", "A", "one", header_key="abc")
+        b = submission_key("contact", " A@T.com", "B", "two", header_key="abc")
+        assert a == b
+
+    def test_header_key_is_scoped_to_email(self):
+        assert submission_key("contact", "a@t.com", "A", "one", header_key="abc") != \
+            submission_key("contact", "b@t.com", "A", "one", header_key="abc")
+
+    def test_retry_across_bucket_boundary_matches_original(self):
+        original = submission_keys("contact", "j@t.com", "Hi", "Hello", now=BEFORE_BOUNDARY)
+        retry = submission_keys("contact", "j@t.com", "Hi", "Hello", now=AFTER_BOUNDARY)
+        assert retry[0] != original[0]
+        assert original[0] in retry
+
+    def test_content_older_than_two_windows_is_new(self):
+        original = submission_keys("contact", "j@t.com", "Hi", "Hello", now=BEFORE_BOUNDARY)
+        later = submission_keys("contact", "j@t.com", "Hi", "Hello", now=AFTER_BOUNDARY + IDEMPOTENCY_WINDOW_SECONDS)
+        assert original[0] not in later
+
+    def test_header_key_has_no_window(self):
+        assert submission_keys("contact", "j@t.com", "Hi", "Hello", header_key="abc") == \
+            (submission_key("contact", "j@t.com", "Hi", "Hello", header_key="abc"),)
+
+
+class TestSubmissionCache:
+    """Bounded LRU with TTL"""
+
+    def test_evicts_oldest_past_capacity(self):
+        cache = SubmissionCache(max_entries=2, ttl=60)
+        cache.put("a", {"id": 1})
+        cache.put("b", {"id": 2})
+        cache.get("a")  # refresh "a"
+        cache.put("c", {"id": 3})
+        assert cache.get("b") is None
+        assert cache.get("a") == {"id": 1}
+        assert len(cache) == 2
+
+    def test_expired_entries_are_misses(self):
+        cache = SubmissionCache(max_entries=10, ttl=0)
+        cache.put("a", {"id": 1})
+        assert cache.get("a") is None
+
+    def test_find_replays_previous_bucket(self):
+        cache = SubmissionCache(max_entries=10, ttl=60)
+        cache.put(submission_keys("contact", "j@t.com", "Hi", "Hello", now=BEFORE_BOUNDARY)[0], {"id": 1})
+        assert cache.find(submission_keys("contact", "j@t.com", "Hi", "Hello", now=AFTER_BOUNDARY)) == {"id": 1}
+        assert cache.find(("unknown",)) is None
+
+
+class TestCreateLeadUniqueKey:
+    """create_contact_lead with a colliding idempotency key"""
+
+    def test_integrity_error_raises_duplicate_with_existing_lead(self):
+        existing = MagicMock(id=77)
+        db = MagicMock()
+        db.commit.side_effect = IntegrityError("INSERT", {}, Exception("unique"))
+        db.query.return_value.filter.return_value.first.return_value = existing
+        with pytest.raises(DuplicateSubmissionError) as exc:
+            create_contact_lead(db, "Jane", "jane@test.com", "Hi", "Hello", idempotency_key="k")
+        assert exc.value.lead is existing
+        db.rollback.assert_called_once()
+
+    def test_integrity_error_without_key_propagates(self):
+        db = MagicMock()
+        db.commit.side_effect = IntegrityError("INSERT", {}, Exception("other"))
+        with pytest.raises(IntegrityError):
+            create_contact_lead(db, "Jane", "jane@test.com", "Hi", "Hello")
+
+    def test_lead_from_previous_bucket_is_a_duplicate(self, sqlite_db):
+        original_key = submission_keys("contact", "jane@test.com", "Hi", "Hello", now=BEFORE_BOUNDARY)[0]
+        retry_key, *earlier_keys = submission_keys("contact", "jane@test.com", "Hi", "Hello", now=AFTER_BOUNDARY)
+        with Session(sqlite_db) as db:
+            original = create_contact_lead(db, "Jane", "jane@test.com", "Hi", "Hello", idempotency_key=original_key)
+            with pytest.raises(DuplicateSubmissionError) as exc:
+                create_contact_lead(db, "Jane", "jane@test.com", "Hi", "Hello",
+                                    idempotency_key=retry_key, earlier_keys=earlier_keys)
+            assert exc.value.lead.id == original.id
+
+
+class TestDuplicateSubmissions:
+    """POST /api/submit-contact and /api/v1/request-cv replays"""
+
+    @patch("routes.leads.send_admin_notification")
+    @patch("routes.leads.send_contact_acknowledgment")
+    @patch("routes.leads._validate_contact_payload")
+    @patch("routes.leads.create_contact_lead")
+    def test_double_submit_replays_response(self, mock_create, mock_validate, mock_ack, mock_notify, client):
+        mock_create.return_value = MagicMock(id=42)
+        first = client.post("/api/submit-contact", data=CONTACT_FORM)
+        second = client.post("/api/submit-contact", data=CONTACT_FORM)
+        assert first.status_code == second.status_code == 200
+        assert second.json() == first.json()
+        assert second.headers.get("idempotent-replayed") == "true"
+        assert mock_create.call_count == 1
+        assert mock_ack.call_count == 1
+        assert mock_notify.call_count == 1
+
+    @patch("routes.leads.send_admin_notification")
+    @patch("routes.leads.send_contact_acknowledgment")
+    @patch("routes.leads._validate_contact_payload")
+    @patch("routes.leads.create_contact_lead")
+    def test_idempotency_key_header(self, mock_create, mock_validate, mock_ack, mock_notify, client):
+        mock_create.return_value = MagicMock(id=5)
+        headers = {"Idempotency-Key": "retry-123"}
+        client.post("/api/submit-contact", data=CONTACT_FORM, headers=headers)
+        edited = {**CONTACT_FORM, "message": "Hello there (edited)"}
+        resp = client.post("/api/submit-contact", data=edited, headers=headers)
+        assert resp.json()["id"] == 5
+        assert mock_create.call_count == 1
+
+    @patch("routes.leads.send_admin_notification")
+    @patch("routes.leads.send_contact_acknowledgment")
+    @patch("routes.leads._validate_contact_payload")
+    def test_same_header_key_from_another_email_is_a_new_lead(self, mock_validate, mock_ack, mock_notify,
+                                                              client, sqlite_db):
+        headers = {"Idempotency-Key": "retry-123"}
+        first = client.post("/api/submit-contact", data=CONTACT_FORM, headers=headers)
+        other = {**CONTACT_FORM, "name": "Bob", "email": "bob@test.com", "message": "Different"}
+        second = client.post("/api/submit-contact", data=other, headers=headers)
+
+        assert first.status_code == second.status_code == 200
+        assert second.headers.get("idempotent-replayed") is None
+        assert second.json()["id"] != first.json()["id"]
+        with Session(sqlite_db) as db:
+            assert {lead.email for lead in db.query(models.ContactLead)} == {"jane@test.com", "bob@test.com"}
+        assert mock_ack.call_count == 2
+
+    @patch("routes.leads.send_admin_notification")
+    @patch("routes.leads.send_cv_request_email")
+    @patch("routes.leads._validate_contact_payload")
+    @patch("routes.leads.create_contact_lead")
+    def test_duplicate_from_other_worker_skips_emails(self, mock_create, mock_validate, mock_cv, mock_notify, client):
+        mock_create.side_effect = DuplicateSubmissionError(MagicMock(id=9))
+        resp = client.post("/api/v1/request-cv", data={**CONTACT_FORM, "company": "TechInc"})
+        assert resp.status_code == 200
+        assert resp.json()["status"] == "success"
+        assert resp.headers.get("idempotent-replayed") == "true"
+        mock_cv.assert_not_called()
+        mock_notify.assert_not_called()
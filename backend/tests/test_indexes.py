@@ -0,0 +1,45 @@
+"""
+Query index tests — every lead_service / live-visitor query covered by
+migrations/006_query_indexes.sql must be planned on its index.
+"""
+import random
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+import models
+from benchmarks.bench_indexes import CASES, uses_index
+from benchmarks.seed import bulk_load, lead_rows, telemetry_rows
+
+
+@pytest.fixture
+def seeded_db(sqlite_db):
+    rng = random.Random(11)
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    bulk_load(sqlite_db, models.ContactLead.__table__, lead_rows(3_000, rng, now))
+    bulk_load(sqlite_db, models.TelemetryEventModel.__table__, telemetry_rows(5_000, rng, now, projects=10))
+    with sqlite_db.begin() as conn:
+        conn.exec_driver_sql("ANALYZE")
+    return sqlite_db
+
+
+class TestQueryIndexes:
+    """Planner picks the declared index for each hot query"""
+
+    @pytest.mark.parametrize("case", CASES, ids=lambda case: case.query)
+    def test_query_uses_index(self, seeded_db, case):
+        used, plan = uses_index(seeded_db, case)
+        assert used, f"{case.query} does not use {case.index}:\n{plan}"
+
+    def test_partial_idempotency_index_still_rejects_duplicates(self, sqlite_db):
+        with Session(sqlite_db) as db:
+            for _ in range(2):  # keyless leads never collide
+                db.add(models.ContactLead(name="A", email="a@gmail.com", subject="s", message="m"))
+            db.add(models.ContactLead(name="B", email="b@gmail.com", subject="s", message="m", idempotency_key="k"))
+            db.commit()
+
+            db.add(models.ContactLead(name="C", email="c@gmail.com", subject="s", message="m", idempotency_key="k"))
+            with pytest.raises(IntegrityError):
+                db.commit()
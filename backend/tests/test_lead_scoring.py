@@ -0,0 +1,129 @@
+"""
+Lead scoring tests — spam signals, quality/priority assignment at
+ingestion, and email suppression for obvious spam.
+"""
+from unittest.mock import MagicMock, patch
+
+from services.lead_scoring import (
+    VelocityTracker,
+    is_spam_lead,
+    score_lead,
+    shannon_entropy,
+)
+from services.lead_service import create_contact_lead
+
+BROWSER_UA = "Mozilla/5.0 (Macintosh; Intel Mac OS X 14_0) AppleWebKit/605.1.15 Safari/605.1.15"
+GENUINE_MESSAGE = (
+    "Hi Arpit, we are hiring ML engineers for our search ranking team and your "
+    "retrieval work looks like a great fit. Could we set up a call next week?"
+)
+
+
+class TestScoreLead:
+    """score_lead"""
+
+    def test_genuine_recruiter_is_high_priority(self):
+        score = score_lead(
+            email="jane@acme.io", message=GENUINE_MESSAGE, company="Acme",
+            role="recruiter", ip_address="203.0.113.5", user_agent=BROWSER_UA,
+        )
+        assert not score.is_spam
+        assert score.signals == []
+        assert score.quality_score >= 0.8
+        assert score.priority == "high"
+
+    def test_disposable_domain_and_bot_ua_is_spam(self):
+        score = score_lead(
+            email="x@mailinator.com", message="Buy now", user_agent="python-requests/2.31",
+        )
+        assert {"disposable_domain", "bot_user_agent"} <= set(score.signals)
+        assert score.is_spam
+        assert score.priority == "low"
+
+    def test_link_density(self):
+        message = "cheap seo http://a.example http://b.example www.c.example"
+        score = score_lead(email="a@gmail.com", message=message, user_agent=BROWSER_UA)
+        assert "link_heavy" in score.signals
+
+    def test_velocity_burst(self):
+        score = score_lead(email="a@gmail.com", message=GENUINE_MESSAGE, user_agent=BROWSER_UA, velocity=25)
+        assert "velocity_burst" in score.signals
+
+    def test_blocked_ip(self):
+        with patch("services.lead_scoring.SPAM_BLOCKED_IPS", frozenset({"192.0.2.66"})):
+            score = score_lead(
+                email="a@gmail.com", message=GENUINE_MESSAGE,
+                user_agent=BROWSER_UA, ip_address="192.0.2.66",
+            )
+        assert score.is_spam
+
+    def test_entropy_anomalies(self):
+        assert "entropy_anomaly" in score_lead(
+            email="a@gmail.com", message="a" * 40, user_agent=BROWSER_UA,
+        ).signals
+        assert "entropy_anomaly" in score_lead(
+            email="a@gmail.com", message="xQ7$kP2@vL9#mZ4!wR8^tY1&nB5*cF3(hJ6)", user_agent=BROWSER_UA,
+        ).signals
+        assert shannon_entropy("") == 0.0
+
+
+class TestVelocityTracker:
+    """Per-IP sliding window"""
+
+    def test_counts_within_window(self):
+        tracker = VelocityTracker(window=10)
+        assert tracker.record("1.1.1.1", now=0) == 1
+        assert tracker.record("1.1.1.1", now=5) == 2
+        assert tracker.record("1.1.1.1", now=16) == 1
+
+    def test_bounded_ip_table(self):
+        tracker = VelocityTracker(window=10, max_ips=2)
+        tracker.record("a", now=0)
+        tracker.record("b", now=0)
+        tracker.record("c", now=0)
+        assert tracker.record("a", now=1) == 1  # "a" was evicted
+
+
+class TestCreateLeadScoring:
+    """create_contact_lead applies the score to the new row"""
+
+    def test_spam_is_flagged_and_tagged(self):
+        db = MagicMock()
+        lead = create_contact_lead(
+            db, "Bot", "bot@yopmail.com", "Offer", "visit http://x.example http://y.example http://z.example",
+            metadata={"ip_address": "198.51.100.99", "user_agent": "curl/8.0"},
+        )
+        assert lead.flagged is True
+        assert lead.priority == "low"
+        assert "spam" in lead.tags
+        assert lead.metadata_json["scoring"]["is_spam"] is True
+        assert lead.metadata_json["ip_address"] == "198.51.100.99"
+        assert is_spam_lead(lead)
+
+    def test_genuine_lead_is_not_flagged(self):
+        db = MagicMock()
+        lead = create_contact_lead(
+            db, "Jane", "jane@acme.io", "Hiring", GENUINE_MESSAGE, company="Acme",
+            metadata={"ip_address": "203.0.113.10", "user_agent": BROWSER_UA},
+        )
+        assert lead.flagged is False
+        assert lead.quality_score > 0.5
+        assert not is_spam_lead(lead)
+
+
+class TestSpamSkipsEmails:
+    """POST /api/submit-contact with a lead scored as spam"""
+
+    @patch("routes.leads.send_admin_notification")
+    @patch("routes.leads.send_contact_acknowledgment")
+    @patch("routes.leads._validate_contact_payload")
+    @patch("routes.leads.create_contact_lead")
+    def test_no_emails_for_spam(self, mock_create, mock_validate, mock_ack, mock_notify, client):
+        mock_create.return_value = MagicMock(id=3, metadata_json={"scoring": {"is_spam": True}})
+        resp = client.post("/api/submit-contact", data={
+            "name": "Bot", "email": "bot@yopmail.com", "subject": "Offer", "message": "spam",
+        })
+        assert resp.status_code == 200
+        assert resp.json()["id"] == 3
+        mock_ack.assert_not_called()
+        mock_notify.assert_not_called()
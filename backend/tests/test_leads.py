@@ -162,11 +162,10 @@ class TestAdminLeadsList:
         assert resp.status_code == 200
         assert isinstance(resp.json(), list)
 
-    @patch("routes.leads.get_all_leads")
+    @patch("routes.leads.get_leads_page")
     def test_list_with_pagination(self, mock_get, client, auth_header):
-        mock_get.return_value = [_serialized_lead()]
+        mock_get.return_value = ([_serialized_lead()], 1)
         mock_db = MagicMock()
-        mock_db.query.return_value.count.return_value = 1
         import database
         from main import app
         app.dependency_overrides[database.get_db] = lambda: mock_db
@@ -561,6 +560,17 @@ class TestAdminResponseTime:
         assert resp.status_code == 200
 
 
+class TestAdminUnreadCount:
+    """GET /api/admin/leads/unread-count"""
+
+    @patch("routes.leads.count_unread_leads")
+    def test_unread_count(self, mock_count, client, auth_header):
+        mock_count.return_value = 7
+        resp = client.get("/api/admin/leads/unread-count", headers=auth_header)
+        assert resp.status_code == 200
+        assert resp.json() == {"unread_count": 7}
+
+
 # ═══════════════ ADMIN — EXPORT ═══════════════
 
 
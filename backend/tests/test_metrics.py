@@ -0,0 +1,134 @@
+"""
+Instrumentation tests — histograms, per-request query counting via engine
+events, Server-Timing, and the Prometheus /metrics endpoint.
+"""
+import asyncio
+from unittest.mock import patch
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+
+from middleware.metrics import MetricsMiddleware
+from services.metrics import (
+    EMAIL_SEND_DURATION,
+    THREADPOOL_WAIT,
+    Histogram,
+    end_request_stats,
+    instrument_engine,
+    render_prometheus,
+    reset_metrics,
+    run_in_threadpool,
+    start_request_stats,
+    timed_email,
+)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_metrics():
+    reset_metrics()
+    yield
+    reset_metrics()
+
+
+@pytest.fixture
+def metrics_auth():
+    with patch("routes.metrics.METRICS_TOKEN", "scrape-secret"):
+        yield {"Authorization": "Bearer scrape-secret"}
+
+
+class TestHistogram:
+    """Histogram exposition"""
+
+    def test_cumulative_buckets(self):
+        hist = Histogram("demo_seconds", "Demo.", ("route",), buckets=(0.1, 1.0))
+        hist.observe(0.05, "/a")
+        hist.observe(0.5, "/a")
+        hist.observe(5.0, "/a")
+        lines = hist.collect()
+        assert 'demo_seconds_bucket{route="/a",le="0.1"} 1' in lines
+        assert 'demo_seconds_bucket{route="/a",le="1.0"} 2' in lines
+        assert 'demo_seconds_bucket{route="/a",le="+Inf"} 3' in lines
+        assert 'demo_seconds_count{route="/a"} 3' in lines
+
+    def test_label_escaping(self):
+        hist = Histogram("demo_seconds", "Demo.", ("route",))
+        hist.observe(0.1, 'a"b')
+        assert any('route="a\\"b"' in line for line in hist.collect())
+
+
+class TestQueryCounting:
+    """SQLAlchemy engine events"""
+
+    def test_queries_attributed_to_request(self):
+        engine = create_engine("sqlite://")
+        instrument_engine(engine)
+        instrument_engine(engine)  # idempotent
+        stats, token = start_request_stats()
+        try:
+            with engine.connect() as conn:
+                conn.execute(text("SELECT 1"))
+                conn.execute(text("SELECT 2"))
+        finally:
+            end_request_stats(token)
+        assert stats.queries == 2
+        assert stats.query_seconds > 0
+        assert 'db_query_duration_seconds_count{statement="SELECT"} 2' in render_prometheus()
+
+
+class TestThreadpoolAndEmail:
+    """Threadpool wait and email latency"""
+
+    def test_threadpool_wait_recorded(self):
+        assert asyncio.run(run_in_threadpool(lambda x: x * 2, 21)) == 42
+        assert "threadpool_wait_seconds_count 1" in THREADPOOL_WAIT.collect()
+
+    def test_email_outcome_recorded(self):
+        def provider_down():
+            raise RuntimeError("down")
+
+        timed_email("cv_request", lambda: None)
+        with pytest.raises(RuntimeError):
+            timed_email("cv_request", provider_down)
+        lines = EMAIL_SEND_DURATION.collect()
+        assert 'email_send_duration_seconds_count{template="cv_request",outcome="sent"} 1' in lines
+        assert 'email_send_duration_seconds_count{template="cv_request",outcome="error"} 1' in lines
+
+
+class TestMetricsMiddleware:
+    """MetricsMiddleware and GET /metrics"""
+
+    def test_server_timing_header(self):
+        app = FastAPI()
+        app.add_middleware(MetricsMiddleware, server_timing=True)
+
+        @app.get("/items/{item_id}")
+        async def item(item_id: int):
+            return {"id": item_id}
+
+        resp = TestClient(app).get("/items/7")
+        assert resp.headers["server-timing"].startswith("app;dur=")
+        assert 'db;dur=0.00;desc="0 queries"' in resp.headers["server-timing"]
+        assert 'route="/items/{item_id}"' in render_prometheus()
+
+    def test_metrics_endpoint(self, client, metrics_auth):
+        client.get("/api/hello")
+        resp = client.get("/metrics", headers=metrics_auth)
+        assert resp.status_code == 200
+        assert resp.headers["content-type"].startswith("text/plain; version=0.0.4")
+        assert 'http_request_duration_seconds_count{method="GET",route="/api/hello",status="200"} 1' in resp.text
+        assert "threadpool_busy_threads" in resp.text
+
+    def test_unmatched_routes_share_a_label(self, client, metrics_auth):
+        client.get("/no/such/path/123")
+        assert 'route="<unmatched>",status="404"' in client.get("/metrics", headers=metrics_auth).text
+
+    def test_metrics_token(self, client, metrics_auth):
+        assert client.get("/metrics").status_code == 401
+        assert client.get("/metrics", headers={"Authorization": "Bearer wrong"}).status_code == 401
+        assert client.get("/metrics", headers=metrics_auth).status_code == 200
+
+    def test_disabled_without_token(self, client):
+        assert client.get("/metrics").status_code == 404
+        assert client.get("/metrics", headers={"Authorization": "Bearer "}).status_code == 404
@@ -0,0 +1,158 @@
+"""
+Migration runner tests — versioned upgrade / stamp on a scratch SQLite
+database, script splitting, and the startup version check.
+"""
+import logging
+
+import pytest
+from sqlalchemy import MetaData, create_engine, inspect
+from sqlalchemy.orm import Session
+
+import models
+from migrations.runner import (
+    MigrationError,
+    applied_migrations,
+    check_schema_version,
+    current_version,
+    discover,
+    latest_version,
+    split_statements,
+    stamp,
+    upgrade,
+)
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'migrations.db'}")
+    yield engine
+    engine.dispose()
+
+
+class TestDiscover:
+    """discover / latest_version"""
+
+    def test_versions_are_ordered_and_start_with_baseline(self):
+        migrations = discover()
+        versions = [m.version for m in migrations]
+        assert versions == sorted(versions)
+        assert migrations[0].kind == "py"
+        assert latest_version() == versions[-1]
+
+    def test_helper_scripts_are_not_migrations(self):
+        names = {str(m) for m in discover()}
+        assert "migrate_projects_to_db.py" not in names
+        assert "runner.py" not in names
+
+
+class TestSplitStatements:
+    """split_statements"""
+
+    def test_splits_on_top_level_semicolons(self):
+        assert split_statements("SELECT 1;\n\nSELECT 2;") == ["SELECT 1", "SELECT 2"]
+
+    def test_ignores_semicolons_in_strings_comments_and_dollar_quotes(self):
+        sql = """
+        -- comment; not a statement
+        COMMENT ON COLUMN t.c IS 'a; b''s';
+        DO $$ BEGIN
+            CREATE TYPE x AS ENUM ('a');
+        EXCEPTION WHEN duplicate_object THEN null;
+        END $$;
+        /* block; comment */
+        """
+        statements = split_statements(sql)
+        assert len(statements) == 2
+        assert statements[0].endswith("'a; b''s'")
+        assert statements[1].startswith("DO $$") and statements[1].endswith("END $$")
+
+    def test_query_index_migration_runs_one_statement_per_index(self):
+        path = next(m.path for m in discover() if m.name == "query_indexes")
+        statements = split_statements(path.read_text(encoding="utf-8"))
+        code = ["\n".join(line for line in s.splitlines() if not line.startswith("--")) for s in statements]
+        assert len(code) == 13
+        assert sum("CONCURRENTLY" in c for c in code) == 10
+        assert all(c.count("CONCURRENTLY") <= 1 for c in code)
+
+
+class TestUpgrade:
+    """upgrade / stamp"""
+
+    def test_empty_database_gets_schema_and_every_version(self, engine):
+        applied = upgrade(engine)
+
+        assert [m.version for m in applied] == [0]
+        assert set(models.Base.metadata.tables) <= set(inspect(engine).get_table_names())
+        assert set(applied_migrations(engine)) == {m.version for m in discover()}
+        assert current_version(engine) == latest_version()
+
+    def test_second_run_is_noop(self, engine):
+        upgrade(engine)
+        assert upgrade(engine) == []
+
+    def test_unversioned_database_with_tables_is_refused(self, engine):
+        models.Base.metadata.create_all(bind=engine)
+        with pytest.raises(MigrationError, match="stamp"):
+            upgrade(engine)
+
+    def test_stamp_then_upgrade_applies_the_rest(self, engine):
+        models.Base.metadata.create_all(bind=engine)
+        stamp(engine, 5)
+        assert current_version(engine) == 5
+
+        applied = upgrade(engine)
+        assert [m.version for m in applied] == [m.version for m in discover() if m.version > 5]
+        assert current_version(engine) == latest_version()
+
+
+class TestSplitProjectDetails:
+    """008_split_project_details"""
+
+    def test_moves_sections_out_of_projects(self, engine):
+        # projects as it was before 008: every detail column inline
+        legacy = MetaData()
+        projects = models.ProjectModel.__table__.to_metadata(legacy)
+        for name in models.PROJECT_DETAIL_COLUMNS:
+            projects.append_column(models.ProjectDetailModel.__table__.c[name]._copy())
+        legacy.create_all(engine)
+        with engine.begin() as conn:
+            conn.execute(projects.insert(), {
+                "title": "A", "description": "d", "image": "/a.png", "type": "Research",
+                "category": "data-science", "role": "Lead", "duration": "1 month",
+                "tags": [], "objectives": [], "technologies": [], "methods": [], "results": [],
+                "long_description": "Long form", "references": ["Ref 1"],
+            })
+        stamp(engine, 7)
+
+        assert [m.version for m in upgrade(engine, target=8)] == [8]
+
+        columns = {c["name"] for c in inspect(engine).get_columns("projects")}
+        assert columns.isdisjoint(models.PROJECT_DETAIL_COLUMNS)
+        with Session(engine) as session:
+            project = session.get(models.ProjectModel, 1)
+            assert project.title == "A"
+            assert project.long_description == "Long form"
+            assert project.references == ["Ref 1"]
+            assert project.code_snippet is None
+
+
+class TestCheckSchemaVersion:
+    """check_schema_version (startup)"""
+
+    def test_warns_when_unversioned(self, engine, caplog):
+        with caplog.at_level(logging.WARNING, logger="migrations.runner"):
+            assert check_schema_version(engine) is None
+        assert "unversioned" in caplog.text
+
+    def test_warns_when_behind(self, engine, caplog):
+        models.Base.metadata.create_all(bind=engine)
+        stamp(engine, 1)
+        with caplog.at_level(logging.WARNING, logger="migrations.runner"):
+            assert check_schema_version(engine) == 1
+        assert "expects" in caplog.text
+
+    def test_silent_when_current(self, engine, caplog):
+        upgrade(engine)
+        with caplog.at_level(logging.WARNING, logger="migrations.runner"):
+            assert check_schema_version(engine) == latest_version()
+        assert caplog.text == ""
@@ -0,0 +1,93 @@
+"""
+Project search tests — inverted index ranking, prefix matching, facet
+filters/counts, and GET /api/projects/search.
+"""
+from unittest.mock import patch
+
+import pytest
+
+from services.project_search import ProjectSearchIndex
+
+PROJECTS = [
+    {"id": 1, "title": "Transformer Text Classifier", "description": "NLP with PyTorch",
+     "category": "data-science", "tags": ["nlp", "deep-learning"], "technologies": ["PyTorch", "HuggingFace"]},
+    {"id": 2, "title": "Image Segmentation", "description": "U-Net in PyTorch",
+     "category": "data-science", "tags": ["cv", "deep-learning"], "technologies": ["PyTorch"]},
+    {"id": 3, "title": "Portfolio Website", "description": "React frontend with a FastAPI backend",
+     "category": "web-app", "tags": ["web"], "technologies": ["React", "FastAPI"]},
+]
+
+
+@pytest.fixture
+def index():
+    return ProjectSearchIndex(PROJECTS)
+
+
+class TestProjectSearchIndex:
+    """ProjectSearchIndex.search"""
+
+    def test_empty_query_returns_everything_with_global_facets(self, index):
+        result = index.search()
+        assert result.total == 3
+        assert result.ids == [1, 2, 3]
+        assert result.facets["category"] == {"data-science": 2, "web-app": 1}
+        assert result.facets["tag"]["deep-learning"] == 2
+
+    def test_weighted_ranking_with_ties_by_id(self, index):
+        # "deep" and "pytorch" score the same on 1 and 2; "image" only matches 2's title
+        assert index.search("segmentation").ids == [2]
+        assert index.search("deep").ids == [1, 2]
+        assert index.search("deep image").ids == [2]
+        assert index.search("pytorch").ids == [1, 2]
+
+    def test_words_are_prefixes_and_all_must_match(self, index):
+        assert index.search("pyt").total == 2
+        assert index.search("pytorch unet").ids == []
+        assert index.search("pytorch image").ids == [2]
+
+    def test_filters_and_facet_counts_follow_matches(self, index):
+        result = index.search(filters={"tag": ["deep-learning"], "technology": ["HuggingFace"]})
+        assert result.ids == [1]
+        assert result.facets["technology"] == {"HuggingFace": 1, "PyTorch": 1}
+        assert index.search(filters={"category": ["missing"]}).total == 0
+
+    def test_pagination(self, index):
+        result = index.search(limit=2, offset=1)
+        assert result.total == 3
+        assert result.ids == [2, 3]
+
+
+class TestSearchEndpoint:
+    """GET /api/projects/search"""
+
+    @patch("routes.projects._get_search_index")
+    def test_search_returns_ids_and_facets(self, mock_index, client):
+        mock_index.return_value = ProjectSearchIndex(PROJECTS)
+        resp = client.get("/api/projects/search", params={"q": "pytorch", "tag": "cv"})
+        assert resp.status_code == 200
+        assert resp.json() == {
+            "total": 1, "ids": [2],
+            "facets": {"category": {"data-science": 1}, "tag": {"cv": 1, "deep-learning": 1},
+                       "technology": {"PyTorch": 1}},
+        }
+
+    def test_search_is_not_shadowed_by_project_id_route(self, client):
+        with patch("routes.projects._get_search_index", return_value=ProjectSearchIndex([])):
+            assert client.get("/api/projects/search").status_code == 200
+
+    def test_limit_is_bounded(self, client):
+        assert client.get("/api/projects/search", params={"limit": 1000}).status_code == 422
+
+    def test_index_rebuilds_when_cached_list_changes(self, monkeypatch):
+        from routes import projects
+
+        listing = [PROJECTS[:1]]
+        monkeypatch.setattr(projects, "get_all_projects", lambda: listing[0])
+        projects._clear_projects_cache()
+        try:
+            assert len(projects._get_search_index()) == 1
+            listing[0] = PROJECTS
+            projects._invalidate_projects_cache()
+            assert len(projects._get_search_index()) == 3
+        finally:
+            projects._clear_projects_cache()
@@ -0,0 +1,171 @@
+"""
+Project repository tests — JSONProjectRepository's in-memory index, edit
+journal and compaction, crash recovery, and reload when the files change on
+disk; DatabaseProjectRepository across projects / project_details.
+"""
+import json
+import threading
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.orm import sessionmaker
+
+from models import ProjectDetailModel
+from services.project_service import DatabaseProjectRepository, JSONProjectRepository
+
+
+@pytest.fixture
+def repo(tmp_path):
+    return JSONProjectRepository(str(tmp_path / "projects.json"))
+
+
+def _read_file(repo) -> list[dict]:
+    return json.loads(repo._file_path.read_text(encoding="utf-8"))
+
+
+def _journal_lines(repo) -> list[dict]:
+    return [json.loads(line) for line in repo._journal_path.read_text(encoding="utf-8").splitlines()]
+
+
+class TestJSONProjectRepository:
+    """CRUD against the in-memory index"""
+
+    def test_crud_round_trip_is_persisted(self, repo):
+        first = repo.create({"title": "A"})
+        second = repo.create({"title": "B"})
+        assert (first["id"], second["id"]) == (1, 2)
+
+        updated = repo.update(1, {"title": "A2", "description": None})
+        assert updated["title"] == "A2"
+        assert "description" not in updated
+        assert repo.delete(2) is True
+        assert repo.delete(2) is False
+        assert repo.update(99, {"title": "x"}) is None
+
+        assert [p["title"] for p in repo.get_all()] == ["A2"]
+        assert [p["title"] for p in JSONProjectRepository(str(repo._file_path)).get_all()] == ["A2"]
+
+    def test_returned_projects_are_copies(self, repo):
+        repo.create({"title": "A"})
+        repo.get_by_id(1)["title"] = "mutated"
+        snapshot = repo.get_all()
+        repo.update(1, {"title": "B"})
+        assert snapshot[0]["title"] == "A"
+        assert repo.get_by_id(1)["title"] == "B"
+
+    def test_reads_do_not_reparse_unchanged_file(self, repo, monkeypatch):
+        repo.create({"title": "A"})
+        repo.get_all()
+        monkeypatch.setattr(repo, "_load", lambda: pytest.fail("file re-read"))
+        assert repo.get_by_id(1)["title"] == "A"
+        assert len(repo.get_all()) == 1
+
+    def test_external_edit_is_picked_up(self, tmp_path):
+        repo = JSONProjectRepository(str(tmp_path / "projects.json"), compact_bytes=0)
+        repo.create({"title": "A"})
+        assert len(repo.get_all()) == 1
+        repo._file_path.write_text(json.dumps([{"id": 7, "title": "Edited"}]), encoding="utf-8")
+        assert repo.get_by_id(7)["title"] == "Edited"
+        assert repo.get_by_id(1) is None
+
+    def test_writes_leave_no_temp_files(self, tmp_path):
+        repo = JSONProjectRepository(str(tmp_path / "projects.json"), compact_bytes=0)
+        for i in range(5):
+            repo.create({"title": str(i)})
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["projects.json", "projects.json.journal"]
+
+    def test_concurrent_creates_get_unique_ids(self, repo):
+        threads = [threading.Thread(target=repo.create, args=({"title": str(i)},)) for i in range(20)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert sorted(p["id"] for p in repo.get_all()) == list(range(1, 21))
+        assert len(_journal_lines(repo)) == 20
+
+
+class TestJournal:
+    """Append-only edit journal and compaction"""
+
+    def test_edits_append_to_journal_not_snapshot(self, repo):
+        repo.create({"title": "A"})
+        repo.update(1, {"title": "B"})
+        repo.delete(1)
+        assert _read_file(repo) == []
+        assert [entry["op"] for entry in _journal_lines(repo)] == ["put", "put", "delete"]
+
+    def test_compaction_folds_journal_into_snapshot(self, tmp_path):
+        repo = JSONProjectRepository(str(tmp_path / "projects.json"), compact_bytes=500)
+        for i in range(20):
+            repo.create({"title": f"Project {i}", "description": "x" * 50})
+        assert repo._journal_path.stat().st_size <= 500
+        on_disk = {p["id"] for p in _read_file(repo)} | {e["project"]["id"] for e in _journal_lines(repo)}
+        assert on_disk == set(range(1, 21))
+        assert len(JSONProjectRepository(str(repo._file_path)).get_all()) == 20
+
+    def test_torn_last_line_is_ignored_and_overwritten(self, repo):
+        repo.create({"title": "A"})
+        with open(repo._journal_path, "ab") as f:
+            f.write(b'{"op":"put","project":{"id":2,"tit')  # crash mid-append
+
+        reopened = JSONProjectRepository(str(repo._file_path))
+        assert [p["id"] for p in reopened.get_all()] == [1]
+        reopened.create({"title": "B"})
+        assert [e["project"]["title"] for e in _journal_lines(reopened)] == ["A", "B"]
+        assert [p["title"] for p in JSONProjectRepository(str(repo._file_path)).get_all()] == ["A", "B"]
+
+    def test_replay_after_crash_during_compaction(self, repo):
+        repo.create({"title": "A"})
+        repo.create({"title": "B"})
+        repo.delete(1)
+        # Snapshot written but journal not yet emptied: replaying it again is harmless
+        repo._file_path.write_text(json.dumps(repo.get_all()), encoding="utf-8")
+        assert [p["title"] for p in JSONProjectRepository(str(repo._file_path)).get_all()] == ["B"]
+
+    def test_appends_from_another_process_are_replayed(self, repo):
+        repo.create({"title": "A"})
+        other = JSONProjectRepository(str(repo._file_path))
+        other.create({"title": "B"})
+        assert [p["title"] for p in repo.get_all()] == ["A", "B"]
+
+
+class TestDatabaseProjectRepository:
+    """DatabaseProjectRepository with sections split into project_details"""
+
+    @pytest.fixture
+    def db_repo(self, sqlite_db, monkeypatch):
+        monkeypatch.setattr("services.project_service.SessionLocal", sessionmaker(bind=sqlite_db))
+        return DatabaseProjectRepository()
+
+    PAYLOAD = {
+        "title": "A", "description": "Short", "longDescription": "Long form", "image": "/a.png",
+        "type": "Research", "category": "data-science", "role": "Lead", "duration": "1 month",
+        "tags": ["nlp"], "objectives": [], "technologies": ["PyTorch"], "methods": [], "results": [],
+        "codeSnippet": "print(1)", "references": ["Ref 1"],
+    }
+
+    def test_api_dict_round_trips_across_both_tables(self, db_repo, sqlite_db):
+        created = db_repo.create(self.PAYLOAD)
+        assert {k: created[k] for k in self.PAYLOAD} == self.PAYLOAD
+
+        with sqlite_db.connect() as conn:
+            detail = conn.execute(select(ProjectDetailModel.__table__)).mappings().one()
+        assert detail["project_id"] == created["id"]
+        assert detail["long_description"] == "Long form"
+        assert detail["code_snippet"] == "print(1)"
+
+        assert db_repo.get_by_id(created["id"]) == created
+        assert db_repo.get_all() == [created]
+
+    def test_update_touches_detail_fields(self, db_repo):
+        created = db_repo.create(self.PAYLOAD)
+        updated = db_repo.update(created["id"], {"LiteratureReview": "Survey", "title": "B"})
+        assert updated["LiteratureReview"] == "Survey"
+        assert updated["title"] == "B"
+        assert updated["longDescription"] == "Long form"
+
+    def test_delete_removes_details(self, db_repo, sqlite_db):
+        created = db_repo.create(self.PAYLOAD)
+        assert db_repo.delete(created["id"])
+        with sqlite_db.connect() as conn:
+            assert conn.execute(select(ProjectDetailModel.__table__)).first() is None
@@ -4,6 +4,8 @@ Uses unittest.mock to patch the project service layer.
 """
 from unittest.mock import patch
 
+from utils.responses import dump_json
+
 # ── Helpers ──
 
 def _sample_project(**overrides):
@@ -49,7 +51,7 @@ class TestPublicProjects:
 
     @patch("routes.projects._get_cached_projects")
     def test_list_all(self, mock_cache, client):
-        mock_cache.return_value = [_sample_project()]
+        mock_cache.return_value = dump_json([_sample_project()])
         resp = client.get("/api/projects")
         assert resp.status_code == 200
         data = resp.json()
@@ -59,7 +61,7 @@ class TestPublicProjects:
 
     @patch("routes.projects._get_cached_projects")
     def test_cache_control_header(self, mock_cache, client):
-        mock_cache.return_value = []
+        mock_cache.return_value = b"[]"
         resp = client.get("/api/projects")
         assert "max-age=300" in resp.headers.get("cache-control", "")
 
@@ -0,0 +1,117 @@
+"""
+Query audit tests — per-route query budgets against a real (SQLite)
+session, slow-query EXPLAIN logging and N+1 detection.
+"""
+import logging
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session
+
+import models
+from middleware.query_audit import QueryAuditMiddleware
+from services.query_audit import QueryAuditor
+
+
+def _seed_leads(engine, count: int) -> None:
+    now = datetime(2025, 1, 1)
+    with Session(engine) as db:
+        db.add_all([
+            models.ContactLead(
+                name=f"Lead {i}", email=f"lead{i}@acme.io", subject="Hi", message="Hello",
+                created_at=now + timedelta(minutes=i),
+            )
+            for i in range(count)
+        ])
+        db.commit()
+
+
+class TestRouteQueryBudgets:
+    """Declared per-route query budgets"""
+
+    def test_public_site_settings_single_query(self, client, sqlite_db, query_budget):
+        with Session(sqlite_db) as db:
+            db.add(models.SiteSettingModel(key="open_to_work", value=False))
+            db.commit()
+        with query_budget(1):
+            resp = client.get("/api/site-settings/public")
+        assert resp.json() == {
+            "maintenance_mode": False, "open_to_work": False, "recruiter_gateway_enabled": True,
+            "contact_form_enabled": True, "active_resume_url": "/resume.pdf",
+        }
+
+    def test_admin_site_settings_single_query(self, client, auth_header, sqlite_db, query_budget):
+        with query_budget(1):
+            resp = client.get("/api/admin/site-settings", headers=auth_header)
+        assert resp.json()["settings"]["meta_title"].startswith("Arpit Kumar")
+
+    def test_update_site_settings_batched(self, client, auth_header, sqlite_db, query_budget):
+        updates = {"maintenance_mode": True, "open_to_work": False, "contact_form_enabled": False}
+        with query_budget(2):  # one SELECT for existing keys + one batched INSERT
+            client.patch("/api/admin/site-settings", json=updates, headers=auth_header)
+        resp = client.get("/api/site-settings/public")
+        assert resp.json()["maintenance_mode"] is True
+        assert resp.json()["open_to_work"] is False
+
+    def test_admin_leads_page_and_total_in_one_query(self, client, auth_header, sqlite_db, query_budget):
+        _seed_leads(sqlite_db, 3)
+        with query_budget(1):
+            resp = client.get("/api/admin/leads?page=1&per_page=2", headers=auth_header)
+        data = resp.json()
+        assert data["total"] == 3
+        assert data["total_pages"] == 2
+        assert [lead["name"] for lead in data["leads"]] == ["Lead 2", "Lead 1"]
+
+    def test_admin_leads_page_past_end(self, client, auth_header, sqlite_db, query_budget):
+        _seed_leads(sqlite_db, 3)
+        with query_budget(2):
+            data = client.get("/api/admin/leads?page=5&per_page=2", headers=auth_header).json()
+        assert data["leads"] == []
+        assert data["total"] == 3
+
+    def test_budget_violation_fails(self, sqlite_db, query_budget):
+        with pytest.raises(pytest.fail.Exception, match="Query budget exceeded: 2 > 1"):
+            with query_budget(1):
+                with sqlite_db.connect() as conn:
+                    conn.execute(text("SELECT 1"))
+                    conn.execute(text("SELECT 2"))
+
+
+class TestSlowQueryLogging:
+    """QueryAuditor slow-query EXPLAIN"""
+
+    def test_slow_select_logged_with_plan(self, caplog):
+        engine = create_engine("sqlite://")
+        models.ContactLead.__table__.create(engine)
+        auditor = QueryAuditor(slow_query_ms=0)
+        auditor.attach(engine)
+        with caplog.at_level(logging.WARNING, logger="services.query_audit"):
+            with engine.connect() as conn:
+                conn.execute(text("SELECT * FROM contact_leads WHERE subject = :s"), {"s": "Hi"})
+        assert "Slow query" in caplog.text
+        assert "SCAN contact_leads" in caplog.text
+
+
+class TestQueryAuditMiddleware:
+    """Per-request N+1 logging"""
+
+    def test_repeated_statements_flagged(self, caplog):
+        engine = create_engine("sqlite://")
+        auditor = QueryAuditor(slow_query_ms=10_000)
+        auditor.attach(engine)
+        app = FastAPI()
+        app.add_middleware(QueryAuditMiddleware, auditor=auditor, max_queries=10, repeat_threshold=3)
+
+        @app.get("/n-plus-one")
+        def n_plus_one():
+            with engine.connect() as conn:
+                for i in range(3):
+                    conn.execute(text("SELECT :i"), {"i": i})
+            return {}
+
+        with caplog.at_level(logging.WARNING, logger="middleware.query_audit"):
+            TestClient(app).get("/n-plus-one")
+        assert "possible N+1" in caplog.text
@@ -0,0 +1,133 @@
+"""
+Rate limiter tests — shared limiter wiring, proxy-aware keys, the SQLite
+file storage used for multi-worker deployments and cost-weighted budgets.
+"""
+from unittest.mock import MagicMock, patch
+
+from limits import parse
+from limits.storage import storage_from_string
+from limits.strategies import FixedWindowRateLimiter, MovingWindowRateLimiter
+
+from config import RATE_LIMIT_BUDGET_GLOBAL, RATE_LIMIT_BUDGET_IP
+from services.rate_limiter import ROUTE_COSTS, SQLiteStorage, get_real_ip, limiter
+
+
+def _request(headers=None, host="10.0.0.1"):
+    req = MagicMock()
+    req.headers = headers or {}
+    req.client.host = host
+    return req
+
+
+class TestRealIp:
+    """get_real_ip"""
+
+    def test_prefers_first_forwarded_hop(self):
+        req = _request({"X-Forwarded-For": "203.0.113.7, 10.0.0.2"})
+        assert get_real_ip(req) == "203.0.113.7"
+
+    def test_falls_back_to_client_host(self):
+        assert get_real_ip(_request()) == "10.0.0.1"
+
+
+class TestSharedLimiter:
+    """Every router must count against the same Limiter instance."""
+
+    def test_routers_share_app_limiter(self):
+        from main import app
+        from routes import auth, leads, projects
+
+        assert app.state.limiter is limiter
+        assert leads.limiter is limiter
+        assert projects.limiter is limiter
+        assert auth.limiter is limiter
+
+
+class TestSQLiteStorage:
+    """sqlite:// storage shared between processes on one host"""
+
+    def test_registered_scheme(self, tmp_path):
+        storage = storage_from_string(f"sqlite:///{tmp_path / 'rl.db'}")
+        assert isinstance(storage, SQLiteStorage)
+        assert storage.check()
+
+    def test_moving_window_shared_between_workers(self, tmp_path):
+        uri = f"sqlite:///{tmp_path / 'rl.db'}"
+        worker_a = MovingWindowRateLimiter(SQLiteStorage(uri))
+        worker_b = MovingWindowRateLimiter(SQLiteStorage(uri))
+        item = parse("3/minute")
+
+        assert worker_a.hit(item, "1.2.3.4")
+        assert worker_b.hit(item, "1.2.3.4")
+        assert worker_a.hit(item, "1.2.3.4")
+        assert not worker_b.hit(item, "1.2.3.4")
+        # Other clients are unaffected
+        assert worker_b.hit(item, "5.6.7.8")
+
+    def test_moving_window_cost(self, tmp_path):
+        limiter_ = MovingWindowRateLimiter(SQLiteStorage(f"sqlite:///{tmp_path / 'rl.db'}"))
+        item = parse("10/minute")
+        assert limiter_.hit(item, "k", cost=6)
+        assert not limiter_.hit(item, "k", cost=5)
+        assert limiter_.hit(item, "k", cost=4)
+        assert limiter_.get_window_stats(item, "k").remaining == 0
+
+    def test_fixed_window_counts(self, tmp_path):
+        limiter_ = FixedWindowRateLimiter(SQLiteStorage(f"sqlite:///{tmp_path / 'rl.db'}"))
+        item = parse("2/minute")
+        assert limiter_.hit(item, "k")
+        assert limiter_.hit(item, "k")
+        assert not limiter_.hit(item, "k")
+
+    def test_clear_and_reset(self, tmp_path):
+        storage = SQLiteStorage(f"sqlite:///{tmp_path / 'rl.db'}")
+        limiter_ = MovingWindowRateLimiter(storage)
+        item = parse("1/minute")
+        assert limiter_.hit(item, "k")
+        assert not limiter_.hit(item, "k")
+        limiter_.clear(item, "k")
+        assert limiter_.hit(item, "k")
+        assert storage.reset() >= 1
+
+
+class TestCostBudgets:
+    """Public routes spend their declared cost from a shared per-IP budget."""
+
+    CV_FORM = {
+        "name": "Alice", "email": "alice@corp.com", "company": "TechInc",
+        "subject": "CV Request", "message": "Please send CV",
+    }
+
+    @patch("routes.leads.send_admin_notification")
+    @patch("routes.leads.send_cv_request_email")
+    @patch("routes.leads._validate_contact_payload")
+    @patch("routes.leads.create_contact_lead")
+    def test_cv_requests_drain_ip_budget(self, mock_create, mock_validate, mock_cv, mock_notify, client):
+        headers = {"X-Forwarded-For": "198.51.100.20"}
+        allowed = parse(RATE_LIMIT_BUDGET_IP).amount // ROUTE_COSTS["cv_request"]
+        for _ in range(allowed):
+            assert client.post("/api/v1/request-cv", data=self.CV_FORM, headers=headers).status_code == 200
+        assert client.post("/api/v1/request-cv", data=self.CV_FORM, headers=headers).status_code == 429
+
+        # The budget is shared, so cheap reads from the same client are throttled too
+        with patch("routes.projects.get_version_info", return_value={"count": 0, "last_updated": None}):
+            assert client.get("/api/projects/version", headers=headers).status_code == 429
+            other = {"X-Forwarded-For": "198.51.100.21"}
+            assert client.get("/api/projects/version", headers=other).status_code == 200
+
+    @patch("routes.projects.get_version_info", return_value={"count": 0, "last_updated": None})
+    def test_throttled_ip_cannot_drain_global_budget(self, mock_info, client):
+        flooder = {"X-Forwarded-For": "198.51.100.40"}
+        # Enough calls to empty the global budget if rejected ones were charged to it
+        for _ in range(parse(RATE_LIMIT_BUDGET_GLOBAL).amount + 1):
+            client.get("/api/projects/version", headers=flooder)
+        assert client.get("/api/projects/version", headers=flooder).status_code == 429
+
+        other = {"X-Forwarded-For": "198.51.100.41"}
+        assert client.get("/api/projects/version", headers=other).status_code == 200
+
+    @patch("routes.projects.get_version_info", return_value={"count": 0, "last_updated": None})
+    def test_cheap_reads_cost_one_token(self, mock_info, client):
+        headers = {"X-Forwarded-For": "198.51.100.30"}
+        for _ in range(ROUTE_COSTS["cv_request"] + 1):
+            assert client.get("/api/projects/version", headers=headers).status_code == 200
@@ -0,0 +1,57 @@
+"""
+FastJSONResponse tests — native handling of the types our payloads carry
+and parity with the stdlib encoder for already-serialized data.
+"""
+import json
+from datetime import datetime, timezone
+from decimal import Decimal
+
+import orjson
+import pytest
+from fastapi.encoders import jsonable_encoder
+
+import models
+from main import app
+from utils.responses import FastJSONResponse, dump_json
+
+
+class TestDumpJson:
+    """dump_json"""
+
+    def test_native_types(self):
+        payload = {
+            "status": models.LeadStatus.CONTACTED,
+            "category": models.ProjectCategoryEnum.WEB_APP,
+            "created_at": datetime(2025, 1, 2, 3, 4, 5, 600000),
+            "updated_at": datetime(2025, 1, 2, tzinfo=timezone.utc),
+            "score": Decimal("0.75"),
+            "tags": frozenset({"ml"}),
+            1: "non-str key",
+        }
+        assert orjson.loads(dump_json(payload)) == {
+            "status": "contacted",
+            "category": "web-app",
+            "created_at": "2025-01-02T03:04:05.600000",
+            "updated_at": "2025-01-02T00:00:00+00:00",
+            "score": 0.75,
+            "tags": ["ml"],
+            "1": "non-str key",
+        }
+
+    def test_matches_jsonable_encoder(self):
+        payload = {"created_at": datetime(2025, 1, 2, 3, 4, 5), "priority": models.Priority.HIGH}
+        assert orjson.loads(dump_json(payload)) == json.loads(json.dumps(jsonable_encoder(payload)))
+
+    def test_unknown_type_raises(self):
+        with pytest.raises(TypeError):
+            dump_json({"x": object()})
+
+
+class TestDefaultResponseClass:
+    """App-wide default"""
+
+    def test_app_uses_fast_json(self, client):
+        assert app.router.default_response_class is FastJSONResponse
+        resp = client.get("/api/hello")
+        assert resp.status_code == 200
+        assert resp.headers["content-type"] == "application/json"
@@ -0,0 +1,39 @@
+"""
+Security headers tests — SecurityHeadersMiddleware on the real app and
+in isolation (override semantics).
+"""
+from fastapi import FastAPI
+from fastapi.responses import Response
+from fastapi.testclient import TestClient
+
+from middleware.security_headers import SecurityHeadersMiddleware
+
+
+def _client() -> TestClient:
+    app = FastAPI()
+    app.add_middleware(SecurityHeadersMiddleware)
+
+    @app.get("/framed")
+    async def framed():
+        return Response("ok", headers={"X-Frame-Options": "SAMEORIGIN"})
+
+    return TestClient(app)
+
+
+class TestSecurityHeaders:
+    """SecurityHeadersMiddleware"""
+
+    def test_headers_on_app_responses(self, client):
+        resp = client.get("/api/hello")
+        assert resp.headers["x-content-type-options"] == "nosniff"
+        assert resp.headers["x-frame-options"] == "DENY"
+        assert "max-age=31536000" in resp.headers["strict-transport-security"]
+        assert resp.headers["referrer-policy"] == "strict-origin-when-cross-origin"
+        assert "camera=()" in resp.headers["permissions-policy"]
+
+    def test_headers_on_404(self, client):
+        assert client.get("/api/does-not-exist").headers["x-frame-options"] == "DENY"
+
+    def test_overrides_route_value(self):
+        resp = _client().get("/framed")
+        assert resp.headers.get_list("x-frame-options") == ["DENY"]
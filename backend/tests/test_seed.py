@@ -0,0 +1,62 @@
+"""
+Benchmark dataset generator tests — bulk-loaded rows must read back through
+the ORM exactly as the generators produced them.
+"""
+import random
+from datetime import datetime
+
+from sqlalchemy.orm import Session
+
+import models
+from benchmarks.seed import bulk_load, lead_rows, project_rows, split_project_rows, telemetry_rows
+
+NOW = datetime(2026, 1, 15, 12, 0, 0)
+
+
+class TestGenerators:
+    """lead_rows / telemetry_rows / project_rows"""
+
+    def test_same_seed_same_rows(self):
+        first = list(lead_rows(50, random.Random(1), NOW))
+        second = list(lead_rows(50, random.Random(1), NOW))
+        assert first == second
+
+    def test_telemetry_sessions_follow_funnel(self):
+        rows = list(telemetry_rows(2_000, random.Random(3), NOW, projects=10))
+        assert len(rows) == 2_000
+        sessions: dict[str, list[dict]] = {}
+        for row in rows:
+            sessions.setdefault(row["session_id"], []).append(row)
+        for events in sessions.values():
+            assert events[0]["path"] == "/"
+            assert [e["created_at"] for e in events] == sorted(e["created_at"] for e in events)
+        assert {row["event_type"] for row in rows} >= {"pageview", "click", "lead_submit"}
+
+
+class TestBulkLoad:
+    """bulk_load"""
+
+    def test_round_trip_through_orm(self, sqlite_db):
+        leads = list(lead_rows(30, random.Random(5), NOW))
+        bulk_load(sqlite_db, models.ContactLead.__table__, leads)
+        projects, details = split_project_rows(project_rows(3, random.Random(5), NOW))
+        bulk_load(sqlite_db, models.ProjectModel.__table__, projects)
+        bulk_load(sqlite_db, models.ProjectDetailModel.__table__, details)
+
+        with Session(sqlite_db) as session:
+            loaded = session.query(models.ContactLead).order_by(models.ContactLead.id).all()
+            assert len(loaded) == 30
+            for lead, row in zip(loaded, leads):
+                assert lead.email == row["email"]
+                assert lead.status == row["status"]
+                assert lead.metadata_json == row["metadata"]
+                assert lead.created_at == row["created_at"]
+                assert lead.last_contacted == row["last_contacted"]
+
+            project = session.get(models.ProjectModel, 1)
+            assert project.category in models.ProjectCategoryEnum
+            assert len(project.implementation) == 12
+            assert len(project.references) == 25
+
+    def test_empty_iterable_is_noop(self, sqlite_db):
+        bulk_load(sqlite_db, models.TelemetryEventModel.__table__, [])
@@ -0,0 +1,41 @@
+"""
+Serializer tests — the column-tuple fast path must produce exactly what
+serialize_contact_lead produces for the same row.
+"""
+from datetime import datetime
+
+import orjson
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+import models
+from utils.responses import dump_json
+from utils.serializers import (
+    CONTACT_LEAD_COLUMNS,
+    serialize_contact_lead,
+    serialize_contact_lead_row,
+)
+
+
+class TestContactLeadRow:
+    """serialize_contact_lead_row"""
+
+    def test_matches_entity_serializer(self):
+        engine = create_engine("sqlite://")
+        models.ContactLead.__table__.create(engine)
+        with Session(engine) as session:
+            session.add(models.ContactLead(
+                name="Jane", email="jane@acme.io", subject="Hiring", message="Hello",
+                company="Acme", role="recruiter", lead_type=models.LeadType.CV_REQUEST,
+                priority=models.Priority.HIGH, quality_score=0.9, tags=["ml"],
+                metadata_json={"ip_address": "203.0.113.1"},
+                last_contacted=datetime(2025, 1, 2, 3, 4, 5),
+            ))
+            session.commit()
+            lead = session.query(models.ContactLead).one()
+            row = session.query(*CONTACT_LEAD_COLUMNS).one()
+
+            expected = orjson.loads(orjson.dumps(serialize_contact_lead(lead)))
+            assert orjson.loads(dump_json(serialize_contact_lead_row(row))) == expected
+            assert expected["lead_type"] == "cv_request"
+            assert expected["last_contacted"] == "2025-01-02T03:04:05"
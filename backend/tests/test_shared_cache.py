@@ -0,0 +1,110 @@
+"""
+Shared cache tier tests — entries written by one worker are served to the
+others from the mapped file, and only one worker refreshes at a time.
+"""
+import threading
+import time
+
+import pytest
+
+from services.shared_cache import SharedCache
+
+
+@pytest.fixture
+def cache_dir(tmp_path):
+    return tmp_path / "shared"
+
+
+def _counting_loader(body: bytes = b"[1]", delay: float = 0.0):
+    calls = []
+
+    def loader():
+        calls.append(1)
+        time.sleep(delay)
+        return body
+    return loader, calls
+
+
+class TestSharedCache:
+    """get / invalidate"""
+
+    def test_miss_loads_once_then_serves_from_file(self, cache_dir):
+        cache = SharedCache(cache_dir)
+        loader, calls = _counting_loader()
+        first = cache.get("projects", loader, ttl=60)
+        second = cache.get("projects", loader, ttl=60)
+        assert first.body == second.body == b"[1]"
+        assert first.version == 1
+        assert len(calls) == 1
+
+    def test_other_worker_reads_same_entry(self, cache_dir):
+        loader, calls = _counting_loader(b'{"a":1}')
+        SharedCache(cache_dir).get("about", loader, ttl=60)
+        entry = SharedCache(cache_dir).get("about", loader, ttl=60)
+        assert entry.body == b'{"a":1}'
+        assert len(calls) == 1
+
+    def test_expired_entry_is_reloaded_with_new_version(self, cache_dir):
+        cache = SharedCache(cache_dir)
+        cache.get("projects", lambda: b"old", ttl=-1)
+        entry = cache.get("projects", lambda: b"new", ttl=60)
+        assert (entry.version, entry.body) == (2, b"new")
+
+    def test_invalidate_respects_publish_time(self, cache_dir):
+        cache = SharedCache(cache_dir)
+        before = time.time()
+        cache.get("projects", lambda: b"fresh", ttl=60)
+        cache.invalidate("projects", published_at=before)  # entry already newer
+        assert cache.get("projects", lambda: b"reloaded", ttl=60).body == b"fresh"
+
+        cache.invalidate("projects", published_at=time.time())
+        assert cache.get("projects", lambda: b"reloaded", ttl=60).body == b"reloaded"
+
+    def test_restart_drops_entries_from_the_previous_run(self, cache_dir):
+        old = SharedCache(cache_dir)
+        old.get("projects", lambda: b"before deploy", ttl=3600)
+        old.get("about", lambda: b"before deploy", ttl=3600)
+
+        started = time.time()
+        first, second = SharedCache(cache_dir), SharedCache(cache_dir)
+        first.invalidate_all(published_at=started)
+        first.get("about", lambda: b"after deploy", ttl=3600)
+        second.invalidate_all(published_at=started)  # keeps what `first` loaded since
+
+        assert second.get("projects", lambda: b"after deploy", ttl=3600).body == b"after deploy"
+        assert second.get("about", lambda: b"reloaded", ttl=3600).body == b"after deploy"
+
+    def test_corrupt_file_is_treated_as_miss(self, cache_dir):
+        cache = SharedCache(cache_dir)
+        (cache_dir / "projects.cache").write_bytes(b"garbage")
+        assert cache.get("projects", lambda: b"[]", ttl=60).body == b"[]"
+
+    def test_concurrent_cold_start_loads_once(self, cache_dir):
+        loader, calls = _counting_loader(delay=0.1)
+        workers = [SharedCache(cache_dir) for _ in range(8)]
+        results = []
+        threads = [threading.Thread(target=lambda c=c: results.append(c.get("projects", loader, ttl=60).body))
+                   for c in workers]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert results == [b"[1]"] * 8
+        assert len(calls) == 1
+
+    def test_stale_entry_served_while_another_worker_refreshes(self, cache_dir):
+        refresher, reader = SharedCache(cache_dir), SharedCache(cache_dir)
+        refresher.get("projects", lambda: b"old", ttl=-1)
+        started = threading.Event()
+
+        def slow_loader():
+            started.set()
+            time.sleep(0.2)
+            return b"new"
+
+        thread = threading.Thread(target=refresher.get, args=("projects", slow_loader, 60))
+        thread.start()
+        started.wait()
+        assert reader.get("projects", lambda: pytest.fail("second refresh"), ttl=60).body == b"old"
+        thread.join()
+        assert reader.get("projects", lambda: b"unused", ttl=60).body == b"new"
@@ -0,0 +1,75 @@
+"""
+Project similarity tests — TF-IDF cosine top-k and the repository keeping
+similar_project_ids current on every write.
+"""
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+from services.project_service import DatabaseProjectRepository
+from services.similarity import compute_similar_ids, project_terms
+
+
+def _project(pid, tags=(), technologies=(), description="", **extra):
+    return {"id": pid, "tags": list(tags), "technologies": list(technologies), "description": description, **extra}
+
+
+class TestComputeSimilarIds:
+    """compute_similar_ids"""
+
+    def test_ranks_shared_stack_first_and_excludes_self(self):
+        projects = [
+            _project(1, ["nlp"], ["PyTorch", "Transformers"], "Text classification with transformers"),
+            _project(2, ["nlp"], ["PyTorch", "Transformers"], "Named entity recognition with transformers"),
+            _project(3, ["web"], ["React", "FastAPI"], "Portfolio website"),
+            _project(4, ["cv"], ["PyTorch"], "Image segmentation"),
+        ]
+        similar = compute_similar_ids(projects, k=2)
+        assert similar[1] == [2, 4]
+        assert similar[2] == [1, 4]
+        assert all(pid not in ids for pid, ids in similar.items())
+
+    def test_unrelated_projects_are_not_linked(self):
+        similar = compute_similar_ids([_project(1, ["a"]), _project(2, ["b"])], k=3)
+        assert similar == {1: [], 2: []}
+
+    def test_ties_break_by_id_and_respect_k(self):
+        projects = [_project(pid, ["shared"]) for pid in (5, 3, 9, 1)]
+        assert compute_similar_ids(projects, k=2)[9] == [1, 3]
+
+    def test_terms_are_case_insensitive_and_field_scoped(self):
+        terms = project_terms({"tags": ["Python "], "tools": ["python"], "description": "The Python API"})
+        assert terms == {"tag:python": 2.0, "tool:python": 1.5, "word:python": 1.0, "word:api": 1.0}
+
+    @pytest.mark.parametrize("count", [0, 1])
+    def test_too_few_projects(self, count):
+        assert compute_similar_ids([_project(i + 1) for i in range(count)]) == {i + 1: [] for i in range(count)}
+
+
+class TestRepositoryRefresh:
+    """DatabaseProjectRepository writes similar_project_ids"""
+
+    @pytest.fixture
+    def repo(self, sqlite_db, monkeypatch):
+        monkeypatch.setattr("services.project_service.SessionLocal", sessionmaker(bind=sqlite_db))
+        return DatabaseProjectRepository()
+
+    @staticmethod
+    def _payload(title, tags, technologies):
+        return {
+            "title": title, "description": title, "longDescription": "...", "image": "/img.png",
+            "type": "Research", "category": "data-science", "role": "Lead", "duration": "1 month",
+            "tags": tags, "technologies": technologies,
+        }
+
+    def test_create_update_delete_keep_links_current(self, repo):
+        a = repo.create(self._payload("Alpha", ["nlp"], ["PyTorch"]))
+        b = repo.create(self._payload("Beta", ["nlp"], ["PyTorch"]))
+        c = repo.create(self._payload("Gamma", ["web"], ["React"]))
+        assert repo.get_by_id(a["id"])["similarProjectIds"] == [b["id"]]
+        assert repo.get_by_id(c["id"]).get("similarProjectIds", []) == []
+
+        repo.update(c["id"], {"tags": ["nlp"], "technologies": ["PyTorch"]})
+        assert c["id"] in repo.get_by_id(a["id"])["similarProjectIds"]
+
+        repo.delete(b["id"])
+        assert repo.get_by_id(a["id"])["similarProjectIds"] == [c["id"]]
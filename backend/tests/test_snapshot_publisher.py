@@ -0,0 +1,132 @@
+"""
+Static snapshot publisher tests — content-hashed files and manifest,
+unchanged content, version retention, and republishing on admin edits.
+"""
+import gzip
+import json
+import threading
+import time
+
+import orjson
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+from middleware.compression import PrecompressedJSON
+from services.snapshot_publisher import MANIFEST, DirectoryStore, SnapshotPublisher, snapshot_publisher
+
+
+@pytest.fixture
+def content():
+    return {"projects": [{"id": 1, "title": "A", "description": "x" * 2000}]}
+
+
+@pytest.fixture
+def publisher(tmp_path, content):
+    publisher = SnapshotPublisher(DirectoryStore(tmp_path), keep=2)
+    publisher.register("projects", lambda: PrecompressedJSON(content["projects"]), source="/api/projects")
+    yield publisher
+    publisher.stop()
+
+
+def _manifest(tmp_path) -> dict:
+    return json.loads((tmp_path / MANIFEST).read_bytes())
+
+
+class TestSnapshotPublisher:
+    """SnapshotPublisher.publish"""
+
+    def test_writes_hashed_precompressed_files_and_manifest(self, publisher, tmp_path, content):
+        publisher.publish()
+
+        manifest = _manifest(tmp_path)
+        entry = manifest["snapshots"]["projects"]
+        assert manifest["version"] == 1
+        assert entry["path"] == f"projects.{entry['hash']}.json"
+        assert entry["source"] == "/api/projects"
+        assert "gzip" in entry["encodings"]
+        assert orjson.loads((tmp_path / entry["path"]).read_bytes()) == content["projects"]
+        assert gzip.decompress((tmp_path / (entry["path"] + ".gz")).read_bytes()) == \
+            (tmp_path / entry["path"]).read_bytes()
+
+    def test_unchanged_content_is_not_republished(self, publisher, tmp_path):
+        publisher.publish()
+        publisher.publish()
+        assert _manifest(tmp_path)["version"] == 1
+
+    def test_keeps_the_last_versions_only(self, publisher, tmp_path, content):
+        paths = []
+        for title in ("A", "B", "C"):
+            content["projects"][0]["title"] = title
+            paths.append(publisher.publish()["snapshots"]["projects"]["path"])
+
+        entry = _manifest(tmp_path)["snapshots"]["projects"]
+        assert entry["path"] == paths[2]
+        assert entry["previous"] == [paths[1]]
+        assert not (tmp_path / paths[0]).exists()
+        assert not (tmp_path / (paths[0] + ".gz")).exists()
+        assert (tmp_path / paths[1]).exists()
+
+    def test_returning_to_earlier_content_reuses_its_file(self, publisher, content):
+        first = publisher.publish()["snapshots"]["projects"]["path"]
+        content["projects"][0]["title"] = "B"
+        publisher.publish()
+        content["projects"][0]["title"] = "A"
+        entry = publisher.publish()["snapshots"]["projects"]
+        assert entry["path"] == first
+        assert first not in entry["previous"]
+
+    def test_disabled_without_store(self):
+        publisher = SnapshotPublisher(None)
+        assert publisher.publish() is None
+        assert publisher.schedule() is None
+
+    def test_schedule_publishes_in_background(self, publisher, tmp_path):
+        publisher.schedule("projects").result(timeout=5)
+        assert _manifest(tmp_path)["version"] == 1
+
+    def test_slow_render_cannot_overwrite_a_later_edit(self, tmp_path):
+        # Worker A reads the old data, then worker B publishes after a newer edit
+        data = {"title": "old"}
+        read_old, release_a = threading.Event(), threading.Event()
+
+        def slow_render():
+            body = PrecompressedJSON(dict(data))
+            read_old.set()
+            release_a.wait(5)
+            return body
+
+        worker_a = SnapshotPublisher(DirectoryStore(tmp_path))
+        worker_a.register("about", slow_render, source="/api/about")
+        worker_b = SnapshotPublisher(DirectoryStore(tmp_path))
+        worker_b.register("about", lambda: PrecompressedJSON(dict(data)), source="/api/about")
+
+        a = threading.Thread(target=worker_a.publish)
+        a.start()
+        assert read_old.wait(5)
+        data["title"] = "new"
+        b = threading.Thread(target=worker_b.publish)
+        b.start()
+        time.sleep(0.1)  # give B the chance to publish first
+        release_a.set()
+        a.join(5)
+        b.join(5)
+
+        entry = _manifest(tmp_path)["snapshots"]["about"]
+        assert json.loads((tmp_path / entry["path"]).read_bytes()) == {"title": "new"}
+
+
+class TestAdminEditsRepublish:
+    """Admin edits schedule the matching snapshot"""
+
+    def test_settings_patch_publishes_public_settings(self, client, auth_header, sqlite_db, tmp_path, monkeypatch):
+        monkeypatch.setattr("database.SessionLocal", sessionmaker(bind=sqlite_db))
+        monkeypatch.setattr(snapshot_publisher, "_store", DirectoryStore(tmp_path))
+        try:
+            resp = client.patch("/api/admin/site-settings", json={"open_to_work": False}, headers=auth_header)
+            assert resp.status_code == 200
+        finally:
+            snapshot_publisher.stop()
+
+        entry = _manifest(tmp_path)["snapshots"]["site-settings"]
+        assert entry["source"] == "/api/site-settings/public"
+        assert json.loads((tmp_path / entry["path"]).read_bytes())["open_to_work"] is False
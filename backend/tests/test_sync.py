@@ -0,0 +1,150 @@
+"""
+Delta sync tests — cursor encoding, lead and project change feeds (keyset
+paging, tombstones, settle window, reset) and their endpoints.
+"""
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy.orm import Session, sessionmaker
+
+import models
+from services.lead_service import bulk_delete_leads, bulk_update_status, get_lead_changes, update_lead_status
+from services.project_service import DatabaseProjectRepository
+from services.sync import SyncCursor, record_tombstones
+
+
+@pytest.fixture
+def no_settle(monkeypatch):
+    monkeypatch.setattr("services.sync.SYNC_SETTLE_SECONDS", 0)
+
+
+@pytest.fixture
+def db(sqlite_db, no_settle):
+    with Session(sqlite_db) as session:
+        yield session
+
+
+def _add_leads(db, count):
+    leads = [models.ContactLead(name=f"Lead {i}", email=f"l{i}@example.com", subject="Hi", message="Hello")
+             for i in range(count)]
+    db.add_all(leads)
+    db.commit()
+    return [lead.id for lead in leads]
+
+
+def _sync(db, cursor, limit=100):
+    return get_lead_changes(db, SyncCursor.parse(cursor) if cursor else None, limit)
+
+
+class TestSyncCursor:
+    """SyncCursor.parse / encode"""
+
+    def test_round_trip(self):
+        cursor = SyncCursor(datetime(2026, 1, 2, 3, 4, 5, 678), 42)
+        assert SyncCursor.parse(cursor.encode()) == cursor
+
+    def test_bare_and_aware_timestamps(self):
+        assert SyncCursor.parse("2026-01-02T03:04:05") == SyncCursor(datetime(2026, 1, 2, 3, 4, 5), 0)
+        assert SyncCursor.parse("2026-01-02T05:04:05+02:00").at == datetime(2026, 1, 2, 3, 4, 5)
+
+    @pytest.mark.parametrize("value", ["yesterday", "2026-01-02T03:04:05_x"])
+    def test_malformed(self, value):
+        with pytest.raises(ValueError):
+            SyncCursor.parse(value)
+
+
+class TestLeadChanges:
+    """get_lead_changes"""
+
+    def test_full_sync_then_only_changes(self, db):
+        ids = _add_leads(db, 3)
+        first = _sync(db, None)
+        assert first["reset"] is True and first["has_more"] is False
+        assert [lead["id"] for lead in first["changes"]] == ids
+
+        update_lead_status(db, ids[1], "contacted")
+        second = _sync(db, first["cursor"])
+        assert second["reset"] is False
+        assert [(lead["id"], lead["status"]) for lead in second["changes"]] == [(ids[1], "contacted")]
+        assert second["deleted"] == []
+
+        assert _sync(db, second["cursor"])["changes"] == []
+
+    def test_deletes_are_reported_as_tombstones(self, db):
+        ids = _add_leads(db, 3)
+        cursor = _sync(db, None)["cursor"]
+
+        assert bulk_delete_leads(db, [ids[0], ids[2], 999]) == 2
+        feed = _sync(db, cursor)
+        assert feed["changes"] == []
+        assert [t["id"] for t in feed["deleted"]] == [ids[0], ids[2]]
+
+    def test_pages_through_rows_sharing_a_timestamp(self, db):
+        ids = _add_leads(db, 5)
+        cursor = _sync(db, None)["cursor"]
+        bulk_update_status(db, ids, "archived")  # one statement: one updated_at for all five
+
+        seen, has_more = [], True
+        while has_more:
+            feed = _sync(db, cursor, limit=2)
+            assert len(feed["changes"]) <= 2
+            seen += [lead["id"] for lead in feed["changes"]]
+            cursor, has_more = feed["cursor"], feed["has_more"]
+        assert seen == ids
+
+    def test_recent_changes_wait_for_the_settle_window(self, db, monkeypatch):
+        monkeypatch.setattr("services.sync.SYNC_SETTLE_SECONDS", 60)
+        _add_leads(db, 2)
+        feed = _sync(db, None)
+        assert feed["changes"] == []
+        # The cursor stays behind the held-back rows
+        assert SyncCursor.parse(feed["cursor"]).at < datetime.now(timezone.utc).replace(tzinfo=None)
+        monkeypatch.setattr("services.sync.SYNC_SETTLE_SECONDS", 0)
+        assert len(_sync(db, feed["cursor"])["changes"]) == 2
+
+    def test_cursor_older_than_tombstone_retention_resets(self, db):
+        _add_leads(db, 1)
+        stale = SyncCursor(datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(days=365)).encode()
+        feed = _sync(db, stale)
+        assert feed["reset"] is True
+        assert len(feed["changes"]) == 1
+
+    def test_expired_tombstones_are_pruned(self, db):
+        db.add(models.SyncTombstoneModel(entity="contact_leads", entity_id=1,
+                                         deleted_at=datetime(2000, 1, 1)))
+        db.commit()
+        record_tombstones(db, "contact_leads", [2])
+        db.commit()
+        assert [t.entity_id for t in db.query(models.SyncTombstoneModel)] == [2]
+
+
+class TestChangeEndpoints:
+    """GET /api/admin/leads/changes, GET /api/projects/changes"""
+
+    def test_lead_changes_requires_admin_and_valid_cursor(self, client, auth_header, sqlite_db, no_settle):
+        assert client.get("/api/admin/leads/changes").status_code in (401, 403)
+        assert client.get("/api/admin/leads/changes?since=nope", headers=auth_header).status_code == 400
+
+        resp = client.get("/api/admin/leads/changes", headers=auth_header)
+        assert resp.status_code == 200
+        assert resp.json()["changes"] == []
+
+    def test_project_feed_reports_updates_and_deletes(self, client, sqlite_db, no_settle, monkeypatch):
+        monkeypatch.setattr("services.project_service.SessionLocal", sessionmaker(bind=sqlite_db))
+        repo = DatabaseProjectRepository()
+        payload = {
+            "title": "A", "description": "d", "longDescription": "Long", "image": "/a.png", "type": "Research",
+            "category": "data-science", "role": "Lead", "duration": "1 month",
+            "tags": [], "objectives": [], "technologies": [], "methods": [], "results": [],
+        }
+        keep, gone = repo.create(payload), repo.create({**payload, "title": "B"})
+
+        first = client.get("/api/projects/changes").json()
+        assert [p["id"] for p in first["changes"]] == [keep["id"], gone["id"]]
+        assert first["changes"][0]["longDescription"] == "Long"
+
+        repo.update(keep["id"], {"title": "A2"})
+        repo.delete(gone["id"])
+        feed = client.get("/api/projects/changes", params={"since": first["cursor"]}).json()
+        assert [p["title"] for p in feed["changes"]] == ["A2"]
+        assert [t["id"] for t in feed["deleted"]] == [gone["id"]]
@@ -0,0 +1,59 @@
+"""Crash-safe file writes for the JSON-file stores"""
+import os
+import tempfile
+from pathlib import Path
+
+
+def atomic_write_bytes(path: Path, data: bytes) -> None:
+    """
+    Replace `path` with `data` so readers see either the old or the new file,
+    never a partial one: write a temp file in the same directory, fsync it,
+    rename it over the target, then fsync the directory so the rename itself
+    survives a crash.
+    """
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as tmp:
+            tmp.write(data)
+            tmp.flush()
+            os.fsync(tmp.fileno())
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+    _fsync_dir(path.parent)
+
+
+def durable_append(path: Path, data: bytes) -> int:
+    """
+    Append `data` to `path` and fsync before returning, creating the file
+    (and syncing its directory entry) if needed. Returns the new file size.
+    """
+    created = not path.exists()
+    with open(path, "ab") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+        size = f.tell()
+    if created:
+        _fsync_dir(path.parent)
+    return size
+
+
+def _fsync_dir(directory: Path) -> None:
+    if os.name != "posix":
+        return  # directories cannot be opened for fsync on Windows
+    fd = os.open(directory, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def file_signature(path: Path) -> tuple[int, int, int] | None:
+    """(inode, mtime_ns, size) of `path`, or None if missing; changes on every atomic replace."""
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return None
+    return st.st_ino, st.st_mtime_ns, st.st_size
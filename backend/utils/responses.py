@@ -0,0 +1,43 @@
+"""
+App-wide JSON response class backed by orjson.
+
+orjson serializes datetime/date (ISO 8601, same output as `.isoformat()`),
+`str` enums such as LeadStatus and ProjectCategoryEnum, UUIDs and dataclasses
+natively in C. `_default` covers the remaining types that reach responses:
+Decimal (Numeric columns), sets and Pydantic models.
+"""
+from decimal import Decimal
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+
+def _default(value: Any) -> Any:
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+def dump_json(content: Any) -> bytes:
+    """Encode `content` to JSON bytes with the app-wide encoder."""
+    return orjson.dumps(content, default=_default, option=_OPTIONS)
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    Drop-in JSONResponse using `dump_json`. Set as the app's
+    `default_response_class`; routes that build responses themselves
+    (cached lists, pre-serialized rows) return it directly, which also skips
+    FastAPI's `jsonable_encoder` pass.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return dump_json(content)
@@ -1,4 +1,34 @@
 """Serialization utilities for database models to JSON-compatible dicts"""
+import models
+
+_Lead = models.ContactLead
+
+# Columns selected by list/search/export queries. Selecting these instead of the
+# entity skips ORM identity-map bookkeeping and per-attribute instrumentation.
+CONTACT_LEAD_COLUMNS = (
+    _Lead.id,
+    _Lead.name,
+    _Lead.email,
+    _Lead.subject,
+    _Lead.company,
+    _Lead.role,
+    _Lead.message,
+    _Lead.lead_type,
+    _Lead.created_at,
+    _Lead.updated_at,
+    _Lead.timestamp,
+    _Lead.flagged,
+    _Lead.status,
+    _Lead.priority,
+    _Lead.quality_score,
+    _Lead.internal_notes,
+    _Lead.last_contacted,
+    _Lead.follow_up_date,
+    _Lead.contact_history,
+    _Lead.tags,
+    _Lead.source,
+    _Lead.metadata_json,
+)
 
 
 def serialize_contact_lead(lead):
@@ -30,3 +60,41 @@ def serialize_contact_lead(lead):
         "source": getattr(lead, "source", "contact_form"),
         "metadata": getattr(lead, "metadata_json", {})
     }
+
+
+def serialize_contact_lead_row(row) -> dict:
+    """
+    Convert a CONTACT_LEAD_COLUMNS result tuple to the same dict shape as
+    `serialize_contact_lead`, using positional unpacking instead of getattr.
+    """
+    (
+        id_, name, email, subject, company, role, message, lead_type,
+        created_at, updated_at, timestamp, flagged, status, priority,
+        quality_score, internal_notes, last_contacted, follow_up_date,
+        contact_history, tags, source, metadata,
+    ) = row
+    created = created_at or timestamp
+    return {
+        "id": id_,
+        "name": name,
+        "email": email,
+        "subject": subject,
+        "company": company,
+        "role": role,
+        "message": message,
+        "lead_type": lead_type.value if lead_type is not None else None,
+        "created_at": created.isoformat() if created else None,
+        "updated_at": updated_at.isoformat() if updated_at else None,
+        "timestamp": timestamp.isoformat() if timestamp else None,
+        "flagged": bool(flagged),
+        "status": status.value if status is not None else None,
+        "priority": priority.value if priority is not None else None,
+        "quality_score": float(quality_score or 0.0),
+        "internal_notes": internal_notes,
+        "last_contacted": last_contacted.isoformat() if last_contacted else None,
+        "follow_up_date": follow_up_date.isoformat() if follow_up_date else None,
+        "contact_history": contact_history,
+        "tags": tags,
+        "source": source,
+        "metadata": metadata,
+    }